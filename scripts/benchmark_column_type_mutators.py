@@ -0,0 +1,130 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the value by value ``column_type_mutators`` with the column by column
+``column_type_vectorized_mutators``, for the engine specs which define mutators.
+
+Both paths are measured from the fetch of the rows to the ``SupersetResultSet``
+built from them.
+"""
+
+import random
+import time
+from decimal import Decimal
+from typing import Any
+
+import click
+
+DESCRIPTION = [
+    ("id", "bigint", None, None, None, None, None),
+    ("amount", "decimal(12,2)", None, None, None, None, None),
+    ("name", "varchar(255)", None, None, None, None, None),
+    ("rate", "decimal(10,6)", None, None, None, None, None),
+]
+
+
+class Cursor:
+    """A DB-API cursor over rows generated ahead of time"""
+
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self.rows = rows
+        self.description = DESCRIPTION
+        self.arraysize = 1
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return list(self.rows)
+
+    def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        return self.rows[:size]
+
+
+def generate_rows(num_rows: int) -> list[tuple[Any, ...]]:
+    """
+    Generate rows with decimals returned as strings, the way some drivers do.
+    """
+    rng = random.Random(42)
+    return [
+        (
+            i,
+            f"{rng.randint(-10**8, 10**8) / 100:.2f}",
+            f"name_{rng.randint(0, 10_000)}",
+            None if i % 7 == 0 else f"{rng.random():.6f}",
+        )
+        for i in range(num_rows)
+    ]
+
+
+def run(spec: Any, rows: list[tuple[Any, ...]], vectorized: bool) -> tuple[float, Any]:
+    # pylint: disable=import-outside-toplevel
+    from superset.result_set import SupersetResultSet
+
+    cursor = Cursor(rows)
+    start = time.perf_counter()
+    data = spec.fetch_data_columnar(cursor) if vectorized else None
+    if data is None:
+        data = spec.fetch_data(cursor)
+    result_set = SupersetResultSet(data, DESCRIPTION, spec, columnar=True)  # type: ignore
+    return time.perf_counter() - start, result_set.table.to_pylist()
+
+
+def normalize(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # the scale of the decimals can differ between the two paths
+    return [
+        {
+            key: value.normalize() if isinstance(value, Decimal) else value
+            for key, value in record.items()
+        }
+        for record in records
+    ]
+
+
+@click.command()
+@click.option("--rows", default=500_000, help="Number of rows in the result set.")
+def main(rows: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.db_engine_specs import load_engine_specs
+
+    specs = sorted(
+        {spec for spec in load_engine_specs() if spec.column_type_mutators},
+        key=lambda spec: spec.__name__,
+    )
+    print(f"Generating {rows} rows")
+    data = generate_rows(rows)
+
+    results = []
+    for spec in specs:
+        print(f"Running {spec.__name__}")
+        per_cell, expected = run(spec, data, vectorized=False)
+        vectorized, actual = run(spec, data, vectorized=True)
+        identical = normalize(expected) == normalize(actual)
+        results.append((spec.__name__, per_cell, vectorized, identical))
+
+    print("\nResults:\n")
+    print(
+        f"{'engine spec':<26}{'per cell (s)':>16}{'vectorized (s)':>16}"
+        f"{'identical':>12}"
+    )
+    for name, per_cell, vectorized, identical in results:
+        print(f"{name:<26}{per_cell:>16.2f}{vectorized:>16.2f}{identical!s:>12}")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        main()  # pylint: disable=no-value-for-parameter
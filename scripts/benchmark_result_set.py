@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare wall time and peak RSS of the different ``SupersetResultSet`` ingestion
+paths.
+
+Each path runs in a fresh process, so that the peak RSS of one run does not leak
+into the next one.
+"""
+
+import multiprocessing
+import random
+import resource
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import click
+
+MODES = ("rows", "columnar", "arrow")
+
+
+def generate_rows(num_rows: int) -> list[tuple[Any, ...]]:
+    """
+    Generate rows similar to what a DB-API driver returns for a wide SQL Lab query.
+    """
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        (
+            i,
+            rng.random() * 1000,
+            f"name_{rng.randint(0, 10_000)}",
+            start + timedelta(seconds=i),
+            Decimal(rng.randint(0, 100_000)) / 100,
+            None if i % 7 == 0 else rng.randint(0, 100),
+            rng.choice([True, False]),
+        )
+        for i in range(num_rows)
+    ]
+
+
+DESCRIPTION = [
+    ("id", "BIGINT", None, None, None, None, None),
+    ("value", "DOUBLE", None, None, None, None, None),
+    ("name", "VARCHAR", None, None, None, None, None),
+    ("ts", "TIMESTAMP", None, None, None, None, None),
+    ("amount", "DECIMAL", None, None, None, None, None),
+    ("nullable", "INTEGER", None, None, None, None, None),
+    ("flag", "BOOLEAN", None, None, None, None, None),
+]
+
+
+def max_rss_mb() -> float:
+    # ``ru_maxrss`` is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(mode: str, num_rows: int, queue: "multiprocessing.Queue[Any]") -> None:
+    # pylint: disable=import-outside-toplevel
+    import pyarrow as pa
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    data: Any = generate_rows(num_rows)
+    if mode == "arrow":
+        # simulate a driver with a native columnar fetch
+        data = pa.Table.from_arrays(
+            [pa.array(list(column)) for column in zip(*data)],
+            names=[row[0] for row in DESCRIPTION],
+        )
+
+    baseline = max_rss_mb()
+    start = time.perf_counter()
+    result_set = SupersetResultSet(
+        data,
+        DESCRIPTION,  # type: ignore
+        BaseEngineSpec,
+        columnar=mode == "columnar",
+    )
+    duration = time.perf_counter() - start
+    queue.put((mode, duration, max_rss_mb() - baseline, result_set.size))
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows in the result set.")
+@click.option(
+    "--mode",
+    "modes",
+    type=click.Choice(MODES),
+    multiple=True,
+    default=MODES,
+    help="Ingestion paths to benchmark.",
+)
+def main(rows: int, modes: tuple[str, ...]) -> None:
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for mode in modes:
+        print(f"Building result set with {rows} rows using the `{mode}` path")
+        queue = context.Queue()
+        process = context.Process(target=run, args=(mode, rows, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+
+    print("\nResults:\n")
+    print(f"{'mode':<10}{'wall time (s)':>16}{'peak RSS (MB)':>16}")
+    for mode, duration, peak_rss, _ in results:
+        print(f"{mode:<10}{duration:>16.2f}{peak_rss:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
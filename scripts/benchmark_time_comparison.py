@@ -0,0 +1,179 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the rows scanned by the queries of time comparisons when each time offset
+runs its own query, and when all the time offsets are read by a single query.
+
+The fact table is a SQLite view which counts the rows it reads, so that the number of
+rows scanned is measured rather than estimated.
+"""
+
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import click
+import pandas as pd
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+ROWS_SCANNED = [0]
+
+
+def count_row() -> int:
+    ROWS_SCANNED[0] += 1
+    return 1
+
+
+@event.listens_for(Engine, "connect")
+def register_count_row(dbapi_connection: Any, connection_record: Any) -> None:
+    dbapi_connection.create_function("count_row", 0, count_row)
+
+
+def create_table(path: Path, num_rows: int) -> str:
+    rng = random.Random(42)
+    start = datetime(2023, 1, 1)
+    uri = f"sqlite:///{path}"
+    engine = create_engine(uri)
+    with engine.begin() as connection:
+        connection.execute(
+            "CREATE TABLE raw_events (ds DATETIME, country TEXT, value INTEGER)"
+        )
+        connection.execute(
+            "INSERT INTO raw_events VALUES (?, ?, ?)",
+            [
+                (
+                    start + timedelta(minutes=rng.randint(0, 2 * 365 * 24 * 60)),
+                    rng.choice(["BR", "DE", "FR", "JP", "US"]),
+                    rng.randint(0, 100),
+                )
+                for _ in range(num_rows)
+            ],
+        )
+        connection.execute(
+            "CREATE VIEW events AS SELECT * FROM raw_events WHERE count_row()"
+        )
+    return uri
+
+
+def run(func: Any) -> tuple[float, int, Any]:
+    ROWS_SCANNED[0] = 0
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, ROWS_SCANNED[0], result
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows in the fact table.")
+@click.option(
+    "--offset",
+    "offsets",
+    multiple=True,
+    default=("1 week ago", "1 year ago"),
+    help="Time offsets to compare.",
+)
+def main(rows: int, offsets: tuple[str, ...]) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+    from superset.utils.core import TIME_OFFSET_ALIAS
+    from superset.utils.date_parser import get_past_or_future
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Generating fact table with {rows} rows")
+        uri = create_table(Path(directory) / "events.db", rows)
+        table = SqlaTable(
+            table_name="events",
+            columns=[
+                TableColumn(column_name="ds", type="DATETIME", is_dttm=True),
+                TableColumn(column_name="country", type="TEXT"),
+                TableColumn(column_name="value", type="INTEGER"),
+            ],
+            metrics=[],
+            database=Database(database_name="benchmark", sqlalchemy_uri=uri),
+        )
+
+        to_dttm = datetime(2025, 1, 1)
+        from_dttm = to_dttm - timedelta(days=7)
+        time_offset_ranges = {
+            offset: (
+                get_past_or_future(offset, from_dttm),
+                get_past_or_future(offset, to_dttm),
+            )
+            for offset in offsets
+        }
+        query_obj: dict[str, Any] = {
+            "granularity": "ds",
+            "groupby": ["country"],
+            "metrics": [
+                {"expressionType": "SQL", "sqlExpression": "SUM(value)", "label": "sum"}
+            ],
+            "is_timeseries": False,
+            "filter": [],
+            "orderby": [("country", True)],
+        }
+
+        def query_each() -> dict[str, pd.DataFrame]:
+            return {
+                offset: table.query(
+                    {**query_obj, "from_dttm": start, "to_dttm": end}
+                ).df
+                for offset, (start, end) in time_offset_ranges.items()
+            }
+
+        def query_together() -> dict[str, pd.DataFrame]:
+            df = table.query({**query_obj, "time_offset_ranges": time_offset_ranges}).df
+            return {
+                offset: df[df[TIME_OFFSET_ALIAS] == offset]
+                .drop(columns=TIME_OFFSET_ALIAS)
+                .reset_index(drop=True)
+                for offset in offsets
+            }
+
+        results = {}
+        for label, func, statements in [
+            ("one query per offset", query_each, len(offsets)),
+            ("single query", query_together, 1),
+        ]:
+            print(f"Running {label}")
+            duration, scanned, dfs = run(func)
+            results[label] = (statements, scanned, duration, dfs)
+
+    print("\nResults:\n")
+    print(
+        f"{'strategy':<22}{'statements':>12}{'rows scanned':>16}{'wall time (s)':>16}"
+    )
+    for label, (statements, scanned, duration, _) in results.items():
+        print(f"{label:<22}{statements:>12}{scanned:>16}{duration:>16.2f}")
+
+    each, together = (dfs for *_, dfs in results.values())
+    identical = all(
+        each[offset].to_dict("records") == together[offset].to_dict("records")
+        for offset in offsets
+    )
+    print(f"\nIdentical results: {identical}")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        main()  # pylint: disable=no-value-for-parameter
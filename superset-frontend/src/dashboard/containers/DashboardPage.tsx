@@ -23,11 +23,7 @@ import { t, useTheme } from '@superset-ui/core';
 import { useDispatch, useSelector } from 'react-redux';
 import { useToasts } from 'src/components/MessageToasts/withToasts';
 import Loading from 'src/components/Loading';
-import {
-  useDashboard,
-  useDashboardCharts,
-  useDashboardDatasets,
-} from 'src/hooks/apiResources';
+import { useDashboardBootstrap } from 'src/hooks/apiResources';
 import { hydrateDashboard } from 'src/dashboard/actions/hydrate';
 import { setDatasources } from 'src/dashboard/actions/datasources';
 import injectCustomCss from 'src/dashboard/util/injectCustomCss';
@@ -82,15 +78,14 @@ export const DashboardPage: FC<PageProps> = ({ idOrSlug }: PageProps) => {
       dashboardInfo && Object.keys(dashboardInfo).length > 0,
   );
   const { addDangerToast } = useToasts();
-  const { result: dashboard, error: dashboardApiError } =
-    useDashboard(idOrSlug);
-  const { result: charts, error: chartsApiError } =
-    useDashboardCharts(idOrSlug);
+  const bootstrap = useDashboardBootstrap(idOrSlug);
+  const { result: dashboard, error: dashboardApiError } = bootstrap.dashboard;
+  const { result: charts, error: chartsApiError } = bootstrap.charts;
   const {
     result: datasets,
     error: datasetsApiError,
     status,
-  } = useDashboardDatasets(idOrSlug);
+  } = bootstrap.datasets;
   const isDashboardHydrated = useRef(false);
 
   const error = dashboardApiError || chartsApiError;
@@ -21,18 +21,19 @@ import { Dashboard, Datasource, EmbeddedDashboard } from 'src/dashboard/types';
 import { Chart } from 'src/types/Chart';
 import { useApiV1Resource, useTransformedResource } from './apiResources';
 
+const transformDashboard = (dashboard: Dashboard) => ({
+  ...dashboard,
+  // TODO: load these at the API level
+  metadata:
+    (dashboard.json_metadata && JSON.parse(dashboard.json_metadata)) || {},
+  position_data: dashboard.position_json && JSON.parse(dashboard.position_json),
+  owners: dashboard.owners || [],
+});
+
 export const useDashboard = (idOrSlug: string | number) =>
   useTransformedResource(
     useApiV1Resource<Dashboard>(`/api/v1/dashboard/${idOrSlug}`),
-    dashboard => ({
-      ...dashboard,
-      // TODO: load these at the API level
-      metadata:
-        (dashboard.json_metadata && JSON.parse(dashboard.json_metadata)) || {},
-      position_data:
-        dashboard.position_json && JSON.parse(dashboard.position_json),
-      owners: dashboard.owners || [],
-    }),
+    transformDashboard,
   );
 
 // gets the chart definitions for a dashboard
@@ -45,5 +46,29 @@ export const useDashboardCharts = (idOrSlug: string | number) =>
 export const useDashboardDatasets = (idOrSlug: string | number) =>
   useApiV1Resource<Datasource[]>(`/api/v1/dashboard/${idOrSlug}/datasets`);
 
+type DashboardBootstrap = {
+  dashboard: Dashboard;
+  charts: Chart[];
+  datasets: Datasource[];
+};
+
+const selectDashboard = (bootstrap: DashboardBootstrap) =>
+  transformDashboard(bootstrap.dashboard);
+const selectCharts = (bootstrap: DashboardBootstrap) => bootstrap.charts;
+const selectDatasets = (bootstrap: DashboardBootstrap) => bootstrap.datasets;
+
+// gets the dashboard, its charts and its datasets with a single request,
+// as returned by useDashboard, useDashboardCharts and useDashboardDatasets
+export const useDashboardBootstrap = (idOrSlug: string | number) => {
+  const bootstrap = useApiV1Resource<DashboardBootstrap>(
+    `/api/v1/dashboard/${idOrSlug}/bootstrap`,
+  );
+  return {
+    dashboard: useTransformedResource(bootstrap, selectDashboard),
+    charts: useTransformedResource(bootstrap, selectCharts),
+    datasets: useTransformedResource(bootstrap, selectDatasets),
+  };
+};
+
 export const useEmbeddedDashboard = (idOrSlug: string | number) =>
   useApiV1Resource<EmbeddedDashboard>(`/api/v1/dashboard/${idOrSlug}/embedded`);
@@ -16,7 +16,7 @@
 # under the License.
 import logging
 
-from flask import request, Response
+from flask import current_app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.security.decorators import permission_name, protect
@@ -41,7 +41,8 @@ class AsyncEventsRestApi(BaseSupersetApi):
     def events(self) -> Response:
         """
         Read off of the Redis async events stream, using the user's JWT token and
-        optional query params for last event received.
+        optional query params for last event received. When long polling is enabled
+        the response waits for new events if there are none.
         ---
         get:
           summary: Read off of the Redis events stream
@@ -93,7 +94,11 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            events = async_query_manager.read_events(
+                async_channel_id,
+                last_event_id,
+                block=current_app.config["GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT"],
+            )
 
         except AsyncQueryTokenException:
             return self.response_401()
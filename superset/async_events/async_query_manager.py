@@ -49,10 +49,40 @@ def build_job_metadata(
     }
 
 
-def parse_event(event_data: tuple[str, dict[str, Any]]) -> dict[str, Any]:
+# fields of the events written to the streams, other fields of the job metadata
+# (e.g. the guest token of embedded dashboards) are not needed by the clients
+EVENT_FIELDS = ("channel_id", "job_id", "user_id", "status", "errors", "result_url")
+
+
+def encode_event(event: dict[str, Any], exclude: tuple[str, ...] = ()) -> str:
+    """
+    Encode an event as compact JSON, skipping the fields which are empty, or
+    excluded because the stream the event is written to already implies them.
+    """
+    return json.dumps(
+        {
+            field: event[field]
+            for field in EVENT_FIELDS
+            if field not in exclude and event.get(field) not in (None, [])
+        },
+        separators=(",", ":"),
+    )
+
+
+def parse_event(
+    event_data: tuple[str, dict[str, Any]], channel_id: Optional[str] = None
+) -> dict[str, Any]:
     event_id = event_data[0]
-    event_payload = event_data[1]["data"]
-    return {"id": event_id, **json.loads(event_payload)}
+    event_payload = json.loads(event_data[1]["data"])
+    return {
+        "id": event_id,
+        **build_job_metadata(
+            event_payload.pop("channel_id", channel_id),
+            event_payload.pop("job_id", None),
+            event_payload.pop("user_id", None),
+            **event_payload,
+        ),
+    }
 
 
 def increment_id(redis_id: str) -> str:
@@ -228,12 +258,31 @@ class AsyncQueryManager:
         return job_metadata
 
     def read_events(
-        self, channel: str, last_id: Optional[str]
+        self, channel: str, last_id: Optional[str], block: Optional[int] = None
     ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events of a channel after `last_id`.
+
+        :param channel: The ID of the channel
+        :param last_id: The ID of the last event read, if any
+        :param block: If set, wait up to this many milliseconds for new events when
+            there are none
+        :returns: The events
+        """
         stream_name = f"{self._stream_prefix}{channel}"
-        start_id = increment_id(last_id) if last_id else "-"
-        results = self._redis.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
-        return [] if not results else list(map(parse_event, results))
+        if block:
+            streams = self._redis.xread(
+                {stream_name: last_id or "0-0"},
+                count=self.MAX_EVENT_COUNT,
+                block=block,
+            )
+            results = streams[0][1] if streams else []
+        else:
+            start_id = increment_id(last_id) if last_id else "-"
+            results = self._redis.xrange(
+                stream_name, start_id, "+", self.MAX_EVENT_COUNT
+            )
+        return [parse_event(result, channel) for result in results]
 
     def update_job(
         self, job_metadata: dict[str, Any], status: str, **kwargs: Any
@@ -245,13 +294,27 @@ class AsyncQueryManager:
             raise AsyncQueryJobException("No job ID specified")
 
         updates = {"status": status, **kwargs}
-        event_data = {"data": json.dumps({**job_metadata, **updates})}
+        event = {**job_metadata, **updates}
 
         full_stream_name = f"{self._stream_prefix}full"
         scoped_stream_name = f"{self._stream_prefix}{job_metadata['channel_id']}"
 
         logger.debug("********** logging event data to stream %s", scoped_stream_name)
-        logger.debug(event_data)
-
-        self._redis.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
-        self._redis.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
+        logger.debug(event)
+
+        # the channel of the events of the scoped stream is the one of the stream,
+        # while the firehose stream needs it to dispatch the events
+        pipeline = self._redis.pipeline(transaction=False)
+        pipeline.xadd(
+            scoped_stream_name,
+            {"data": encode_event(event, exclude=("channel_id",))},
+            "*",
+            self._stream_limit,
+        )
+        pipeline.xadd(
+            full_stream_name,
+            {"data": encode_event(event)},
+            "*",
+            self._stream_limit_firehose,
+        )
+        pipeline.execute()
@@ -16,7 +16,7 @@
 # under the License.
 import logging
 
-from flask import request, Response
+from flask import current_app, request, Response
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -26,7 +26,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from superset.cachekeys.schemas import CacheInvalidationRequestSchema
 from superset.connectors.sqla.models import SqlaTable
-from superset.extensions import cache_manager, db, event_logger, stats_logger_manager
+from superset.extensions import db, event_logger, stats_logger_manager
 from superset.models.cache import CacheKey
 from superset.views.base_api import BaseSupersetModelRestApi, statsd_metrics
 
@@ -93,40 +93,18 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
-        cache_key_objs = (
-            db.session.query(CacheKey)
-            .filter(CacheKey.datasource_uid.in_(datasource_uids))
-            .all()
-        )
-        cache_keys = [c.cache_key for c in cache_key_objs]
-        if cache_key_objs:
-            all_keys_deleted = cache_manager.cache.delete_many(*cache_keys)
-
-            if not all_keys_deleted:
-                # expected behavior as keys may expire and cache is not a
-                # persistent storage
-                logger.info(
-                    "Some of the cache keys were not deleted in the list %s", cache_keys
-                )
-
-            try:
-                delete_stmt = CacheKey.__table__.delete().where(  # pylint: disable=no-member
-                    CacheKey.cache_key.in_(cache_keys)
-                )
-
-                db.session.execute(delete_stmt)
-                db.session.commit()  # pylint: disable=consider-using-transaction
+        try:
+            count = current_app.config["CACHE_KEY_INDEX"].invalidate(datasource_uids)
+        except SQLAlchemyError as ex:  # pragma: no cover
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+            logger.error(ex, exc_info=True)
+            return self.response_500(str(ex))
 
-                stats_logger_manager.instance.gauge(
-                    "invalidated_cache", len(cache_keys)
-                )
-                logger.info(
-                    "Invalidated %s cache records for %s datasources",
-                    len(cache_keys),
-                    len(datasource_uids),
-                )
-            except SQLAlchemyError as ex:  # pragma: no cover
-                db.session.rollback()  # pylint: disable=consider-using-transaction
-                logger.error(ex, exc_info=True)
-                return self.response_500(str(ex))
+        if count:
+            stats_logger_manager.instance.gauge("invalidated_cache", count)
+            logger.info(
+                "Invalidated %s cache records for %s datasources",
+                count,
+                len(datasource_uids),
+            )
         return self.response(201)
@@ -0,0 +1,218 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Indexes of the cache keys of each datasource.
+
+When `STORE_CACHE_KEYS_IN_METADATA_DB` is enabled the keys of the cached values of a
+datasource are indexed as they're set, so that `/api/v1/cachekey/invalidate` can
+delete them later on.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+
+from cachelib.redis import RedisCache
+from flask_caching import Cache
+from flask_caching.backends import RedisClusterCache
+
+logger = logging.getLogger(__name__)
+
+
+class CacheKeyIndex(ABC):
+    """Index of the cache keys of each datasource"""
+
+    @abstractmethod
+    def add(
+        self,
+        cache: Cache,
+        cache_key: str,
+        datasource_uid: str,
+        timeout: int,
+    ) -> None:
+        """
+        Add a key to the index of a datasource.
+
+        :param cache: The cache the value was set in
+        :param cache_key: The key of the value
+        :param datasource_uid: The UID of the datasource the value was computed from
+        :param timeout: The timeout of the value, in seconds
+        """
+
+    @abstractmethod
+    def invalidate(self, datasource_uids: set[str]) -> int:
+        """
+        Delete the cached values of datasources, and their index.
+
+        :param datasource_uids: The UIDs of the datasources
+        :returns: The number of keys deleted
+        """
+
+
+class MetadataDBCacheKeyIndex(CacheKeyIndex):
+    """Index of cache keys stored as `CacheKey` rows in the metadata database"""
+
+    def add(
+        self,
+        cache: Cache,
+        cache_key: str,
+        datasource_uid: str,
+        timeout: int,
+    ) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.cache import CacheKey
+
+        db.session.add(
+            CacheKey(
+                cache_key=cache_key,
+                cache_timeout=timeout,
+                datasource_uid=datasource_uid,
+            )
+        )
+
+    def invalidate(self, datasource_uids: set[str]) -> int:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.extensions import cache_manager
+        from superset.models.cache import CacheKey
+
+        cache_keys = [
+            cache_key
+            for (cache_key,) in db.session.query(CacheKey.cache_key).filter(
+                CacheKey.datasource_uid.in_(datasource_uids)
+            )
+        ]
+        if not cache_keys:
+            return 0
+
+        all_keys_deleted = cache_manager.cache.delete_many(*cache_keys)
+        if not all_keys_deleted:
+            logger.info(
+                "Some of the cache keys were not deleted in the list %s", cache_keys
+            )
+
+        delete_stmt = CacheKey.__table__.delete().where(  # pylint: disable=no-member
+            CacheKey.cache_key.in_(cache_keys)
+        )
+        db.session.execute(delete_stmt)
+        db.session.commit()  # pylint: disable=consider-using-transaction
+        return len(cache_keys)
+
+
+class RedisCacheKeyIndex(CacheKeyIndex):
+    """
+    Index of cache keys stored as a Redis set per datasource.
+
+    The set lives next to the keys it indexes, and expires with the last of them, so
+    that the index doesn't grow past the keys that are still cached. Invalidating a
+    datasource only reads the keys of that datasource.
+
+    Keys of caches that aren't stored in Redis are indexed by `fallback`.
+    """
+
+    def __init__(
+        self,
+        fallback: CacheKeyIndex | None = None,
+        batch_size: int = 1000,
+    ) -> None:
+        self.fallback = fallback or MetadataDBCacheKeyIndex()
+        self.batch_size = batch_size
+
+    @staticmethod
+    def get_index_key(backend: RedisCache, datasource_uid: str) -> str:
+        return f"{backend.key_prefix}cache_key_index:{datasource_uid}"
+
+    def add(
+        self,
+        cache: Cache,
+        cache_key: str,
+        datasource_uid: str,
+        timeout: int,
+    ) -> None:
+        backend = cache.cache
+        if not isinstance(backend, RedisCache):
+            self.fallback.add(cache, cache_key, datasource_uid, timeout)
+            return
+
+        index_key = self.get_index_key(backend, datasource_uid)
+        client = backend._write_client  # pylint: disable=protected-access
+        pipeline = client.pipeline(transaction=False)
+        pipeline.ttl(index_key)
+        pipeline.sadd(index_key, backend.key_prefix + cache_key)
+        ttl, _ = pipeline.execute()
+
+        # the index expires with the last of its keys: a TTL of -2 means the index
+        # didn't exist yet, -1 that it doesn't expire, and a timeout of 0 that the
+        # key doesn't expire either
+        if timeout <= 0:
+            if ttl >= 0:
+                client.persist(index_key)
+        elif ttl == -2 or 0 <= ttl < timeout:
+            client.expire(index_key, timeout)
+
+    def invalidate(self, datasource_uids: set[str]) -> int:
+        count = 0
+        for backend in self.get_backends():
+            client = backend._write_client  # pylint: disable=protected-access
+            for datasource_uid in datasource_uids:
+                index_key = self.get_index_key(backend, datasource_uid)
+                for keys in self._batch(client.sscan_iter(index_key)):
+                    self._unlink(backend, keys)
+                    count += len(keys)
+                client.unlink(index_key)
+
+        return count + self.fallback.invalidate(datasource_uids)
+
+    @staticmethod
+    def get_backends() -> list[RedisCache]:
+        """Returns the distinct Redis backends of the caches of chart data"""
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        backends: dict[tuple[int, str], RedisCache] = {}
+        for cache in (cache_manager.cache, cache_manager.data_cache):
+            backend = cache.cache
+            if isinstance(backend, RedisCache):
+                # pylint: disable=protected-access
+                key = (id(backend._write_client), backend.key_prefix)
+                backends.setdefault(key, backend)
+        return list(backends.values())
+
+    def _batch(self, keys: Iterable[bytes]) -> Iterator[list[bytes]]:
+        batch: list[bytes] = []
+        for key in keys:
+            batch.append(key)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _unlink(backend: RedisCache, keys: list[bytes]) -> None:
+        client = backend._write_client  # pylint: disable=protected-access
+        if isinstance(backend, RedisClusterCache):
+            # keys of a cluster can live in different slots
+            pipeline = client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.unlink(key)
+            pipeline.execute()
+        else:
+            client.unlink(*keys)
@@ -20,7 +20,7 @@ import contextlib
 import logging
 from typing import Any, TYPE_CHECKING
 
-from flask import current_app, g, make_response, request, Response
+from flask import g, make_response, request, Response
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
 from marshmallow import ValidationError
@@ -35,6 +35,7 @@ from superset.commands.chart.data.create_async_job_command import (
     CreateAsyncChartDataJobCommand,
 )
 from superset.commands.chart.data.get_data_command import ChartDataCommand
+from superset.commands.chart.data.get_saved_data_command import encode_query_data
 from superset.commands.chart.exceptions import (
     ChartDataCacheLoadError,
     ChartDataQueryFailedError,
@@ -45,7 +46,7 @@ from superset.daos.exceptions import DatasourceNotFound
 from superset.exceptions import QueryObjectValidationError
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
-from superset.utils import json
+from superset.utils import csv, json
 from superset.utils.core import (
     create_zip,
     DatasourceType,
@@ -372,19 +373,18 @@ class ChartDataRestApi(ChartRestApi):
                 # return single query results
                 data = result["queries"][0]["data"]
                 if is_csv_format:
+                    if not isinstance(data, str):
+                        # streamed results are encoded as a whole, not chunk by chunk
+                        data = csv.encode_csv_chunks(data, CsvResponse.charset)
                     return CsvResponse(data, headers=generate_download_headers("csv"))
 
                 return XlsxResponse(data, headers=generate_download_headers("xlsx"))
 
             # return multi-query results bundled as a zip file
-            def _process_data(query_data: Any) -> Any:
-                if result_format == ChartDataResultFormat.CSV:
-                    encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
-                    return query_data.encode(encoding)
-                return query_data
-
             files = {
-                f"query_{idx + 1}.{result_format}": _process_data(query["data"])
+                f"query_{idx + 1}.{result_format}": encode_query_data(
+                    query["data"], result_format
+                )
                 for idx, query in enumerate(result["queries"])
             }
             return Response(
@@ -69,6 +69,52 @@ def sync_tags() -> None:
     add_favorites(metadata)
 
 
+@click.command()
+@with_appcontext
+@click.option("--database_name", "-d", help="Only sync the datasets of this database")
+@click.option("--schema", "-s", help="Only sync the datasets of this schema")
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=int,
+    help="Number of processes syncing schemas in parallel",
+)
+def sync_datasets(
+    database_name: Optional[str], schema: Optional[str], workers: int
+) -> None:
+    """Syncs the columns of physical datasets with their tables"""
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.database.exceptions import DatabaseNotFoundError
+    from superset.commands.dataset.sync import SyncDatasetsMetadataCommand
+
+    try:
+        results = SyncDatasetsMetadataCommand(database_name, schema, workers).run()
+    except DatabaseNotFoundError:
+        click.secho(f"Database {database_name} not found", err=True)
+        sys.exit(1)
+
+    for result in results:
+        if result.error:
+            click.secho(
+                f"{result.table_name}: {result.error} ({result.duration:.2f}s)",
+                fg="red",
+            )
+        else:
+            click.echo(
+                f"{result.table_name}: {len(result.metadata.added)} added, "
+                f"{len(result.metadata.removed)} removed, "
+                f"{len(result.metadata.modified)} modified "
+                f"({result.duration:.2f}s)"
+            )
+
+    failed = len([result for result in results if result.error])
+    click.secho(
+        f"Synced {len(results) - failed} datasets, {failed} failed",
+        fg="red" if failed else "green",
+    )
+
+
 @click.command()
 @with_appcontext
 def update_api_docs() -> None:
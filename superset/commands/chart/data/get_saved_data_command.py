@@ -0,0 +1,145 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app
+from flask_babel import gettext as _
+from marshmallow import ValidationError
+
+from superset import security_manager
+from superset.charts.post_processing import apply_post_process
+from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_data_command import ChartDataCommand
+from superset.commands.chart.exceptions import (
+    ChartAccessDeniedError,
+    ChartDataQueryFailedError,
+    ChartInvalidError,
+)
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.utils import json
+from superset.utils.core import create_zip
+
+if TYPE_CHECKING:
+    from superset.models.slice import Slice
+
+logger = logging.getLogger(__name__)
+
+
+class GetSavedChartDataCommand(BaseCommand):
+    """
+    Run the query context saved with a chart as the current user, the way
+    `GET /api/v1/chart/<pk>/data/` does, but in process.
+
+    Results are read from and written to the data cache, and are post-processed so
+    that they match the data presented in the chart.
+    """
+
+    _command: ChartDataCommand
+
+    def __init__(
+        self,
+        chart: Slice,
+        result_format: ChartDataResultFormat,
+        result_type: ChartDataResultType = ChartDataResultType.POST_PROCESSED,
+        force: bool = False,
+    ) -> None:
+        self._chart = chart
+        self._result_format = result_format
+        self._result_type = result_type
+        self._force = force
+
+    def run(self) -> dict[str, Any]:
+        self.validate()
+        result = self._command.run()
+        if self._result_type == ChartDataResultType.POST_PROCESSED:
+            try:
+                form_data = json.loads(self._chart.params)
+            except (TypeError, json.JSONDecodeError):
+                form_data = {}
+            result = apply_post_process(
+                result, form_data, result["query_context"].datasource
+            )
+        return result
+
+    def validate(self) -> None:
+        try:
+            json_body = json.loads(self._chart.query_context)
+        except (TypeError, json.JSONDecodeError):
+            json_body = None
+        if json_body is None:
+            raise ChartDataQueryFailedError(
+                _("Chart has no query context saved. Please save the chart again.")
+            )
+
+        # override saved query context
+        json_body["result_format"] = self._result_format
+        json_body["result_type"] = self._result_type
+        json_body["force"] = self._force
+
+        try:
+            query_context = ChartDataQueryContextSchema().load(json_body)
+        except (KeyError, ValidationError) as ex:
+            raise ChartInvalidError() from ex
+
+        self._command = ChartDataCommand(query_context)
+        self._command.validate()
+
+        # exporting files requires the same permission as in the API
+        if self._result_format in ChartDataResultFormat.table_like() and (
+            not security_manager.can_access("can_csv", "Superset")
+        ):
+            raise ChartAccessDeniedError()
+
+
+def encode_query_data(data: Any, result_format: ChartDataResultFormat) -> bytes:
+    """
+    Encode the CSV or Excel data of a query, joining it when it's streamed as chunks.
+    """
+    if result_format == ChartDataResultFormat.CSV:
+        if not isinstance(data, str):
+            # streamed results are returned as chunks
+            data = "".join(data)
+        encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
+        return data.encode(encoding)
+    if not isinstance(data, bytes):
+        data = b"".join(data)
+    return data
+
+
+def get_file_data(result: dict[str, Any]) -> bytes | None:
+    """
+    Return the CSV or Excel file of the results of a `GetSavedChartDataCommand`, or a
+    zip file bundling the files of each query when the chart has several.
+    """
+    result_format = result["query_context"].result_format
+    if not result["queries"]:
+        return None
+
+    if len(result["queries"]) == 1:
+        return encode_query_data(result["queries"][0]["data"], result_format)
+
+    files = {
+        f"query_{idx + 1}.{result_format}": encode_query_data(
+            query["data"], result_format
+        )
+        for idx, query in enumerate(result["queries"])
+    }
+    return create_zip(files).getvalue()
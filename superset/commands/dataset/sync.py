@@ -0,0 +1,313 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.engine import Row
+
+from superset.commands.base import BaseCommand
+from superset.commands.database.exceptions import DatabaseNotFoundError
+from superset.connectors.sqla.models import MetadataResult, SqlaTable, TableColumn
+from superset.connectors.sqla.utils import (
+    get_physical_table_metadata,
+    process_physical_table_columns,
+)
+from superset.extensions import db
+from superset.models.core import Database
+from superset.sql_parse import Table
+from superset.superset_typing import ResultSetColumnType
+from superset.utils.concurrency import run_in_processes
+from superset.utils.core import GenericDataType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DatasetSyncResult:
+    dataset_id: int
+    table_name: str
+    duration: float = 0
+    metadata: MetadataResult = field(default_factory=MetadataResult)
+    error: Optional[str] = None
+
+
+class SyncDatasetsMetadataCommand(BaseCommand):
+    """
+    Sync the columns of many physical datasets with their tables.
+
+    Datasets are synced by schema: the columns of all the tables of a schema are read
+    with a single query when the engine spec supports it, the changes of each dataset
+    are computed on sets and written with bulk statements, in a transaction per
+    dataset. Schemas are synced in parallel by up to `workers` processes.
+
+    Unlike `SqlaTable.fetch_metadata`, metrics are left untouched and
+    `SQLA_TABLE_MUTATOR` isn't applied.
+    """
+
+    def __init__(
+        self,
+        database_name: Optional[str] = None,
+        schema: Optional[str] = None,
+        workers: int = 1,
+    ):
+        self._database_name = database_name
+        self._schema = schema
+        self._workers = workers
+        self._database: Optional[Database] = None
+
+    def run(self) -> list[DatasetSyncResult]:
+        self.validate()
+        results = run_in_processes(sync_schema, self._get_schemas(), self._workers)
+        return [result for schema_results in results for result in schema_results]
+
+    def validate(self) -> None:
+        if self._database_name is not None:
+            self._database = (
+                db.session.query(Database)
+                .filter_by(database_name=self._database_name)
+                .one_or_none()
+            )
+            if not self._database:
+                raise DatabaseNotFoundError()
+
+    def _get_schemas(
+        self,
+    ) -> list[tuple[int, Optional[str], Optional[str], list[int]]]:
+        query = db.session.query(
+            SqlaTable.id,
+            SqlaTable.database_id,
+            SqlaTable.catalog,
+            SqlaTable.schema,
+        ).filter(or_(SqlaTable.sql.is_(None), SqlaTable.sql == ""))
+        if self._database:
+            query = query.filter(SqlaTable.database_id == self._database.id)
+        if self._schema:
+            query = query.filter(SqlaTable.schema == self._schema)
+
+        schemas: dict[tuple[int, Optional[str], Optional[str]], list[int]] = (
+            defaultdict(list)
+        )
+        for dataset_id, database_id, catalog, schema in query:
+            schemas[(database_id, catalog, schema or None)].append(dataset_id)
+        return [(*schema, dataset_ids) for schema, dataset_ids in schemas.items()]
+
+
+def sync_schema(
+    database_id: int,
+    catalog: Optional[str],
+    schema: Optional[str],
+    dataset_ids: list[int],
+) -> list[DatasetSyncResult]:
+    """
+    Sync the columns of datasets of a schema with their tables.
+
+    :param database_id: The ID of the database of the schema
+    :param catalog: The catalog of the schema
+    :param schema: The schema
+    :param dataset_ids: The IDs of the datasets to sync
+    :returns: The result of the sync of each dataset
+    """
+    database = db.session.query(Database).get(database_id)
+    datasets = (
+        db.session.query(
+            SqlaTable.id,
+            SqlaTable.table_name,
+            SqlaTable.normalize_columns,
+            SqlaTable.main_dttm_col,
+        )
+        .filter(SqlaTable.id.in_(dataset_ids))
+        .order_by(SqlaTable.table_name)
+        .all()
+    )
+    old_columns: dict[int, list[Row]] = defaultdict(list)
+    for column in (
+        db.session.query(
+            TableColumn.id,
+            TableColumn.table_id,
+            TableColumn.column_name,
+            TableColumn.type,
+            TableColumn.expression,
+            TableColumn.is_dttm,
+            TableColumn.groupby,
+            TableColumn.filterable,
+        )
+        .filter(TableColumn.table_id.in_(dataset_ids))
+        .order_by(TableColumn.id)
+    ):
+        old_columns[column.table_id].append(column)
+
+    try:
+        schema_columns = database.get_schema_columns(catalog, schema)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Could not read the columns of %s", schema, exc_info=True)
+        schema_columns = None
+
+    results = []
+    for dataset in datasets:
+        start = time.perf_counter()
+        result = DatasetSyncResult(dataset.id, dataset.table_name)
+        try:
+            # tables missing from the schema columns, e.g. because of the case of
+            # their name, are read on their own
+            if schema_columns is not None and dataset.table_name in schema_columns:
+                new_columns = process_physical_table_columns(
+                    database,
+                    schema_columns[dataset.table_name],
+                    dataset.normalize_columns,
+                )
+            else:
+                new_columns = get_physical_table_metadata(
+                    database,
+                    Table(dataset.table_name, schema, catalog),
+                    dataset.normalize_columns,
+                )
+            result.metadata = sync_columns(
+                database,
+                dataset,
+                new_columns,
+                old_columns[dataset.id],
+            )
+            db.session.commit()  # pylint: disable=consider-using-transaction
+        except Exception as ex:  # pylint: disable=broad-except
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+            logger.warning("Could not sync dataset %s", dataset.id, exc_info=True)
+            result.error = str(ex)
+        result.duration = time.perf_counter() - start
+        results.append(result)
+
+    return results
+
+
+def sync_columns(  # pylint: disable=too-many-locals
+    database: Database,
+    dataset: Any,
+    new_columns: list[ResultSetColumnType],
+    old_columns: list[Any],
+) -> MetadataResult:
+    """
+    Write the changes between the columns of a table and the ones of its dataset.
+
+    Columns are changed the way `SqlaTable.fetch_metadata` changes them, with bulk
+    statements rather than through the ORM.
+
+    :param database: The database of the dataset
+    :param dataset: The dataset, with its `id` and `main_dttm_col`
+    :param new_columns: The columns of the table
+    :param old_columns: The columns of the dataset
+    :returns: The names of the added, removed and modified columns
+    """
+    db_engine_spec = database.db_engine_spec
+    db_extra = database.get_extra()
+
+    def is_temporal(type_: str) -> bool:
+        column_spec = db_engine_spec.get_column_spec(type_, db_extra=db_extra)
+        return bool(
+            column_spec and column_spec.generic_type == GenericDataType.TEMPORAL
+        )
+
+    old_columns_by_name = {col.column_name: col for col in old_columns}
+    new_column_names = {col["column_name"] for col in new_columns}
+    results = MetadataResult(
+        removed=[col for col in old_columns_by_name if col not in new_column_names]
+    )
+
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    any_date_col = None
+    for col in new_columns:
+        old_column = old_columns_by_name.get(col["column_name"])
+        if not old_column:
+            results.added.append(col["column_name"])
+            new_column = TableColumn(
+                column_name=col["column_name"],
+                type=col["type"],
+                is_dttm=is_temporal(col["type"]),
+            )
+            db_engine_spec.alter_new_orm_column(new_column)
+            inserts.append(
+                {
+                    "table_id": dataset.id,
+                    "column_name": new_column.column_name,
+                    "type": new_column.type,
+                    "is_dttm": new_column.is_dttm,
+                    "python_date_format": new_column.python_date_format,
+                    "groupby": True,
+                    "filterable": True,
+                }
+            )
+            is_dttm = new_column.is_dttm
+        else:
+            if old_column.type != col["type"]:
+                results.modified.append(col["column_name"])
+            if (
+                old_column.type != col["type"]
+                or old_column.expression
+                or not old_column.groupby
+                or not old_column.filterable
+            ):
+                updates.append(
+                    {
+                        "id": old_column.id,
+                        "type": col["type"],
+                        "expression": "",
+                        "groupby": True,
+                        "filterable": True,
+                    }
+                )
+            is_dttm = (
+                old_column.is_dttm
+                if old_column.is_dttm is not None
+                else is_temporal(col["type"])
+            )
+        if not any_date_col and is_dttm:
+            any_date_col = col["column_name"]
+
+    # calculated columns are kept
+    deletes = [
+        col.id
+        for name, col in old_columns_by_name.items()
+        if name not in new_column_names and not col.expression
+    ]
+
+    if inserts:
+        db.session.bulk_insert_mappings(TableColumn, inserts)
+    if updates:
+        db.session.bulk_update_mappings(TableColumn, updates)
+    if deletes:
+        db.session.execute(
+            TableColumn.__table__.delete().where(  # pylint: disable=no-member
+                TableColumn.id.in_(deletes)
+            )
+        )
+
+    values = {}
+    if not dataset.main_dttm_col and any_date_col:
+        values["main_dttm_col"] = any_date_col
+    if inserts or updates or deletes or values:
+        # also updates `changed_on`, which busts the cache of the charts of the
+        # dataset, like updating a column through the ORM does
+        db.session.execute(
+            update(SqlaTable).where(SqlaTable.id == dataset.id).values(**values)
+        )
+
+    return results
@@ -21,9 +21,14 @@ from uuid import UUID
 
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
+from flask_appbuilder.security.sqla.models import User
 
 from superset import app, db, security_manager
 from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_saved_data_command import (
+    get_file_data,
+    GetSavedChartDataCommand,
+)
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
 from superset.commands.exceptions import CommandException, UpdateFailedError
 from superset.commands.report.alert import AlertCommand
@@ -72,7 +77,11 @@ from superset.reports.notifications.exceptions import (
 from superset.tasks.utils import get_executor
 from superset.utils import json
 from superset.utils.core import HeaderDataType, override_user
-from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
+from superset.utils.csv import (
+    get_chart_csv_data,
+    get_chart_dataframe,
+    get_query_dataframe,
+)
 from superset.utils.decorators import logs_context, transaction
 from superset.utils.pdf import build_pdf_from_screenshots
 from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
@@ -283,21 +292,28 @@ class BaseReportState:
         return pdf
 
     def _get_csv_data(self) -> bytes:
-        url = self._get_url(result_format=ChartDataResultFormat.CSV)
         _, username = get_executor(
             executor_types=app.config["ALERT_REPORTS_EXECUTE_AS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
+            if app.config["ALERT_REPORTS_IN_PROCESS_DATA"]:
+                csv_data = get_file_data(
+                    self._get_chart_data(ChartDataResultFormat.CSV, user)
+                )
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.CSV)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleCsvTimeout() from ex
         except Exception as ex:
@@ -312,21 +328,31 @@ class BaseReportState:
         """
         Return data as a Pandas dataframe, to embed in notifications as a table.
         """
-        url = self._get_url(result_format=ChartDataResultFormat.JSON)
         _, username = get_executor(
             executor_types=app.config["ALERT_REPORTS_EXECUTE_AS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            if app.config["ALERT_REPORTS_IN_PROCESS_DATA"]:
+                result = self._get_chart_data(ChartDataResultFormat.JSON, user)
+                dataframe = (
+                    get_query_dataframe(result["queries"][0])
+                    if result["queries"]
+                    else None
+                )
+            else:
+                url = self._get_url(result_format=ChartDataResultFormat.JSON)
+                auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(
+                    user
+                )
+                logger.info("Getting chart from %s as user %s", url, user.username)
+                dataframe = get_chart_dataframe(url, auth_cookies)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleDataFrameTimeout() from ex
         except Exception as ex:
@@ -337,6 +363,24 @@ class BaseReportState:
             raise ReportScheduleCsvFailedError()
         return dataframe
 
+    def _get_chart_data(
+        self, result_format: ChartDataResultFormat, user: User
+    ) -> dict[str, Any]:
+        """
+        Run the query context saved with the chart in process, as the executor of
+        the report, rather than requesting its data from the chart data API.
+        """
+        chart = self._report_schedule.chart
+        # the query context may just have been saved by taking a screenshot
+        db.session.refresh(chart)
+        logger.info("Getting chart %s data as user %s", chart.id, user.username)
+        with override_user(user):
+            return GetSavedChartDataCommand(
+                chart,
+                result_format,
+                force=self._report_schedule.force_screenshot,
+            ).run()
+
     def _update_query_context(self) -> None:
         """
         Update chart query context.
@@ -28,8 +28,9 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
 from superset.sql_parse import ParsedQuery
+from superset.sqllab import results_codec
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.utils import core as utils, csv
+from superset.utils import csv
 from superset.views.utils import _deserialize_results_payload
 
 config = app.config
@@ -94,7 +95,7 @@ class SqlResultExportCommand(BaseCommand):
             blob = results_backend.get(self._query.results_key)
         if blob:
             logger.info("Decompressing")
-            payload = utils.zlib_decompress(
+            payload = results_codec.decompress(
                 blob, decode=not results_backend_use_msgpack
             )
             obj = _deserialize_results_payload(
@@ -26,8 +26,8 @@ from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
+from superset.sqllab import results_codec
 from superset.sqllab.utils import apply_display_max_row_configuration_if_require
-from superset.utils import core as utils
 from superset.utils.dates import now_as_float
 from superset.views.utils import _deserialize_results_payload
 
@@ -41,6 +41,8 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _offset: int
+    _limit: int | None
     _blob: Any
     _query: Query
 
@@ -48,9 +50,13 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._offset = offset
+        self._limit = limit
 
     def validate(self) -> None:
         if not results_backend:
@@ -103,12 +109,21 @@ class SqlExecutionResultsCommand(BaseCommand):
     ) -> dict[str, Any]:
         """Runs arbitrary sql and returns data as json"""
         self.validate()
-        payload = utils.zlib_decompress(
+        payload = results_codec.decompress(
             self._blob, decode=not results_backend_use_msgpack
         )
+        limit = self._limit
+        if self._rows:
+            # rows past the display limit are never returned
+            remaining = max(self._rows - self._offset, 0)
+            limit = remaining if limit is None else min(limit, remaining)
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                offset=self._offset,
+                limit=limit,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from typing import Any, ClassVar, TYPE_CHECKING
 
 import pandas as pd
@@ -90,7 +91,7 @@ class QueryContext:
         self,
         df: pd.DataFrame,
         coltypes: list[GenericDataType],
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | bytes | Iterator[str] | Iterator[bytes] | list[dict[str, Any]]:
         return self._processor.get_data(df, coltypes)
 
     def get_payload(
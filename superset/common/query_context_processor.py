@@ -14,11 +14,15 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+# pylint: disable=too-many-lines
 from __future__ import annotations
 
 import copy
 import logging
 import re
+from collections.abc import Iterator
+from datetime import datetime
+from functools import partial
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
@@ -27,16 +31,17 @@ from flask_babel import gettext as _
 from pandas import DateOffset
 
 from superset import app
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
 from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.single_flight import single_flight
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
 )
-from superset.connectors.sqla.models import BaseDatasource
+from superset.connectors.sqla.models import BaseDatasource, SqlaTable
 from superset.constants import CacheRegion, TimeGrain
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
@@ -50,6 +55,7 @@ from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import attach_to_thread_session, run_concurrently
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -61,9 +67,11 @@ from superset.utils.core import (
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_user_id,
     get_x_axis_label,
     normalize_dttm_col,
     TIME_COMPARISON,
+    TIME_OFFSET_ALIAS,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
 from superset.utils.pandas_postprocessing.utils import unescape_separator
@@ -138,37 +146,13 @@ class QueryContextProcessor:
         )
 
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
-                        )
-                    )
-
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+            with single_flight(cache_key, CacheRegion.DATA) as coalesced_cache:
+                if coalesced_cache is not None:
+                    cache = coalesced_cache
+                else:
+                    self._load_query_result(cache, cache_key, query_obj, force_query)
+        elif cache_key and cache.is_stale:
+            self._refresh_stale_query_result(cache_key)
 
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -192,6 +176,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": cache.is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -202,6 +187,72 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def _load_query_result(
+        self,
+        cache: QueryCacheManager,
+        cache_key: str,
+        query_obj: QueryObject,
+        force_query: bool,
+    ) -> None:
+        """Runs the query and stores its result in the cache"""
+        try:
+            if invalid_columns := [
+                col
+                for col in get_column_names_from_columns(query_obj.columns)
+                + get_column_names_from_metrics(query_obj.metrics or [])
+                if (col not in self._qc_datasource.column_names and col != DTTM_ALIAS)
+            ]:
+                raise QueryObjectValidationError(
+                    _(
+                        "Columns missing in dataset: %(invalid_columns)s",
+                        invalid_columns=invalid_columns,
+                    )
+                )
+
+            query_result = self.get_query_result(query_obj)
+            annotation_data = self.get_annotation_data(query_obj)
+            cache.set_query_result(
+                key=cache_key,
+                query_result=query_result,
+                annotation_data=annotation_data,
+                force_query=force_query,
+                timeout=self.get_cache_timeout(),
+                datasource_uid=self._qc_datasource.uid,
+                region=CacheRegion.DATA,
+            )
+        except QueryObjectValidationError as ex:
+            cache.error_message = str(ex)
+            cache.status = QueryStatus.FAILED
+
+    def _refresh_stale_query_result(self, cache_key: str) -> None:
+        """Enqueues a refresh of the query context in the background"""
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import load_chart_data_into_cache
+
+        if not QueryCacheManager.start_refresh(cache_key, region=CacheRegion.DATA):
+            return
+
+        logger.debug("Refreshing stale query result with cache key %s", cache_key)
+        job_metadata: dict[str, Any] = {"user_id": get_user_id(), "refresh": True}
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            job_metadata["guest_token"] = guest_user.guest_token
+        try:
+            load_chart_data_into_cache.delay(
+                job_metadata,
+                {
+                    "form_data": self._query_context.form_data,
+                    **self._query_context.cache_values,
+                    "custom_cache_timeout": self._query_context.custom_cache_timeout,
+                    "force": True,
+                },
+            )
+        except Exception:  # pylint: disable=broad-except
+            # the stale result is still served, and the next request retries
+            logger.exception(
+                "Failed to enqueue the refresh of stale query result %s", cache_key
+            )
+            QueryCacheManager.cancel_refresh(cache_key, region=CacheRegion.DATA)
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -369,18 +420,12 @@ class QueryContextProcessor:
                 axis=1,
             )
 
-    def processing_time_offsets(  # pylint: disable=too-many-locals,too-many-statements
+    def processing_time_offsets(  # pylint: disable=too-many-locals
         self,
         df: pd.DataFrame,
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
-        queries: list[str] = []
-        cache_keys: list[str | None] = []
-        offset_dfs: dict[str, pd.DataFrame] = {}
-
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
             raise QueryObjectValidationError(
@@ -397,62 +442,15 @@ class QueryContextProcessor:
         # use columns that are not metrics as join keys
         join_keys = [col for col in df.columns if col not in metric_names]
 
+        offset_dfs: dict[str, pd.DataFrame] = {}
+        queries: dict[str, str] = {}
+        cache_keys: dict[str, str | None] = {}
+        uncached_query_objects: dict[str, QueryObject] = {}
+        uncached_cache_keys: dict[str, str] = {}
         for offset in query_object.time_offsets:
-            try:
-                # pylint: disable=line-too-long
-                # Since the x-axis is also a column name for the time filter, x_axis_label will be set as granularity
-                # these query object are equivalent:
-                # 1) { granularity: 'dttm_col', time_range: '2020 : 2021', time_offsets: ['1 year ago']}
-                # 2) { columns: [
-                #        {label: 'dttm_col', sqlExpression: 'dttm_col', "columnType": "BASE_AXIS" }
-                #      ],
-                #      time_offsets: ['1 year ago'],
-                #      filters: [{col: 'dttm_col', op: 'TEMPORAL_RANGE', val: '2020 : 2021'}],
-                #    }
-                query_object_clone.from_dttm = get_past_or_future(
-                    offset,
-                    outer_from_dttm,
-                )
-                query_object_clone.to_dttm = get_past_or_future(offset, outer_to_dttm)
-
-                x_axis_label = get_x_axis_label(query_object.columns)
-                query_object_clone.granularity = (
-                    query_object_clone.granularity or x_axis_label
-                )
-            except ValueError as ex:
-                raise QueryObjectValidationError(str(ex)) from ex
-            # make sure subquery use main query where clause
-            query_object_clone.inner_from_dttm = outer_from_dttm
-            query_object_clone.inner_to_dttm = outer_to_dttm
-            query_object_clone.time_offsets = []
-            query_object_clone.post_processing = []
-            # Get time offset index
-            index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
-            # The comparison is not using a temporal column so we need to modify
-            # the temporal filter so we run the query with the correct time range
-            if not dataframe_utils.is_datetime_series(df.get(index)):
-                # Lets find the first temporal filter in the filters array and change
-                # its val to be the result of get_since_until with the offset
-                for flt in query_object_clone.filter:
-                    if flt.get(
-                        "op"
-                    ) == FilterOperator.TEMPORAL_RANGE.value and isinstance(
-                        flt.get("val"), str
-                    ):
-                        time_range = cast(str, flt.get("val"))
-                        (
-                            new_outer_from_dttm,
-                            new_outer_to_dttm,
-                        ) = get_since_until_from_time_range(
-                            time_range=time_range,
-                            time_shift=offset,
-                        )
-                        flt["val"] = f"{new_outer_from_dttm} : {new_outer_to_dttm}"
-            query_object_clone.filter = [
-                flt
-                for flt in query_object_clone.filter
-                if flt.get("col") != x_axis_label
-            ]
+            query_object_clone = self._get_time_offset_query_object(
+                df, query_object, offset, outer_from_dttm, outer_to_dttm
+            )
 
             # `offset` is added to the hash function
             cache_key = self.query_cache_key(
@@ -464,33 +462,19 @@ class QueryContextProcessor:
             # whether hit on the cache
             if cache.is_loaded:
                 offset_dfs[offset] = cache.df
-                queries.append(cache.query)
-                cache_keys.append(cache_key)
-                continue
+                queries[offset] = cache.query
+                cache_keys[offset] = cache_key
+            else:
+                uncached_query_objects[offset] = query_object_clone
+                uncached_cache_keys[offset] = cache_key
 
-            query_object_clone_dct = query_object_clone.to_dict()
+        results = self._query_time_offsets(df, query_object, uncached_query_objects)
+        for offset, (offset_metrics_df, query) in results.items():
             # rename metrics: SUM(value) => SUM(value) 1 year ago
             metrics_mapping = {
                 metric: TIME_COMPARISON.join([metric, offset])
                 for metric in metric_names
             }
-
-            # When the original query has limit or offset we wont apply those
-            # to the subquery so we prevent data inconsistency due to missing records
-            # in the dataframes when performing the join
-            if query_object.row_limit or query_object.row_offset:
-                query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
-                query_object_clone_dct["row_offset"] = 0
-
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
-            queries.append(result.query)
-            cache_keys.append(None)
-
-            offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
                     {
@@ -501,7 +485,7 @@ class QueryContextProcessor:
             else:
                 # 1. normalize df, set dttm column
                 offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
+                    offset_metrics_df, uncached_query_objects[offset]
                 )
 
                 # 2. rename extra query columns
@@ -510,26 +494,242 @@ class QueryContextProcessor:
             # cache df and query
             value = {
                 "df": offset_metrics_df,
-                "query": result.query,
+                "query": query,
             }
-            cache.set(
-                key=cache_key,
+            QueryCacheManager.set(
+                key=uncached_cache_keys[offset],
                 value=value,
                 timeout=self.get_cache_timeout(),
                 datasource_uid=query_context.datasource.uid,
                 region=CacheRegion.DATA,
             )
             offset_dfs[offset] = offset_metrics_df
+            queries[offset] = query
+            cache_keys[offset] = None
 
         if offset_dfs:
             df = self.join_offset_dfs(
                 df,
-                offset_dfs,
+                {offset: offset_dfs[offset] for offset in query_object.time_offsets},
                 time_grain,
                 join_keys,
             )
 
-        return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
+        return CachedTimeOffset(
+            df=df,
+            # several time offsets can share a query
+            queries=list(
+                dict.fromkeys(queries[offset] for offset in query_object.time_offsets)
+            ),
+            cache_keys=[cache_keys[offset] for offset in query_object.time_offsets],
+        )
+
+    def _get_time_offset_query_object(  # pylint: disable=too-many-arguments
+        self,
+        df: pd.DataFrame,
+        query_object: QueryObject,
+        offset: str,
+        outer_from_dttm: datetime,
+        outer_to_dttm: datetime,
+    ) -> QueryObject:
+        """
+        Returns the query object of a time offset
+        """
+        # ensure query_object is immutable
+        query_object_clone = copy.copy(query_object)
+        query_object_clone.filter = copy.deepcopy(query_object.filter)
+
+        try:
+            # pylint: disable=line-too-long
+            # Since the x-axis is also a column name for the time filter, x_axis_label will be set as granularity
+            # these query object are equivalent:
+            # 1) { granularity: 'dttm_col', time_range: '2020 : 2021', time_offsets: ['1 year ago']}
+            # 2) { columns: [
+            #        {label: 'dttm_col', sqlExpression: 'dttm_col', "columnType": "BASE_AXIS" }
+            #      ],
+            #      time_offsets: ['1 year ago'],
+            #      filters: [{col: 'dttm_col', op: 'TEMPORAL_RANGE', val: '2020 : 2021'}],
+            #    }
+            query_object_clone.from_dttm = get_past_or_future(
+                offset,
+                outer_from_dttm,
+            )
+            query_object_clone.to_dttm = get_past_or_future(offset, outer_to_dttm)
+
+            x_axis_label = get_x_axis_label(query_object.columns)
+            query_object_clone.granularity = (
+                query_object_clone.granularity or x_axis_label
+            )
+        except ValueError as ex:
+            raise QueryObjectValidationError(str(ex)) from ex
+        # make sure subquery use main query where clause
+        query_object_clone.inner_from_dttm = outer_from_dttm
+        query_object_clone.inner_to_dttm = outer_to_dttm
+        query_object_clone.time_offsets = []
+        query_object_clone.post_processing = []
+        # The comparison is not using a temporal column so we need to modify
+        # the temporal filter so we run the query with the correct time range
+        if not self._is_temporal_comparison(df, query_object):
+            # Lets find the first temporal filter in the filters array and change
+            # its val to be the result of get_since_until with the offset
+            for flt in query_object_clone.filter:
+                if flt.get("op") == FilterOperator.TEMPORAL_RANGE.value and isinstance(
+                    flt.get("val"), str
+                ):
+                    time_range = cast(str, flt.get("val"))
+                    (
+                        new_outer_from_dttm,
+                        new_outer_to_dttm,
+                    ) = get_since_until_from_time_range(
+                        time_range=time_range,
+                        time_shift=offset,
+                    )
+                    flt["val"] = f"{new_outer_from_dttm} : {new_outer_to_dttm}"
+        query_object_clone.filter = [
+            flt for flt in query_object_clone.filter if flt.get("col") != x_axis_label
+        ]
+        return query_object_clone
+
+    @staticmethod
+    def _is_temporal_comparison(df: pd.DataFrame, query_object: QueryObject) -> bool:
+        """Whether the time offsets are compared on a temporal column"""
+        # Get time offset index
+        index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+        return dataframe_utils.is_datetime_series(df.get(index))
+
+    @staticmethod
+    def _get_time_offset_query_dict(
+        query_object: QueryObject,
+        query_object_clone: QueryObject,
+    ) -> dict[str, Any]:
+        query_object_clone_dct = query_object_clone.to_dict()
+
+        # When the original query has limit or offset we wont apply those
+        # to the subquery so we prevent data inconsistency due to missing records
+        # in the dataframes when performing the join
+        if query_object.row_limit or query_object.row_offset:
+            query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
+            query_object_clone_dct["row_offset"] = 0
+
+        return query_object_clone_dct
+
+    def _query_time_offsets(
+        self,
+        df: pd.DataFrame,
+        query_object: QueryObject,
+        query_objects: dict[str, QueryObject],
+    ) -> dict[str, tuple[pd.DataFrame, str]]:
+        """
+        Returns the dataframe and the query of each time offset.
+
+        When the datasource supports it, all the time offsets are read by a single
+        query over the union of their time ranges, instead of one query each.
+        """
+        if len(query_objects) > 1 and self._can_combine_time_offsets(df, query_object):
+            results = self._query_time_offsets_together(query_object, query_objects)
+            if results is not None:
+                return results
+
+        # the queries of the time offsets are independent, and can run concurrently,
+        # unless the query itself already runs in one of the threads of `get_payload`
+        return dict(
+            zip(
+                query_objects,
+                run_concurrently(
+                    [
+                        partial(self._query_time_offset, query_object, clone)
+                        for clone in query_objects.values()
+                    ],
+                    self.get_max_concurrent_queries(),
+                ),
+            )
+        )
+
+    def _query_time_offset(
+        self,
+        query_object: QueryObject,
+        query_object_clone: QueryObject,
+    ) -> tuple[pd.DataFrame, str]:
+        query_object_clone_dct = self._get_time_offset_query_dict(
+            query_object, query_object_clone
+        )
+        # this runs in the threads of `run_concurrently`
+        datasource = attach_to_thread_session(self._qc_datasource)
+        if isinstance(datasource, Query):
+            result = datasource.exc_query(query_object_clone_dct)
+        else:
+            result = datasource.query(query_object_clone_dct)
+        return result.df, result.query
+
+    def _can_combine_time_offsets(
+        self,
+        df: pd.DataFrame,
+        query_object: QueryObject,
+    ) -> bool:
+        datasource = self._qc_datasource
+        return (
+            isinstance(datasource, SqlaTable)
+            and datasource.db_engine_spec.allows_combined_time_offsets
+            # otherwise the time ranges are set by filters, rather than the time
+            # column of the query
+            and self._is_temporal_comparison(df, query_object)
+            and not query_object.is_rowcount
+        )
+
+    def _query_time_offsets_together(
+        self,
+        query_object: QueryObject,
+        query_objects: dict[str, QueryObject],
+    ) -> dict[str, tuple[pd.DataFrame, str]] | None:
+        """
+        Reads the rows of several time offsets with a single query, which labels each
+        row with the time offset it belongs to.
+
+        Returns None when the time offsets can't be read together, in which case they
+        should be queried one by one.
+        """
+        time_offset_ranges = {
+            offset: (clone.from_dttm, clone.to_dttm)
+            for offset, clone in query_objects.items()
+        }
+        # a row can only be labeled with a single time offset
+        time_ranges = sorted(time_offset_ranges.values())
+        if any(
+            end > start for (_, end), (start, _) in zip(time_ranges, time_ranges[1:])
+        ):
+            return None
+
+        query_object_dct = self._get_time_offset_query_dict(
+            query_object, next(iter(query_objects.values()))
+        )
+        query_object_dct["time_offset_ranges"] = time_offset_ranges
+        row_limit = query_object_dct.get("row_limit")
+        if row_limit:
+            # the row limit applies to each time offset
+            row_limit *= len(query_objects)
+            query_object_dct["row_limit"] = row_limit
+
+        result = self._qc_datasource.query(query_object_dct)
+        if result.status != QueryStatus.SUCCESS:
+            logger.warning(
+                "Unable to query time offsets together: %s", result.error_message
+            )
+            return None
+        if row_limit and len(result.df.index) >= row_limit:
+            # the rows of some time offsets might be missing
+            return None
+
+        stats_logger.incr("time_offsets.single_query")
+        df = result.df
+        return {
+            offset: (
+                df[df[TIME_OFFSET_ALIAS] == offset]
+                .drop(columns=TIME_OFFSET_ALIAS)
+                .reset_index(drop=True),
+                result.query,
+            )
+            for offset in query_objects
+        }
 
     def join_offset_dfs(
         self,
@@ -644,7 +844,15 @@ class QueryContextProcessor:
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | bytes | Iterator[str] | Iterator[bytes] | list[dict[str, Any]]:
+        """
+        Serialize the dataframe in the result format of the query context.
+
+        When ``CHART_DATA_STREAMING_EXPORT`` is enabled CSV and Excel results are
+        returned as iterators of chunks, so that they can be streamed to the client.
+        Post-processed results are always serialized in full, since they're parsed
+        back into a dataframe.
+        """
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -652,13 +860,29 @@ class QueryContextProcessor:
             if verbose_map:
                 df.columns = [verbose_map.get(column, column) for column in columns]
 
+            streaming = (
+                config["CHART_DATA_STREAMING_EXPORT"]
+                and self._query_context.result_type
+                != ChartDataResultType.POST_PROCESSED
+            )
+
             result = None
             if self._query_context.result_format == ChartDataResultFormat.CSV:
+                if streaming:
+                    return csv.df_to_escaped_csv_chunks(
+                        df, index=include_index, **config["CSV_EXPORT"]
+                    )
                 result = csv.df_to_escaped_csv(
                     df, index=include_index, **config["CSV_EXPORT"]
                 )
             elif self._query_context.result_format == ChartDataResultFormat.XLSX:
                 excel.apply_column_types(df, coltypes)
+                if (
+                    streaming
+                    and not isinstance(df.columns, pd.MultiIndex)
+                    and not isinstance(df.index, pd.MultiIndex)
+                ):
+                    return excel.df_to_excel_chunks(df, **config["EXCEL_EXPORT"])
                 result = excel.df_to_excel(df, **config["EXCEL_EXPORT"])
             return result or ""
 
@@ -672,15 +896,18 @@ class QueryContextProcessor:
         """Returns the query results with both metadata and data"""
 
         # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+        query_results = run_concurrently(
+            [
+                partial(
+                    self._get_query_results,
+                    query_obj.result_type or self._query_context.result_type,
+                    query_obj,
+                    force_cached,
+                )
+                for query_obj in self._query_context.queries
+            ],
+            self.get_max_concurrent_queries(),
+        )
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -703,6 +930,44 @@ class QueryContextProcessor:
 
         return return_value
 
+    def _get_query_results(
+        self,
+        result_type: ChartDataResultType,
+        query_obj: QueryObject,
+        force_cached: bool,
+    ) -> dict[str, Any]:
+        """
+        Returns the results of a query object, from the threads of `run_concurrently`.
+
+        The datasource can't be used from the session of another thread, so in those
+        threads the query runs against a copy of the query context and of the query
+        object, whose datasources are attached to the session of the thread.
+        """
+        query_context = self._query_context
+        datasource = attach_to_thread_session(self._qc_datasource)
+        if datasource is not self._qc_datasource:
+            query_context = copy.copy(query_context)
+            query_context.datasource = datasource
+            query_context.slice_ = attach_to_thread_session(query_context.slice_)
+            # pylint: disable=protected-access
+            query_context._processor = QueryContextProcessor(query_context)
+            query_obj = copy.copy(query_obj)
+            query_obj.datasource = attach_to_thread_session(query_obj.datasource)
+        return get_query_results(result_type, query_context, query_obj, force_cached)
+
+    def get_max_concurrent_queries(self) -> int:
+        """Returns how many queries can run at once against the datasource"""
+        database = getattr(self._qc_datasource, "database", None)
+        if database is None or database.max_concurrent_queries <= 1:
+            return 1
+
+        # the datasource is copied to the session of each thread without being
+        # reloaded, so load the relationships used to build the queries up front
+        # rather than once per thread
+        for relationship in ("columns", "metrics"):
+            getattr(self._qc_datasource, relationship, None)
+        return database.max_concurrent_queries
+
     def get_cache_timeout(self) -> int:
         if cache_timeout_rv := self._query_context.get_cache_timeout():
             return cache_timeout_rv
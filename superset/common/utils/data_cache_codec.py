@@ -0,0 +1,159 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the query results stored in the data cache.
+
+The cache backend still serializes the values it's given, but codecs can replace
+the dataframe in a cached value with a more compact representation, leaving the
+rest of the metadata untouched.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# key in the cached value identifying the codec that encoded it
+CODEC_KEY = "codec"
+
+
+class DataCacheCodec(ABC):
+    """
+    Encodes and decodes the values stored by ``QueryCacheManager``.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, value: dict[str, Any]) -> dict[str, Any]: ...
+
+    @abstractmethod
+    def decode(self, value: dict[str, Any]) -> dict[str, Any]: ...
+
+    def get_size(  # pylint: disable=unused-argument
+        self, value: dict[str, Any]
+    ) -> int | None:
+        """
+        Return the size in bytes of the encoded dataframe, if known.
+        """
+        return None
+
+
+class PickleDataCacheCodec(DataCacheCodec):
+    """
+    Store the dataframe as-is, so that it's pickled by the cache backend.
+    """
+
+    name = "pickle"
+
+    def encode(self, value: dict[str, Any]) -> dict[str, Any]:
+        return value
+
+    def decode(self, value: dict[str, Any]) -> dict[str, Any]:
+        return value
+
+
+class ArrowDataCacheCodec(DataCacheCodec):
+    """
+    Store the dataframe as an Arrow IPC stream, optionally compressed.
+
+    Dataframes that can't be represented faithfully in Arrow, eg, with nested or
+    mixed type columns, are stored as-is.
+    """
+
+    name = "arrow"
+
+    def __init__(
+        self,
+        compression: str | None = "lz4",
+        compression_level: int | None = None,
+    ) -> None:
+        """
+        :param compression: The IPC buffer compression, one of ``lz4``, ``zstd`` or
+            ``None``; uncompressed streams are decoded without copying the buffers
+        :param compression_level: The compression level, when supported by the codec
+        """
+        self.compression = compression
+        self.compression_level = compression_level
+
+    def encode(self, value: dict[str, Any]) -> dict[str, Any]:
+        df = value.get("df")
+        if not isinstance(df, pd.DataFrame):
+            return value
+
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.lib.ArrowInvalid, pa.lib.ArrowTypeError, ValueError, TypeError):
+            logger.debug("Dataframe can't be converted to Arrow, storing it as-is")
+            return value
+
+        if any(pa.types.is_nested(field.type) for field in table.schema):
+            # nested values would be read back as arrays instead of lists and dicts
+            return value
+
+        options = pa.ipc.IpcWriteOptions(
+            compression=(
+                pa.Codec(self.compression, self.compression_level)
+                if self.compression
+                else None
+            )
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+        return {**value, "df": sink.getvalue().to_pybytes(), CODEC_KEY: self.name}
+
+    def decode(self, value: dict[str, Any]) -> dict[str, Any]:
+        with pa.ipc.open_stream(pa.py_buffer(value["df"])) as reader:
+            table = reader.read_all()
+
+        df = table.to_pandas(integer_object_nulls=True, split_blocks=True)
+        return {**value, "df": df}
+
+    def get_size(self, value: dict[str, Any]) -> int | None:
+        if value.get(CODEC_KEY) == self.name:
+            return len(value["df"])
+        return None
+
+
+CODECS: dict[str, type[DataCacheCodec]] = {
+    PickleDataCacheCodec.name: PickleDataCacheCodec,
+    ArrowDataCacheCodec.name: ArrowDataCacheCodec,
+}
+
+
+def get_codec_name(value: dict[str, Any]) -> str:
+    """
+    Return the name of the codec that encoded a cached value.
+
+    Values cached before codecs were introduced have no marker and are pickled.
+    """
+    return value.get(CODEC_KEY, PickleDataCacheCodec.name)
+
+
+def decode_value(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Decode a cached value with the codec that encoded it.
+    """
+    return CODECS[get_codec_name(value)]().decode(value)
@@ -0,0 +1,114 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import pandas as pd
+
+
+class LocalCacheEntry(NamedTuple):
+    value: dict[str, Any]
+    size: int
+    expires_at: float
+
+
+def get_value_size(value: dict[str, Any]) -> int:
+    """
+    Estimate the in-memory size of a cached query result, dominated by its dataframe.
+    """
+    df = value.get("df")
+    if isinstance(df, pd.DataFrame):
+        return int(df.memory_usage(index=True, deep=True).sum())
+    if isinstance(df, bytes):
+        return len(df)
+    return 0
+
+
+class LocalQueryCache:
+    """
+    In-process LRU cache of query results, bounded by the estimated size in bytes of
+    the stored values.
+
+    Entries are only kept for a short time, so that values that were refreshed or
+    deleted in the shared cache by other processes are not served for long.
+    """
+
+    def __init__(self, max_bytes: int, default_timeout: int) -> None:
+        self.max_bytes = max_bytes
+        self.default_timeout = default_timeout
+        self.current_bytes = 0
+        self._entries: OrderedDict[str, LocalCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key: str, value: dict[str, Any], timeout: int | None = None) -> bool:
+        """
+        Store a value, evicting the least recently used ones if needed.
+
+        :param key: The cache key
+        :param value: The value to store
+        :param timeout: The remaining lifetime of the value in the shared cache, used
+            to cap the local timeout
+        :returns: Whether the value was stored
+        """
+        if timeout is None or timeout > self.default_timeout:
+            timeout = self.default_timeout
+        size = get_value_size(value)
+        if timeout <= 0 or size > self.max_bytes:
+            self.delete(key)
+            return False
+
+        with self._lock:
+            self._remove(key)
+            while self._entries and self.current_bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+            self._entries[key] = LocalCacheEntry(
+                value=value,
+                size=size,
+                expires_at=time.monotonic() + timeout,
+            )
+            self.current_bytes += size
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self.current_bytes -= entry.size
@@ -17,13 +17,21 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any
 
 from flask_caching import Cache
+from flask_caching.backends import NullCache
 from pandas import DataFrame
 
 from superset import app
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.data_cache_codec import (
+    CODECS,
+    DataCacheCodec,
+    get_codec_name,
+)
+from superset.common.utils.local_cache import LocalQueryCache
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -32,6 +40,7 @@ from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
 from superset.utils.core import error_msg_from_exception, get_stacktrace
+from superset.utils.decorators import stats_timing
 
 config = app.config
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
@@ -42,13 +51,67 @@ _cache: dict[CacheRegion, Cache] = {
     CacheRegion.DATA: cache_manager.data_cache,
 }
 
+_local_cache: dict[CacheRegion, LocalQueryCache] = (
+    {
+        region: LocalQueryCache(
+            max_bytes=config["LOCAL_QUERY_CACHE_CONFIG"]["MAX_BYTES"],
+            default_timeout=config["LOCAL_QUERY_CACHE_CONFIG"]["TIMEOUT"],
+        )
+        for region in _cache
+    }
+    if config["LOCAL_QUERY_CACHE_CONFIG"]["ENABLED"]
+    else {}
+)
+
+
+def copy_value(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy the dataframe of a cached value, as callers are free to modify it.
+    """
+    if isinstance(df := value.get("df"), DataFrame):
+        return {**value, "df": df.copy()}
+    return value
+
+
+def get_remaining_timeout(value: dict[str, Any]) -> int | None:
+    """
+    Return the number of seconds before a cached value expires in the cache backend,
+    or `None` if unknown or if the value never expires.
+    """
+    if not (timeout := value.get("cache_timeout")) or not value.get("dttm"):
+        return None
+    elapsed = datetime.utcnow() - datetime.fromisoformat(value["dttm"])
+    return timeout - int(elapsed.total_seconds())
+
+
+def get_hard_timeout(timeout: int) -> int:
+    """
+    Return the timeout of a value in the cache backend, which is extended past its
+    cache timeout by the grace period when serving stale values is enabled.
+    """
+    swr_config = config["STALE_WHILE_REVALIDATE_CONFIG"]
+    if not swr_config["ENABLED"] or not timeout:
+        return timeout
+    return timeout + swr_config["GRACE_PERIOD"]
+
+
+def is_value_stale(value: dict[str, Any]) -> bool:
+    """
+    Return whether a cached value is past its cache timeout, and kept in the cache
+    backend only to be served while it's refreshed.
+    """
+    if not config["STALE_WHILE_REVALIDATE_CONFIG"]["ENABLED"]:
+        return False
+    remaining_timeout = get_remaining_timeout(value)
+    return remaining_timeout is not None and remaining_timeout <= 0
+
 
 class QueryCacheManager:
     """
     Class for manage query-cache getting and setting
     """
 
-    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    # pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-locals
     def __init__(
         self,
         df: DataFrame = DataFrame(),
@@ -65,6 +128,7 @@ class QueryCacheManager:
         cache_dttm: str | None = None,
         cache_value: dict[str, Any] | None = None,
         sql_rowcount: int | None = None,
+        is_stale: bool = False,
     ) -> None:
         self.df = df
         self.query = query
@@ -81,6 +145,7 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
+        self.is_stale = is_stale
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -121,12 +186,16 @@ class QueryCacheManager:
                 "rejected_filter_columns": self.rejected_filter_columns,
                 "annotation_data": self.annotation_data,
                 "sql_rowcount": self.sql_rowcount,
+                "cache_timeout": (
+                    timeout if timeout is not None else config["CACHE_DEFAULT_TIMEOUT"]
+                ),
             }
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
+                value = self.encode(value)
                 self.set(
                     key=key,
                     value=value,
-                    timeout=timeout,
+                    timeout=get_hard_timeout(value["cache_timeout"]),
                     datasource_uid=datasource_uid,
                     region=region,
                 )
@@ -152,7 +221,7 @@ class QueryCacheManager:
         if not key or not _cache[region] or force_query:
             return query_cache
 
-        if cache_value := _cache[region].get(key):
+        if cache_value := cls._get_value(key, region):
             logger.debug("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
@@ -176,6 +245,7 @@ class QueryCacheManager:
                     cache_value["dttm"] if cache_value is not None else None
                 )
                 query_cache.cache_value = cache_value
+                query_cache.is_stale = is_value_stale(cache_value)
                 stats_logger.incr("loaded_from_cache")
             except KeyError as ex:
                 logger.exception(ex)
@@ -185,6 +255,9 @@ class QueryCacheManager:
                     exc_info=True,
                 )
             logger.debug("Serving from cache")
+        else:
+            codec: DataCacheCodec = config["DATA_CACHE_CODEC"]
+            stats_logger.incr(f"data_cache.{codec.name}.miss")
 
         if force_cached and not query_cache.is_loaded:
             logger.warning(
@@ -193,6 +266,56 @@ class QueryCacheManager:
             raise CacheLoadError("Error loading data from cache")
         return query_cache
 
+    @classmethod
+    def _get_value(cls, key: str, region: CacheRegion) -> dict[str, Any] | None:
+        """
+        Read a decoded value from the local cache, falling back to the cache backend
+        """
+        local_cache = _local_cache.get(region)
+        if local_cache is not None and (value := local_cache.get(key)):
+            stats_logger.incr(f"query_cache.{region}.local_hit")
+            return copy_value(value)
+
+        if not (value := _cache[region].get(key)):
+            stats_logger.incr(f"query_cache.{region}.miss")
+            return None
+
+        stats_logger.incr(f"query_cache.{region}.backend_hit")
+        try:
+            value = cls.decode(value)
+        except KeyError:
+            logger.error("Unknown data cache codec: %s", get_codec_name(value))
+            return None
+
+        if local_cache is not None:
+            local_cache.set(key, copy_value(value), get_remaining_timeout(value))
+        return value
+
+    @staticmethod
+    def encode(value: dict[str, Any]) -> dict[str, Any]:
+        """
+        Encode a query result with the configured data cache codec
+        """
+        codec: DataCacheCodec = config["DATA_CACHE_CODEC"]
+        with stats_timing(f"data_cache.{codec.name}.encode", stats_logger):
+            value = codec.encode(value)
+
+        # the codec may fall back to storing the dataframe as-is
+        name = get_codec_name(value)
+        if (size := CODECS[name]().get_size(value)) is not None:
+            stats_logger.gauge(f"data_cache.{name}.bytes", size)
+        return value
+
+    @staticmethod
+    def decode(value: dict[str, Any]) -> dict[str, Any]:
+        """
+        Decode a cached query result with the codec that encoded it
+        """
+        name = get_codec_name(value)
+        stats_logger.incr(f"data_cache.{name}.hit")
+        with stats_timing(f"data_cache.{name}.decode", stats_logger):
+            return CODECS[name]().decode(value)
+
     @staticmethod
     def set(
         key: str | None,
@@ -205,6 +328,8 @@ class QueryCacheManager:
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
+            if (local_cache := _local_cache.get(region)) is not None:
+                local_cache.delete(key)
             set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
 
     @staticmethod
@@ -213,8 +338,38 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
     ) -> None:
         if key:
+            if (local_cache := _local_cache.get(region)) is not None:
+                local_cache.delete(key)
             _cache[region].delete(key)
 
+    @staticmethod
+    def start_refresh(
+        key: str,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> bool:
+        """
+        Mark a stale value as being refreshed, returning `False` if it already is
+        """
+        timeout = config["STALE_WHILE_REVALIDATE_CONFIG"]["REFRESH_TIMEOUT"]
+        return bool(_cache[region].add(f"{key}-refresh", True, timeout=timeout))
+
+    @staticmethod
+    def cancel_refresh(
+        key: str,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> None:
+        """
+        Unmark a stale value as being refreshed, so that it can be refreshed again
+        """
+        _cache[region].delete(f"{key}-refresh")
+
+    @staticmethod
+    def is_enabled(region: CacheRegion = CacheRegion.DEFAULT) -> bool:
+        """
+        Return whether values set in the cache region are actually stored
+        """
+        return not isinstance(_cache[region].cache, NullCache)
+
     @staticmethod
     def has(
         key: str | None,
@@ -0,0 +1,145 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Coalescing of identical queries running concurrently across workers.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, ExitStack
+from datetime import timedelta
+
+from superset import app, db
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.distributed_lock import KeyValueDistributedLock
+from superset.exceptions import CreateKeyValueDistributedLockFailedException
+from superset.stats_logger import BaseStatsLogger
+
+config = app.config
+stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+logger = logging.getLogger(__name__)
+
+NAMESPACE = "query_single_flight"
+
+
+def is_query_running(cache_key: str) -> bool:
+    """
+    Return whether a worker holds the lock for computing a query result.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.distributed_lock.get import GetDistributedLock
+
+    params = {"cache_key": cache_key}
+    return GetDistributedLock(namespace=NAMESPACE, params=params).run() is not None
+
+
+def wait_for_query_result(
+    cache_key: str,
+    region: CacheRegion,
+    poll_interval: float,
+) -> QueryCacheManager | None:
+    """
+    Wait for the worker running a query to store its result in the cache.
+
+    Callers wait for as long as the lock is held, which is at most the expiration of
+    the lock, so that a query running longer than expected doesn't make all of them
+    run it too.
+
+    :returns: The cached result, or `None` if the query finished without caching a
+        result, eg, because it failed, or if the lock expired
+    """
+    while True:
+        time.sleep(poll_interval)
+        # end the transaction of the previous poll, since under REPEATABLE READ its
+        # snapshot would still show the lock once released by a failed query
+        db.session.rollback()  # pylint: disable=consider-using-transaction
+        cache = QueryCacheManager.get(key=cache_key, region=region)
+        if cache.is_loaded:
+            stats_logger.incr("single_flight.coalesced")
+            return cache
+        if not is_query_running(cache_key):
+            break
+
+    # the query finished, but the result might have been stored right before the lock
+    # was released
+    cache = QueryCacheManager.get(key=cache_key, region=region)
+    if cache.is_loaded:
+        stats_logger.incr("single_flight.coalesced")
+        return cache
+    stats_logger.incr("single_flight.uncached")
+    return None
+
+
+def get_lock_expiration() -> timedelta:
+    """
+    Return how long the lock of a running query is held at most, which is never less
+    than the timeout of queries.
+    """
+    return timedelta(
+        seconds=max(
+            config["QUERY_SINGLE_FLIGHT_CONFIG"]["LOCK_TIMEOUT"],
+            config["SUPERSET_WEBSERVER_TIMEOUT"],
+        )
+    )
+
+
+@contextmanager
+def single_flight(
+    cache_key: str,
+    region: CacheRegion = CacheRegion.DATA,
+) -> Iterator[QueryCacheManager | None]:
+    """
+    Make sure only one worker computes the result of a given query at a time.
+
+    The first caller takes a distributed lock keyed by the cache key and gets `None`,
+    meaning it should run the query and cache its result, while concurrent callers
+    wait for that result to be cached and get it instead, for as long as the lock is
+    held. Callers also get `None` if the result couldn't be obtained from the running
+    query, in which case they run the query themselves.
+
+    :param cache_key: The cache key of the query result
+    :param region: The cache region where the result is stored
+    :yields: The result computed by another worker, if any
+    """
+    single_flight_config = config["QUERY_SINGLE_FLIGHT_CONFIG"]
+    if not single_flight_config["ENABLED"] or not QueryCacheManager.is_enabled(region):
+        yield None
+        return
+
+    with ExitStack() as stack:
+        try:
+            stack.enter_context(
+                KeyValueDistributedLock(
+                    namespace=NAMESPACE,
+                    lock_expiration=get_lock_expiration(),
+                    cache_key=cache_key,
+                )
+            )
+        except CreateKeyValueDistributedLockFailedException:
+            logger.debug("Waiting for the query with cache key %s", cache_key)
+            yield wait_for_query_result(
+                cache_key,
+                region,
+                poll_interval=single_flight_config["POLL_INTERVAL"],
+            )
+        else:
+            stats_logger.incr("single_flight.leader")
+            yield None
@@ -52,9 +52,15 @@ from sqlalchemy.orm.query import Query
 from superset.advanced_data_type.plugins.internet_address import internet_address
 from superset.advanced_data_type.plugins.internet_port import internet_port
 from superset.advanced_data_type.types import AdvancedDataType
+from superset.cachekeys.index import CacheKeyIndex, RedisCacheKeyIndex
+from superset.common.utils.data_cache_codec import (
+    DataCacheCodec,
+    PickleDataCacheCodec,
+)
 from superset.constants import CHANGE_ME_SECRET_KEY
 from superset.jinja_context import BaseTemplateProcessor
 from superset.key_value.types import JsonKeyValueCodec
+from superset.sqllab.results_codec import ResultsCodec, ZlibResultsCodec
 from superset.stats_logger import DummyStatsLogger
 from superset.superset_typing import CacheConfig
 from superset.tasks.types import ExecutorType
@@ -80,6 +86,9 @@ STATS_LOGGER = DummyStatsLogger()
 
 # By default will log events to the metadata database with `DBEventLogger`
 # Note that you can use `StdOutEventLogger` for debugging
+# Note that `BufferedDBEventLogger` writes the events to the metadata database in
+# batches from a background thread, which takes the write off the request path:
+# EVENT_LOGGER = BufferedDBEventLogger(batch_size=100, flush_interval=5)
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
 EVENT_LOGGER = DBEventLogger()
@@ -823,6 +832,88 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Codec used to store query results in the cache. The default leaves the dataframes
+# to be pickled by the cache backend, while `ArrowDataCacheCodec` stores them as
+# compressed Arrow IPC streams, which are smaller and faster to load, eg:
+#
+#   from superset.common.utils.data_cache_codec import ArrowDataCacheCodec
+#   DATA_CACHE_CODEC = ArrowDataCacheCodec(compression="zstd")
+#
+# Cached values are always decoded with the codec that encoded them, so the codec
+# can be changed without flushing the cache.
+DATA_CACHE_CODEC: DataCacheCodec = PickleDataCacheCodec()
+
+# In-process LRU cache of query results kept by each worker in front of the
+# `CACHE_CONFIG` and `DATA_CACHE_CONFIG` caches, avoiding the round trip to the cache
+# backend and the deserialization of the results for popular charts. `MAX_BYTES`
+# bounds the estimated size of the results kept for each of the two caches, and
+# `TIMEOUT` how long, in seconds, they are kept, as values refreshed or deleted by
+# other workers are only seen once the local copy expires.
+LOCAL_QUERY_CACHE_CONFIG: dict[str, Any] = {
+    "ENABLED": False,
+    "MAX_BYTES": 256 * 1024 * 1024,
+    "TIMEOUT": 60,
+}
+
+# Coalesce identical chart data queries that run concurrently when their result is
+# not cached: the first request takes a lock in the metastore and runs the query,
+# while the other ones poll the data cache every `POLL_INTERVAL` seconds waiting for
+# its result, for as long as the lock is held. The lock expires after `LOCK_TIMEOUT`
+# seconds, or `SUPERSET_WEBSERVER_TIMEOUT` if longer, after which the waiting
+# requests run the query themselves. Requires a `DATA_CACHE_CONFIG` cache.
+QUERY_SINGLE_FLIGHT_CONFIG: dict[str, Any] = {
+    "ENABLED": False,
+    "LOCK_TIMEOUT": int(timedelta(minutes=5).total_seconds()),
+    "POLL_INTERVAL": 0.5,
+}
+
+# Keep chart data query results in the data cache for `GRACE_PERIOD` seconds past
+# their cache timeout. During that period the stale results are served right away,
+# flagged with `is_stale`, while a Celery task refreshes them in the background. At
+# most one refresh is enqueued for a given result every `REFRESH_TIMEOUT` seconds.
+STALE_WHILE_REVALIDATE_CONFIG: dict[str, Any] = {
+    "ENABLED": False,
+    "GRACE_PERIOD": int(timedelta(days=1).total_seconds()),
+    "REFRESH_TIMEOUT": int(timedelta(minutes=5).total_seconds()),
+}
+
+# Warm up the caches of charts in the Celery worker running the `cache-warmup` task,
+# rather than by scheduling a `fetch_url` task per chart, which requests
+# `/api/v1/chart/warm_up_cache` from the web servers. Charts sharing a datasource are
+# warmed up one after the other by one of `MAX_WORKERS` threads, queries sharing a
+# cache key run once, and at most `DATABASE_CONCURRENCY` charts are warmed up at once
+# per database, unless overridden by database name in `DATABASE_CONCURRENCY_BY_NAME`.
+# Unless `FORCE` is set, charts whose queries are all cached are skipped.
+CACHE_WARMUP_EXECUTOR_CONFIG: dict[str, Any] = {
+    "IN_PROCESS": False,
+    "MAX_WORKERS": 8,
+    "DATABASE_CONCURRENCY": 2,
+    "DATABASE_CONCURRENCY_BY_NAME": {},
+    "FORCE": True,
+}
+
+# Serve `/api/v1/dashboard/<id_or_slug>/bootstrap`, which bundles a dashboard with
+# its charts and datasets, from a gzipped payload kept in the `CACHE_CONFIG` cache for
+# `CACHE_TIMEOUT` seconds. Payloads are keyed by the last change of the dashboard, its
+# charts and its datasets, and by the roles of the user. When `REBUILD_ON_CHANGE` is
+# set, a Celery task rebuilds the payloads of a dashboard once a change to it, or to
+# one of its charts or datasets, is committed.
+DASHBOARD_BOOTSTRAP_CONFIG: dict[str, Any] = {
+    "ENABLED": False,
+    "CACHE_TIMEOUT": int(timedelta(days=1).total_seconds()),
+    "REBUILD_ON_CHANGE": True,
+}
+
+# Parsed SQL is cached by a hash of its content and engine. The ASTs, tables and
+# mutation flags of up to `SQL_PARSE_CACHE_SIZE` scripts are kept in memory by each
+# worker (0 disables it), and in the `SQL_PARSE_CACHE_CONFIG` cache, which is shared
+# by the workers, when configured.
+SQL_PARSE_CACHE_SIZE = 100
+SQL_PARSE_CACHE_CONFIG: CacheConfig = {
+    "CACHE_TYPE": "NullCache",
+    "CACHE_NO_NULL_WARNING": True,
+}
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -851,9 +942,37 @@ EXPLORE_FORM_DATA_CACHE_CONFIG: CacheConfig = {
     "CODEC": JsonKeyValueCodec(),
 }
 
+# Doris store holding the password reset hashes
+DORIS_HOST: str | None = None
+DORIS_PORT = 9030
+DORIS_USER: str | None = None
+DORIS_PASSWORD: str | None = None
+DORIS_DATABASE = "studio"
+
+# Pool of connections to the Doris store, shared by the threads of each worker.
+# `POOL_SIZE` connections are kept open, and up to `MAX_OVERFLOW` more are opened
+# under load. Checking out a connection waits up to `TIMEOUT` seconds for one to be
+# returned, connections are pinged before being handed out and replaced after
+# `RECYCLE` seconds, and opening a connection times out after `CONNECT_TIMEOUT`
+# seconds.
+DORIS_POOL_CONFIG: dict[str, Any] = {
+    "POOL_SIZE": 5,
+    "MAX_OVERFLOW": 5,
+    "TIMEOUT": 10,
+    "RECYCLE": 3600,
+    "CONNECT_TIMEOUT": 10,
+}
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
+# The index the cache keys above are stored in. By default the keys of the caches
+# stored in Redis are indexed by a Redis set per datasource, which expires with the
+# keys it holds, and the keys of the other caches by `CacheKey` rows in the metadata
+# database. Use `MetadataDBCacheKeyIndex()` to store all the keys in the metadata
+# database, or subclass `CacheKeyIndex` to store them elsewhere.
+CACHE_KEY_INDEX: CacheKeyIndex = RedisCacheKeyIndex()
+
 # CORS Options
 ENABLE_CORS = False
 CORS_OPTIONS: dict[Any, Any] = {}
@@ -906,6 +1025,12 @@ CSV_EXPORT = {"encoding": "utf-8"}
 # note: index option should not be overridden
 EXCEL_EXPORT: dict[str, Any] = {}
 
+# Stream CSV and Excel exports from the chart data API to the client in chunks,
+# instead of building the whole file in memory first. Excel files are written row
+# by row in xlsxwriter's constant memory mode; note that this only supports the
+# `sheet_name`, `index` and `header` options from `EXCEL_EXPORT`.
+CHART_DATA_STREAMING_EXPORT = False
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -1052,6 +1177,7 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.scheduler",
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
+        "superset.tasks.dashboard_bootstrap",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1179,12 +1305,45 @@ SQLLAB_CTAS_SCHEMA_NAME_FUNC: (
 # in SQL Lab by using the "Run Async" button/feature
 RESULTS_BACKEND: BaseCache | None = None
 
+# Build query result sets column by column instead of going through an intermediate
+# NumPy structured array. When the DB engine spec supports it (see
+# `BaseEngineSpec.supports_columnar_fetch`) results are also fetched from the driver
+# directly as Arrow tables, which avoids materializing one Python tuple per row.
+# Engine specs with `column_type_vectorized_mutators` also mutate the values of the
+# results column by column, rather than value by value.
+RESULT_SET_COLUMNAR_INGESTION = False
+
 # Use PyArrow and MessagePack for async query results serialization,
 # rather than JSON. This feature requires additional testing from the
 # community before it is fully adopted, so this config option is provided
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Codec compressing the results stored in the results backend. The default writes zlib
+# streams, readable by any version of Superset, while `ArrowResultsCodec` uses one of
+# the faster codecs bundled with PyArrow, eg:
+#
+#   from superset.sqllab.results_codec import ArrowResultsCodec
+#   RESULTS_BACKEND_CODEC = ArrowResultsCodec("zstd", level=1)
+#
+# Results are always decompressed with the codec that compressed them, so the codec can
+# be changed without flushing the results backend. The compression ratio and times of
+# each codec are published as `results_backend.<codec>.*` stats.
+RESULTS_BACKEND_CODEC: ResultsCodec = ZlibResultsCodec()
+
+# When results are serialized with PyArrow, split them into record batches of at most
+# this many rows, each stored under its own key in the results backend. SQL Lab can
+# then page through large results, reading and decoding only the batches of the
+# requested rows. Set to None to store the results as a single blob.
+SQLLAB_RESULTS_BATCH_ROWS: int | None = 50_000
+
+# Write the results of asynchronous SQL Lab queries to the results backend as they're
+# fetched, one batch of `SQLLAB_RESULTS_BATCH_ROWS` rows at a time, rather than once
+# all the rows have been fetched. The memory used by the Celery workers is then bounded
+# by the size of a batch rather than the size of the results. Requires the results to
+# be stored in batches, with `RESULTS_BACKEND_USE_MSGPACK` enabled.
+SQLLAB_STREAM_RESULTS = False
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1349,6 +1508,27 @@ DASHBOARD_TEMPLATE_ID = None
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Pool connections to the databases instead of opening a new connection for every
+# query. Engines are kept per database, effective URL, impersonated user and
+# connection parameters, up to `MAX_ENGINES` per worker, and are disposed of when the
+# database is modified. Connections through SSH tunnels are never pooled. The other
+# keys configure the connection pool of each engine, and can be overridden for a
+# given database through its `engine_params`.
+DATABASE_ENGINE_POOL_CONFIG: dict[str, Any] = {
+    "ENABLED": False,
+    "POOL_SIZE": 5,
+    "MAX_OVERFLOW": 10,
+    "POOL_TIMEOUT": 30,
+    "POOL_RECYCLE": 3600,
+    "POOL_PRE_PING": True,
+    "MAX_ENGINES": 100,
+}
+
+# How many queries of a chart, including the queries of the time comparisons, can run
+# at once. Queries run serially by default; the limit can be overridden for each
+# database through the `max_concurrent_queries` key of its `extra` field.
+CHART_DATA_MAX_CONCURRENT_QUERIES = 1
+
 # A set of disallowed SQL functions per engine. This is used to restrict the use of
 # unsafe SQL functions in SQL Lab and Charts. The keys of the dictionary are the engine
 # names, and the values are sets of disallowed functions.
@@ -1487,6 +1667,10 @@ ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
 # Max tries to run queries to prevent false errors caused by transient errors
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
+# Get the data of CSV and text reports by running the query context saved with the
+# chart in the worker, as the executor of the report, rather than requesting it from
+# the chart data API with the auth cookies of the executor
+ALERT_REPORTS_IN_PROCESS_DATA = False
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
@@ -1534,6 +1718,21 @@ WEBDRIVER_CONFIGURATION: dict[Any, Any] = {"service_log_path": "/dev/null"}
 # Note: If using Chrome, you'll want to add the "--marionette" arg.
 WEBDRIVER_OPTION_ARGS = ["--headless"]
 
+# Keep the authenticated browsers used for thumbnails and reports in a pool of each
+# worker process, rather than starting and authenticating a browser per screenshot.
+# Browsers are keyed by user, and recycled after rendering MAX_PAGES pages, after
+# MAX_AGE seconds, after being idle for IDLE_TIMEOUT seconds, or on errors. At most
+# MAX_SIZE browsers are kept, and screenshots wait up to ACQUIRE_TIMEOUT seconds for
+# a browser when all are in use.
+WEBDRIVER_POOL_CONFIG: dict[str, Any] = {
+    "ENABLED": False,
+    "MAX_SIZE": 4,
+    "MAX_PAGES": 50,
+    "MAX_AGE": int(timedelta(hours=1).total_seconds()),
+    "IDLE_TIMEOUT": int(timedelta(minutes=5).total_seconds()),
+    "ACQUIRE_TIMEOUT": int(timedelta(minutes=1).total_seconds()),
+}
+
 # The base URL to query for accessing the user interface
 WEBDRIVER_BASEURL = "http://0.0.0.0:8080/"
 # The base URL for the email report hyperlinks.
@@ -1785,6 +1984,12 @@ GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# When polling, wait up to this many milliseconds for new events before answering
+# `/api/v1/async_event/` with an empty list, rather than answering right away. This
+# cuts the number of polling requests, at the cost of keeping a web server worker
+# and a Redis connection busy while waiting: use it with threaded or async workers,
+# and a Redis `socket_timeout` longer than the wait. 0 disables long polling.
+GLOBAL_ASYNC_QUERIES_LONG_POLLING_TIMEOUT = 0
 
 # Embedded config options
 GUEST_ROLE_NAME = "Public"
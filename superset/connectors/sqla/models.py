@@ -1841,12 +1841,9 @@ class SqlaTable(
         old_columns_by_name: dict[str, TableColumn] = {
             col.column_name: col for col in old_columns
         }
+        new_column_names = {col["column_name"] for col in new_columns}
         results = MetadataResult(
-            removed=[
-                col
-                for col in old_columns_by_name
-                if col not in {col["column_name"] for col in new_columns}
-            ]
+            removed=[col for col in old_columns_by_name if col not in new_column_names]
         )
 
         # clear old columns before adding modified columns back
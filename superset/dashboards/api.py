@@ -16,6 +16,7 @@
 # under the License.
 # pylint: disable=too-many-lines
 import functools
+import gzip
 import logging
 from datetime import datetime
 from io import BytesIO
@@ -61,6 +62,7 @@ from superset.commands.importers.exceptions import NoValidFilesFoundError
 from superset.commands.importers.v1.utils import get_contents_from_bundle
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.daos.dashboard import DashboardDAO, EmbeddedDashboardDAO
+from superset.dashboards.bootstrap import get_bootstrap
 from superset.dashboards.filters import (
     DashboardAccessFilter,
     DashboardCertifiedFilter,
@@ -169,6 +171,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         "favorite_status",
         "add_favorite",
         "remove_favorite",
+        "get_bootstrap",
         "get_charts",
         "get_datasets",
         "get_tabs",
@@ -433,6 +436,90 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         except DashboardNotFoundError:
             return self.response_404()
 
+    @expose("/<id_or_slug>/bootstrap", methods=("GET",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.get_bootstrap",
+        log_to_statsd=False,
+    )
+    def get_bootstrap(self, id_or_slug: str) -> Response:
+        """Get everything needed to bootstrap a dashboard.
+        ---
+        get:
+          summary: Get a dashboard with its charts and datasets
+          description: >-
+            Returns the dashboard, its charts and its datasets, as returned by
+            `/api/v1/dashboard/<id_or_slug>`, `/charts` and `/datasets`. The
+            payload is cached when `DASHBOARD_BOOTSTRAP_CONFIG` is enabled, and
+            supports conditional requests.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: id_or_slug
+            description: Either the id of the dashboard, or its slug
+          responses:
+            200:
+              description: Dashboard, chart and dataset definitions
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: object
+                        properties:
+                          dashboard:
+                            $ref: '#/components/schemas/DashboardGetResponseSchema'
+                          charts:
+                            type: array
+                            items:
+                              $ref: '#/components/schemas/ChartEntityResponseSchema'
+                          datasets:
+                            type: array
+                            items:
+                              $ref: '#/components/schemas/DashboardDatasetSchema'
+            304:
+              description: The dashboard hasn't changed
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+        """
+        try:
+            dashboard = DashboardDAO.get_by_id_or_slug(id_or_slug)
+            bootstrap = get_bootstrap(dashboard)
+        except (TypeError, ValueError) as err:
+            return self.response_400(
+                message=gettext(
+                    "Dataset schema is invalid, caused by: %(error)s", error=str(err)
+                )
+            )
+        except DashboardAccessDeniedError:
+            return self.response_403()
+        except DashboardNotFoundError:
+            return self.response_404()
+
+        # the bundle is stored gzipped, so it's served as is to clients accepting it
+        if "gzip" in request.accept_encodings:
+            response = Response(bootstrap.payload, mimetype="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(
+                gzip.decompress(bootstrap.payload), mimetype="application/json"
+            )
+        response.vary.add("Accept-Encoding")
+        response.set_etag(bootstrap.etag)
+        response.last_modified = bootstrap.last_modified
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
     @expose("/<id_or_slug>/tabs", methods=("GET",))
     @protect()
     @safe
@@ -0,0 +1,274 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Bootstrap bundles of dashboards.
+
+The bundle of a dashboard holds the payloads of `/api/v1/dashboard/<id_or_slug>`,
+`/charts` and `/datasets`, so that a dashboard is bootstrapped by a single request.
+Serializing the datasets is expensive, so when `DASHBOARD_BOOTSTRAP_CONFIG` is enabled
+bundles are cached gzipped, keyed by the last change of the dashboard, its charts and
+its datasets, and by the roles of the user. They're rebuilt in the background when
+one of those changes.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app, g
+from sqlalchemy import select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, object_session, Session
+
+from superset import security_manager
+from superset.charts.schemas import ChartEntityResponseSchema
+from superset.daos.dashboard import DashboardDAO
+from superset.dashboards.schemas import (
+    DashboardDatasetSchema,
+    DashboardGetResponseSchema,
+)
+from superset.extensions import cache_manager
+from superset.utils import json
+from superset.utils.hashing import md5_sha_from_str
+
+if TYPE_CHECKING:
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+logger = logging.getLogger(__name__)
+
+# the IDs of the dashboards to rebuild once the session is committed
+SESSION_INFO_KEY = "dashboard_bootstrap_ids"
+
+chart_entity_response_schema = ChartEntityResponseSchema()
+dashboard_get_response_schema = DashboardGetResponseSchema()
+dashboard_dataset_schema = DashboardDatasetSchema()
+
+
+@dataclass
+class DashboardBootstrap:
+    """A gzipped bootstrap bundle, and the version of the dashboard it was built at"""
+
+    payload: bytes
+    etag: str
+    last_modified: datetime
+
+
+def get_permission_fingerprint() -> str:
+    """
+    Return a fingerprint of the permissions of the current user.
+
+    Bundles only differ by whether the user is a guest user, but they are keyed by
+    roles so that a bundle is never shared by users with different permissions.
+    """
+    roles = sorted(role.name for role in security_manager.get_user_roles())
+    guest = security_manager.is_guest_user()
+    return md5_sha_from_str(json.dumps({"roles": roles, "guest": guest}))
+
+
+def get_version(dashboard: Dashboard) -> datetime:
+    """The last change of a dashboard, its charts or its datasets"""
+    return max(
+        DashboardDAO.get_dashboard_and_slices_changed_on(dashboard),
+        DashboardDAO.get_dashboard_and_datasets_changed_on(dashboard),
+    )
+
+
+def get_cache_key(dashboard_id: int, version: datetime, fingerprint: str) -> str:
+    return f"dashboard_bootstrap:{dashboard_id}:{version.isoformat()}:{fingerprint}"
+
+
+def get_users_cache_key(dashboard_id: int) -> str:
+    return f"dashboard_bootstrap:{dashboard_id}:users"
+
+
+def build(dashboard: Dashboard) -> dict[str, Any]:
+    """Build the bootstrap bundle of a dashboard for the current user"""
+    return {
+        "dashboard": dashboard_get_response_schema.dump(dashboard),
+        "charts": [
+            chart_entity_response_schema.dump(chart) for chart in dashboard.slices
+        ],
+        "datasets": [
+            dashboard_dataset_schema.dump(dataset)
+            for dataset in dashboard.datasets_trimmed_for_slices()
+        ],
+    }
+
+
+def get_bootstrap(dashboard: Dashboard) -> DashboardBootstrap:
+    """
+    Return the bootstrap bundle of a dashboard for the current user, from the cache
+    when possible. Access to the dashboard must be checked by the caller.
+    """
+    config = current_app.config["DASHBOARD_BOOTSTRAP_CONFIG"]
+    version = get_version(dashboard)
+    fingerprint = get_permission_fingerprint()
+    cache_key = get_cache_key(dashboard.id, version, fingerprint)
+    etag = md5_sha_from_str(
+        f"{cache_key}:{current_app.config['VERSION_STRING']}"
+        f"{current_app.config['VERSION_SHA']}"
+    )
+
+    payload = cache_manager.cache.get(cache_key) if config["ENABLED"] else None
+    if payload is None:
+        payload = gzip.compress(json.dumps({"result": build(dashboard)}).encode())
+        if config["ENABLED"]:
+            cache_manager.cache.set(
+                cache_key,
+                payload,
+                timeout=config["CACHE_TIMEOUT"],
+            )
+            _add_user(dashboard.id, fingerprint)
+
+    return DashboardBootstrap(payload=payload, etag=etag, last_modified=version)
+
+
+def rebuild(dashboard_id: int) -> int:
+    """
+    Rebuild the cached bundles of a dashboard, for each of the permission
+    fingerprints it was requested with, as the last user requesting it.
+
+    :returns: The number of bundles rebuilt
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.models.dashboard import Dashboard
+    from superset.utils.core import override_user
+
+    config = current_app.config["DASHBOARD_BOOTSTRAP_CONFIG"]
+    dashboard = Dashboard.get(dashboard_id)
+    if not dashboard:
+        return 0
+
+    users: dict[str, str] = (
+        cache_manager.cache.get(get_users_cache_key(dashboard_id)) or {}
+    )
+    version = get_version(dashboard)
+    count = 0
+    for fingerprint, username in users.items():
+        user = security_manager.find_user(username)
+        if not user:
+            continue
+        with override_user(user):
+            if get_permission_fingerprint() != fingerprint:
+                continue
+            payload = gzip.compress(json.dumps({"result": build(dashboard)}).encode())
+            cache_manager.cache.set(
+                get_cache_key(dashboard_id, version, fingerprint),
+                payload,
+                timeout=config["CACHE_TIMEOUT"],
+            )
+            count += 1
+    return count
+
+
+def _add_user(dashboard_id: int, fingerprint: str) -> None:
+    """
+    Remember a user with a given permission fingerprint, so that the bundles of the
+    fingerprint can be rebuilt as that user. Guest users can't be impersonated.
+    """
+    if security_manager.is_guest_user() or g.user.is_anonymous:
+        return
+
+    cache_key = get_users_cache_key(dashboard_id)
+    users: dict[str, str] = cache_manager.cache.get(cache_key) or {}
+    if users.get(fingerprint) != g.user.username:
+        users[fingerprint] = g.user.username
+        cache_manager.cache.set(
+            cache_key,
+            users,
+            timeout=current_app.config["DASHBOARD_BOOTSTRAP_CONFIG"]["CACHE_TIMEOUT"],
+        )
+
+
+def _schedule(target: Any, dashboard_ids: set[int]) -> None:
+    if sess := object_session(target):
+        sess.info.setdefault(SESSION_INFO_KEY, set()).update(dashboard_ids)
+
+
+def on_dashboard_change(
+    _mapper: Mapper, _connection: Connection, target: Dashboard
+) -> None:
+    _schedule(target, {target.id})
+
+
+def on_chart_change(_mapper: Mapper, connection: Connection, target: Slice) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.models.dashboard import dashboard_slices
+
+    query = select(dashboard_slices.c.dashboard_id).where(
+        dashboard_slices.c.slice_id == target.id
+    )
+    _schedule(target, {row[0] for row in connection.execute(query)})
+
+
+def on_dataset_change(
+    _mapper: Mapper,
+    connection: Connection,
+    target: SqlaTable,
+) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.models.dashboard import dashboard_slices
+    from superset.models.slice import Slice
+
+    query = (
+        select(dashboard_slices.c.dashboard_id)
+        .join(Slice, Slice.id == dashboard_slices.c.slice_id)
+        .where(Slice.datasource_type == "table", Slice.datasource_id == target.id)
+    )
+    _schedule(target, {row[0] for row in connection.execute(query)})
+
+
+def on_commit(sess: Session) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.tasks.dashboard_bootstrap import rebuild_dashboard_bootstrap
+
+    for dashboard_id in sess.info.pop(SESSION_INFO_KEY, set()):
+        # the commit already happened, so a broker outage must not fail the request;
+        # stale bundles are still invalidated by their version
+        try:
+            rebuild_dashboard_bootstrap.delay(dashboard_id=dashboard_id)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                "Failed to schedule the rebuild of the bundle of dashboard %s",
+                dashboard_id,
+            )
+
+
+def on_rollback(sess: Session) -> None:
+    sess.info.pop(SESSION_INFO_KEY, None)
+
+
+def register_sqla_event_listeners() -> None:
+    """Rebuild the bundles of the dashboards changed by a commit"""
+    # pylint: disable=import-outside-toplevel
+    import sqlalchemy as sqla
+
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    sqla.event.listen(Dashboard, "after_update", on_dashboard_change)
+    sqla.event.listen(Slice, "after_update", on_chart_change)
+    sqla.event.listen(SqlaTable, "after_update", on_dataset_change)
+    sqla.event.listen(Session, "after_commit", on_commit)
+    sqla.event.listen(Session, "after_rollback", on_rollback)
@@ -0,0 +1,157 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of pooled SQLAlchemy engines for the databases.
+
+By default Superset creates a new engine, and a new connection, every time it talks
+to a database. When `DATABASE_ENGINE_POOL_CONFIG` is enabled engines are kept per
+database, effective URL and connection parameters instead, so that connections are
+reused across queries.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, NamedTuple
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from superset import app
+from superset.stats_logger import BaseStatsLogger
+from superset.utils.decorators import stats_timing
+
+config = app.config
+stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    Queue pool reporting checkout latency and saturation through the stats logger.
+
+    Metrics are prefixed with the pool logging name, which identifies the database.
+    """
+
+    def _do_get(self) -> Any:
+        prefix = f"engine_pool.{self._orig_logging_name}"
+        with stats_timing(f"{prefix}.checkout", stats_logger):
+            connection = super()._do_get()
+
+        checked_out = self.checkedout()
+        stats_logger.gauge(f"{prefix}.checked_out", checked_out)
+        if capacity := self.size() + max(self._max_overflow, 0):
+            stats_logger.gauge(f"{prefix}.saturation", checked_out / capacity)
+        return connection
+
+
+class CachedEngine(NamedTuple):
+    engine: Engine
+    database_id: int | None
+    changed_on: datetime | None
+
+
+class EngineCache:
+    """
+    LRU cache of engines, disposing of the engines it evicts.
+    """
+
+    def __init__(self) -> None:
+        self._engines: OrderedDict[str, CachedEngine] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_engine(
+        self,
+        key: str,
+        database_id: int | None,
+        changed_on: datetime | None,
+        create_engine: Callable[[], Engine],
+    ) -> Engine:
+        """
+        Return the engine for a given key, creating it if needed.
+
+        Engines created for previous versions of the database, ie, with a different
+        `changed_on`, are disposed of, so that edits made through other workers are
+        picked up.
+
+        :param key: The key identifying the engine
+        :param database_id: The ID of the database the engine connects to
+        :param changed_on: When the database was last modified
+        :param create_engine: Function creating the engine
+        """
+        with self._lock:
+            if cached := self._engines.get(key):
+                self._engines.move_to_end(key)
+                return cached.engine
+
+            stale_keys = [
+                cached_key
+                for cached_key, cached in self._engines.items()
+                if cached.database_id == database_id and cached.changed_on != changed_on
+            ]
+            for stale_key in stale_keys:
+                self._remove(stale_key)
+
+            engine = create_engine()
+            self._engines[key] = CachedEngine(engine, database_id, changed_on)
+            while (
+                len(self._engines)
+                > config["DATABASE_ENGINE_POOL_CONFIG"]["MAX_ENGINES"]
+            ):
+                self._remove(next(iter(self._engines)))
+
+            return engine
+
+    def dispose(self, database_id: int | None) -> None:
+        """
+        Dispose of all the engines of a given database.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, cached in self._engines.items()
+                if cached.database_id == database_id
+            ]
+            for key in keys:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._engines):
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._engines)
+
+    def _remove(self, key: str) -> None:
+        cached = self._engines.pop(key)
+        logger.debug("Disposing of engine for database %s", cached.database_id)
+        # connections checked out are closed when returned
+        cached.engine.dispose()
+
+
+engine_cache = EngineCache()
+
+
+def dispose_database_engines(_mapper: Any, _connection: Any, target: Any) -> None:
+    """
+    Dispose of the engines of a database when it's updated or deleted.
+    """
+    engine_cache.dispose(target.id)
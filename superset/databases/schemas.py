@@ -828,6 +828,7 @@ class ImportV1DatabaseExtraSchema(Schema):
     disable_data_preview = fields.Boolean(required=False)
     disable_drill_to_detail = fields.Boolean(required=False)
     allow_multi_catalog = fields.Boolean(required=False)
+    max_concurrent_queries = fields.Integer(required=False)
     version = fields.String(required=False, allow_none=True)
 
 
@@ -28,6 +28,7 @@ from typing import (
     Callable,
     cast,
     ContextManager,
+    Iterator,
     NamedTuple,
     TYPE_CHECKING,
     TypedDict,
@@ -37,6 +38,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 import sqlparse
 from apispec import APISpec
@@ -66,6 +68,7 @@ from superset.exceptions import DisallowedSQLFunction, OAuth2Error, OAuth2Redire
 from superset.sql.parse import SQLScript, Table
 from superset.sql_parse import ParsedQuery
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -173,6 +176,29 @@ class LimitMethod:  # pylint: disable=too-few-public-methods
     FORCE_LIMIT = "force_limit"
 
 
+class CursorChunk:
+    """
+    Proxy of a DB-API cursor returning at most `size` rows from its fetch methods, so
+    that `fetch_data` reads a single chunk of the results when called with it.
+    """
+
+    def __init__(self, cursor: Any, size: int) -> None:
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_size", size)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._cursor, name, value)
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._cursor.fetchmany(self._size)
+
+    def fetchmany(self, size: int | None = None) -> list[tuple[Any, ...]]:
+        return self._cursor.fetchmany(min(size or self._size, self._size))
+
+
 class MetricType(TypedDict, total=False):
     """
     Type for metrics return by `get_metrics`.
@@ -345,6 +371,15 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # Needed on certain databases that return values in an unexpected format
     column_type_mutators: dict[TypeEngine, Callable[[Any], Any]] = {}
 
+    # type-specific functions to mutate whole columns of values received from the
+    # database, as Arrow arrays. When defined for one of the columns of the results,
+    # and `RESULT_SET_COLUMNAR_INGESTION` is enabled, the rows are fetched as a
+    # `pyarrow.Table` and mutated column by column instead of value by value
+    column_type_vectorized_mutators: dict[
+        TypeEngine,
+        Callable[[pa.Array | pa.ChunkedArray], pa.Array | pa.ChunkedArray],
+    ] = {}
+
     # Does database support join-free timeslot grouping
     time_groupby_inline = False
     limit_method = LimitMethod.FORCE_LIMIT
@@ -370,6 +405,11 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # But for backward compatibility, False by default
     allows_hidden_cc_in_orderby = False
 
+    # Whether the queries of several time comparisons can be combined into a single
+    # query, which reads the union of their time ranges and labels each row with the
+    # offset it belongs to
+    allows_combined_time_offsets = True
+
     # Whether allow CTE as subquery or regular CTE
     # If True, then it will allow  in subquery ,
     # if False it will allow as regular CTE
@@ -394,6 +434,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     force_column_alias_quotes = False
     arraysize = 0
+    # Can the driver return results as Arrow tables? If True the engine spec MUST
+    # implement the `fetch_data_columnar` method.
+    supports_columnar_fetch = False
     max_column_name_length: int | None = None
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
@@ -965,25 +1008,14 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
+            column_mutators = cls.get_column_mutators(
+                cursor.description or [],
+                cls.column_type_mutators,
+            )
             if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
                 for row_idx, row in enumerate(data):
                     new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
+                    for col_idx, func in column_mutators.items():
                         new_row[col_idx] = func(row[col_idx])
                     data[row_idx] = tuple(new_row)
 
@@ -991,6 +1023,131 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_chunks(
+        cls,
+        cursor: Any,
+        chunk_size: int,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results in chunks of at most ``chunk_size`` rows, so that only a
+        chunk of the rows is held in memory at a time.
+
+        Each chunk is read by ``fetch_data``, with a cursor returning the rows of the
+        chunk only, so that engine specific processing of the rows still applies.
+
+        :param cursor: Cursor instance
+        :param chunk_size: Maximum number of rows of a chunk
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Chunks of the result of query
+        """
+        fetched = 0
+        while limit is None or fetched < limit:
+            size = chunk_size if limit is None else min(chunk_size, limit - fetched)
+            data = cls.fetch_data(CursorChunk(cursor, size))
+            if not data:
+                return
+            fetched += len(data)
+            yield data
+
+    @classmethod
+    def get_column_mutators(
+        cls,
+        description: DbapiDescription,
+        mutators: dict[TypeEngine, Callable[..., Any]],
+    ) -> dict[int, Callable[..., Any]]:
+        """
+        Map the index of each column of the results to the function that mutates its
+        values, based on the column type.
+
+        :param description: Cursor description
+        :param mutators: Mutator functions by column type
+        :return: Mutator function of each mutated column, by column index
+        """
+        if not mutators:
+            return {}
+
+        # the first two items in the description row are the column name and type
+        return {
+            idx: func
+            for idx, row in enumerate(description)
+            if (
+                func := mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+
+    @classmethod
+    def fetch_data_columnar(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | None:
+        """
+        Fetch the results as a ``pyarrow.Table`` using the driver's native columnar
+        API, skipping the materialization of one Python tuple per row.
+
+        Engine specs that set ``supports_columnar_fetch`` should override this
+        method. Returning ``None`` means the results are not available in a columnar
+        format, and callers should fall back to ``fetch_data``.
+
+        Engine specs that define ``column_type_vectorized_mutators`` get the rows
+        from ``cursor.fetchall`` instead, and mutate the columns of the resulting
+        table as a whole. Columns which only have a ``column_type_mutators``
+        function are mutated value by value.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query as an Arrow table, or ``None``
+        """
+        description = cursor.description or []
+        vectorized_mutators = cls.get_column_mutators(
+            description,
+            cls.column_type_vectorized_mutators,
+        )
+        if not vectorized_mutators:
+            return None
+
+        # pylint: disable=import-outside-toplevel
+        from superset.result_set import SupersetResultSet
+
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        try:
+            if cls.limit_method == LimitMethod.FETCH_MANY and limit:
+                data = cursor.fetchmany(limit)
+            else:
+                data = cursor.fetchall()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+        table = SupersetResultSet(data, description, cls, columnar=True).table
+        if table.num_columns != len(description):
+            # no rows
+            return table
+
+        column_mutators = {
+            idx: func
+            for idx, func in cls.get_column_mutators(
+                description,
+                cls.column_type_mutators,
+            ).items()
+            if idx not in vectorized_mutators
+        }
+        for idx in range(table.num_columns):
+            array = table.column(idx)
+            if func := vectorized_mutators.get(idx):
+                array = func(array)
+            elif func := column_mutators.get(idx):
+                array = pa.array(list(map(func, array.to_pylist())))
+            else:
+                continue
+            table = table.set_column(idx, table.field(idx).name, array)
+
+        return table
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1583,6 +1740,30 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             )
         )
 
+    @classmethod
+    def get_schema_columns(  # pylint: disable=unused-argument
+        cls,
+        inspector: Inspector,
+        schema: str | None,
+        options: dict[str, Any] | None = None,
+    ) -> dict[str, list[ResultSetColumnType]] | None:
+        """
+        Get the columns of all the tables of a schema with a single query.
+
+        This is used to sync the metadata of many datasets at once. Engines that can't
+        do it return `None`, and the columns of each table are read with `get_columns`
+        instead.
+
+        The inspector will be bound to a catalog, if one was specified.
+
+        :param inspector: SqlAlchemy Inspector instance
+        :param schema: The schema, or `None` for the default one
+        :param options: Extra options to customise the display of columns in
+                        some databases
+        :return: The columns of each table in the schema, by table name
+        """
+        return None
+
     @classmethod
     def get_metrics(  # pylint: disable=unused-argument
         cls,
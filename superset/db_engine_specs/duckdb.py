@@ -21,6 +21,7 @@ from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -32,7 +33,7 @@ from sqlalchemy.engine.url import URL
 from superset.config import VERSION_STRING
 from superset.constants import TimeGrain, USER_AGENT
 from superset.databases.utils import make_url_safe
-from superset.db_engine_specs.base import BaseEngineSpec
+from superset.db_engine_specs.base import BaseEngineSpec, LimitMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 
 if TYPE_CHECKING:
@@ -196,6 +197,8 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
 
     sqlalchemy_uri_placeholder = "duckdb:////path/to/duck.db"
 
+    supports_columnar_fetch = True
+
     _time_grain_expressions = {
         None: "{col}",
         TimeGrain.SECOND: "DATE_TRUNC('second', {col})",
@@ -236,6 +239,24 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     ) -> set[str]:
         return set(inspector.get_table_names(schema))
 
+    @classmethod
+    def fetch_data_columnar(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | None:
+        if not hasattr(cursor, "fetch_arrow_table"):
+            return None
+
+        try:
+            table = cursor.fetch_arrow_table()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+        if cls.limit_method == LimitMethod.FETCH_MANY and limit:
+            table = table.slice(0, limit)
+        return table
+
     @staticmethod
     def get_extra_params(database: Database) -> dict[str, Any]:
         """
@@ -117,6 +117,7 @@ class KustoKqlEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
     time_groupby_inline = True
     allows_joins = True
     allows_subqueries = True
+    allows_combined_time_offsets = False
     allows_sql_comments = False
     run_multiple_statements_as_one = True
 
@@ -16,14 +16,17 @@
 # under the License.
 import contextlib
 import re
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
 from re import Pattern
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Union
 from urllib import parse
 
+import pyarrow as pa
+import pyarrow.compute as pc
 from flask_babel import gettext as __
-from sqlalchemy import types
+from sqlalchemy import text, types
 from sqlalchemy.dialects.mysql import (
     BIT,
     DECIMAL,
@@ -36,12 +39,16 @@ from sqlalchemy.dialects.mysql import (
     TINYINT,
     TINYTEXT,
 )
+from sqlalchemy.dialects.mysql.reflection import ReflectedState
+from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
+from sqlalchemy.types import NullType
 
 from superset.constants import TimeGrain
 from superset.db_engine_specs.base import BaseEngineSpec, BasicParametersMixin
 from superset.errors import SupersetErrorType
 from superset.models.sql_lab import Query
+from superset.superset_typing import ResultSetColumnType
 from superset.utils.core import GenericDataType
 
 # Regular expressions to catch custom errors
@@ -62,6 +69,33 @@ SYNTAX_ERROR_REGEX = re.compile(
 )
 
 
+def decimal_strings_to_decimal(
+    values: Union[pa.Array, pa.ChunkedArray],
+) -> Union[pa.Array, pa.ChunkedArray]:
+    """
+    Cast a column of decimals returned as strings to an Arrow decimal column, using
+    the scale of its most precise value.
+
+    Values that don't fit in a 128-bit decimal are converted one by one instead.
+    """
+    if not pa.types.is_string(values.type):
+        return values
+
+    dots = pc.find_substring(values, ".")
+    scales = pc.if_else(
+        pc.greater_equal(dots, 0),
+        pc.subtract(pc.subtract(pc.utf8_length(values), dots), 1),
+        0,
+    )
+    scale = pc.max(scales).as_py() or 0
+    try:
+        return pc.cast(values, pa.decimal128(38, scale))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return pa.array(
+            [None if val is None else Decimal(val) for val in values.to_pylist()]
+        )
+
+
 class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
     engine = "mysql"
     engine_name = "MySQL"
@@ -130,6 +164,10 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
     column_type_mutators: dict[types.TypeEngine, Callable[[Any], Any]] = {
         DECIMAL: lambda val: Decimal(val) if isinstance(val, str) else val
     }
+    column_type_vectorized_mutators: dict[
+        types.TypeEngine,
+        Callable[[Union[pa.Array, pa.ChunkedArray]], Union[pa.Array, pa.ChunkedArray]],
+    ] = {DECIMAL: decimal_strings_to_decimal}
 
     _time_grain_expressions = {
         None: "{col}",
@@ -239,22 +277,68 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
 
     @classmethod
     def get_datatype(cls, type_code: Any) -> Optional[str]:
-        if not cls.type_code_map:
-            # only import and store if needed at least once
-            # pylint: disable=import-outside-toplevel
-            import MySQLdb
-
-            ft = MySQLdb.constants.FIELD_TYPE
-            cls.type_code_map = {
-                getattr(ft, k): k for k in dir(ft) if not k.startswith("_")
-            }
         datatype = type_code
         if isinstance(type_code, int):
+            if not cls.type_code_map:
+                # only import and store if needed at least once
+                # pylint: disable=import-outside-toplevel
+                import MySQLdb
+
+                ft = MySQLdb.constants.FIELD_TYPE
+                cls.type_code_map = {
+                    getattr(ft, k): k for k in dir(ft) if not k.startswith("_")
+                }
             datatype = cls.type_code_map.get(type_code)
         if datatype and isinstance(datatype, str) and datatype:
             return datatype
         return None
 
+    @classmethod
+    def get_schema_columns(
+        cls,
+        inspector: Inspector,
+        schema: Optional[str],
+        options: Optional[dict[str, Any]] = None,
+    ) -> Optional[dict[str, list[ResultSetColumnType]]]:
+        """
+        Read the columns of a schema from `information_schema`, parsing their types
+        the way the dialect parses them when reflecting a single table.
+        """
+        parser = getattr(inspector.dialect, "_tabledef_parser", None)
+        if parser is None:
+            return None
+
+        quote = inspector.dialect.identifier_preparer.quote_identifier
+        rows = inspector.bind.execute(
+            text(
+                """
+                SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_COMMENT
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = COALESCE(:schema, DATABASE())
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+                """
+            ),
+            schema=schema,
+        )
+
+        columns: dict[str, list[ResultSetColumnType]] = defaultdict(list)
+        for table_name, column_name, column_type, is_nullable, comment in rows:
+            state = ReflectedState()
+            # pylint: disable=protected-access
+            parser._parse_column(f"  {quote(column_name)} {column_type},", state)
+            column_type = state.columns[0]["type"] if state.columns else NullType()
+            columns[table_name].append(
+                {
+                    "column_name": column_name,
+                    "name": column_name,
+                    "type": column_type,
+                    "nullable": is_nullable == "YES",
+                    "default": None,
+                    "comment": comment or None,
+                }
+            )
+        return dict(columns)
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "from_unixtime({col})"
@@ -21,6 +21,7 @@ from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING, TypedDict
 from urllib import parse
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from cryptography.hazmat.backends import default_backend
@@ -34,7 +35,11 @@ from sqlalchemy.engine.url import URL
 
 from superset.constants import TimeGrain, USER_AGENT
 from superset.databases.utils import make_url_safe
-from superset.db_engine_specs.base import BaseEngineSpec, BasicPropertiesType
+from superset.db_engine_specs.base import (
+    BaseEngineSpec,
+    BasicPropertiesType,
+    LimitMethod,
+)
 from superset.db_engine_specs.postgres import PostgresBaseEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.models.sql_lab import Query
@@ -86,6 +91,7 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
     supports_dynamic_schema = True
     supports_catalog = supports_dynamic_catalog = True
+    supports_columnar_fetch = True
 
     # pylint: disable=invalid-name
     encrypted_extra_sensitive_fields = {
@@ -229,6 +235,31 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
             return f"""CAST('{dttm.isoformat(timespec="microseconds")}' AS DATETIME)"""
         return None
 
+    @classmethod
+    def fetch_data_columnar(
+        cls,
+        cursor: Any,
+        limit: Optional[int] = None,
+    ) -> Optional[pa.Table]:
+        # pylint: disable=import-outside-toplevel
+        from snowflake.connector.errors import NotSupportedError
+
+        if not hasattr(cursor, "fetch_arrow_all"):
+            return None
+
+        try:
+            # returns `None` when the query produced no rows
+            table = cursor.fetch_arrow_all()
+        except NotSupportedError:
+            # the result set was not returned in the Arrow format
+            return None
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+        if table is not None and cls.limit_method == LimitMethod.FETCH_MANY and limit:
+            table = table.slice(0, limit)
+        return table
+
     @staticmethod
     def mutate_db_for_connection_test(database: "Database") -> None:
         """
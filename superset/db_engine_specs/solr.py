@@ -27,6 +27,7 @@ class SolrEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
     time_groupby_inline = False
     allows_joins = False
     allows_subqueries = False
+    allows_combined_time_offsets = False
 
     _time_grain_expressions = {
         None: "{col}",
@@ -38,6 +38,7 @@ RESOURCE = KeyValueResource.LOCK
 @contextmanager
 def KeyValueDistributedLock(  # pylint: disable=invalid-name
     namespace: str,
+    lock_expiration: timedelta | None = None,
     **kwargs: Any,
 ) -> Iterator[uuid.UUID]:
     """
@@ -49,6 +50,8 @@ def KeyValueDistributedLock(  # pylint: disable=invalid-name
     store.
 
     :param namespace: The namespace for which the lock is to be acquired.
+    :param lock_expiration: How long the lock is held at most, `LOCK_EXPIRATION` by
+        default.
     :param kwargs: Additional keyword arguments.
     :yields: A unique identifier (UUID) for the acquired lock (the KV key).
     :raises CreateKeyValueDistributedLockFailedException: If the lock is taken.
@@ -67,11 +70,17 @@ def KeyValueDistributedLock(  # pylint: disable=invalid-name
 
     logger.debug("Acquiring lock on namespace %s for key %s", namespace, key)
     try:
-        CreateDistributedLock(namespace=namespace, params=kwargs).run()
+        CreateDistributedLock(
+            namespace=namespace,
+            params=kwargs,
+            lock_expiration=lock_expiration or LOCK_EXPIRATION,
+        ).run()
     except CreateKeyValueDistributedLockFailedException as ex:
         logger.debug("Lock on namespace %s for key %s already taken", namespace, key)
         raise CreateKeyValueDistributedLockFailedException("Lock already taken") from ex
 
-    yield key
-    DeleteDistributedLock(namespace=namespace, params=kwargs).run()
-    logger.debug("Removed lock on namespace %s for key %s", namespace, key)
+    try:
+        yield key
+    finally:
+        DeleteDistributedLock(namespace=namespace, params=kwargs).run()
+        logger.debug("Removed lock on namespace %s for key %s", namespace, key)
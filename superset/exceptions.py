@@ -223,6 +223,10 @@ class CacheLoadError(SupersetException):
     status = 404
 
 
+class WebDriverPoolTimeoutError(SupersetException):
+    status = 503
+
+
 class QueryClauseValidationException(SupersetException):
     status = 400
 
@@ -429,6 +429,13 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         if feature_flag_manager.is_feature_enabled("TAGGING_SYSTEM"):
             register_sqla_event_listeners()
 
+        bootstrap_config = self.config["DASHBOARD_BOOTSTRAP_CONFIG"]
+        if bootstrap_config["ENABLED"] and bootstrap_config["REBUILD_ON_CHANGE"]:
+            # pylint: disable=import-outside-toplevel
+            from superset.dashboards import bootstrap
+
+            bootstrap.register_sqla_event_listeners()
+
         self.init_views()
 
     def check_secret_key(self) -> None:
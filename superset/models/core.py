@@ -62,6 +62,11 @@ from sqlalchemy.sql import ColumnElement, expression, Select
 from superset import app, db_engine_specs, is_feature_enabled
 from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK
+from superset.databases.engine_cache import (
+    dispose_database_engines,
+    engine_cache,
+    InstrumentedQueuePool,
+)
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
@@ -78,6 +83,7 @@ from superset.superset_typing import OAuth2ClientConfig, ResultSetColumnType
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import DatasourceName, get_username
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.oauth2 import get_oauth2_access_token, OAuth2ClientConfigSchema
 
 config = app.config
@@ -238,6 +244,14 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     def allow_multi_catalog(self) -> bool:
         return self.get_extra().get("allow_multi_catalog", False)
 
+    @property
+    def max_concurrent_queries(self) -> int:
+        """How many queries of a chart can run at once against the database"""
+        return self.get_extra().get(
+            "max_concurrent_queries",
+            config["CHART_DATA_MAX_CONCURRENT_QUERIES"],
+        )
+
     @property
     def schema_options(self) -> dict[str, Any]:
         """Additional schema display config for engines with complex schemas"""
@@ -400,7 +414,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         self,
         catalog: str | None = None,
         schema: str | None = None,
-        nullpool: bool = True,
+        nullpool: bool | None = None,
         source: utils.QuerySource | None = None,
         override_ssh_tunnel: SSHTunnel | None = None,
     ) -> Engine:
@@ -411,6 +425,9 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         context manager (as opposed to the engine directly) is important because we need
         to potentially establish SSH tunnels before the connection is created, and clean
         them up once the engine is no longer used.
+
+        Unless `nullpool` is specified, engines are pooled and reused when
+        `DATABASE_ENGINE_POOL_CONFIG` is enabled, and use a `NullPool` otherwise.
         """
         from superset.daos.database import (  # pylint: disable=import-outside-toplevel
             DatabaseDAO,
@@ -429,6 +446,14 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 sqlalchemy_database_uri=sqlalchemy_uri,
             )
 
+        # connections through SSH tunnels can't be pooled, since the tunnels are torn
+        # down once the engine is no longer used
+        pooled = (
+            nullpool is None
+            and config["DATABASE_ENGINE_POOL_CONFIG"]["ENABLED"]
+            and not ssh_tunnel
+        )
+
         with engine_context as server_context:
             if ssh_tunnel and server_context:
                 logger.info(
@@ -445,9 +470,10 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             yield self._get_sqla_engine(
                 catalog=catalog,
                 schema=schema,
-                nullpool=nullpool,
+                nullpool=not pooled if nullpool is None else nullpool,
                 source=source,
                 sqlalchemy_uri=sqlalchemy_uri,
+                pooled=pooled,
             )
 
     def _get_sqla_engine(  # pylint: disable=too-many-locals
@@ -457,6 +483,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        pooled: bool = False,
     ) -> Engine:
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
@@ -535,17 +562,82 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 security_manager,
                 source,
             )
+        if pooled:
+            return self._get_pooled_sqla_engine(
+                sqlalchemy_url,
+                params,
+                effective_username,
+                self.db_engine_spec.get_prequeries(catalog=catalog, schema=schema),
+            )
+
         try:
             return create_engine(sqlalchemy_url, **params)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
 
+    def _get_pooled_sqla_engine(
+        self,
+        sqlalchemy_url: URL,
+        params: dict[str, Any],
+        effective_username: str | None,
+        prequeries: list[str],
+    ) -> Engine:
+        """
+        Return a cached engine with a connection pool.
+
+        Engines are cached by the effective URL, user and connection parameters, which
+        include the impersonation settings and OAuth2 tokens, and by the last time the
+        database was modified.
+
+        They're also cached by the pre-session queries of the catalog and schema, since
+        these change the state of the session (eg, the search path in Postgres), which
+        persists when connections are returned to the pool. Connections are then only
+        reused by callers running the same pre-session queries, or none.
+        """
+        pool_config = config["DATABASE_ENGINE_POOL_CONFIG"]
+        key = md5_sha_from_dict(
+            {
+                "database_id": self.id,
+                "changed_on": self.changed_on,
+                "url": sqlalchemy_url.render_as_string(hide_password=False),
+                "username": effective_username,
+                "params": params,
+                "prequeries": prequeries,
+            },
+            default=str,
+        )
+
+        def create_pooled_engine() -> Engine:
+            try:
+                return create_engine(
+                    sqlalchemy_url,
+                    **{
+                        "poolclass": InstrumentedQueuePool,
+                        "pool_size": pool_config["POOL_SIZE"],
+                        "max_overflow": pool_config["MAX_OVERFLOW"],
+                        "pool_timeout": pool_config["POOL_TIMEOUT"],
+                        "pool_recycle": pool_config["POOL_RECYCLE"],
+                        "pool_pre_ping": pool_config["POOL_PRE_PING"],
+                        "pool_logging_name": f"database_{self.id}",
+                        **params,
+                    },
+                )
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        return engine_cache.get_engine(
+            key,
+            database_id=self.id,
+            changed_on=self.changed_on,
+            create_engine=create_pooled_engine,
+        )
+
     @contextmanager
     def get_raw_connection(
         self,
         catalog: str | None = None,
         schema: str | None = None,
-        nullpool: bool = True,
+        nullpool: bool | None = None,
         source: utils.QuerySource | None = None,
     ) -> Connection:
         with self.get_sqla_engine(
@@ -680,9 +772,17 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                         cursor.fetchall()
                     else:
                         # Last query, fetch and process the results
-                        data = self.db_engine_spec.fetch_data(cursor)
+                        columnar = config["RESULT_SET_COLUMNAR_INGESTION"]
+                        data = None
+                        if columnar:
+                            data = self.db_engine_spec.fetch_data_columnar(cursor)
+                        if data is None:
+                            data = self.db_engine_spec.fetch_data(cursor)
                         result_set = SupersetResultSet(
-                            data, cursor.description, self.db_engine_spec
+                            data,
+                            cursor.description,
+                            self.db_engine_spec,
+                            columnar=columnar,
                         )
                         df = result_set.to_pandas_df()
             if mutator:
@@ -941,6 +1041,16 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 inspector, table, self.schema_options
             )
 
+    def get_schema_columns(
+        self,
+        catalog: str | None,
+        schema: str | None,
+    ) -> dict[str, list[ResultSetColumnType]] | None:
+        with self.get_inspector(catalog=catalog, schema=schema) as inspector:
+            return self.db_engine_spec.get_schema_columns(
+                inspector, schema, self.schema_options
+            )
+
     def get_metrics(
         self,
         table: Table,
@@ -1099,6 +1209,8 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 sqla.event.listen(Database, "after_insert", security_manager.database_after_insert)
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
+sqla.event.listen(Database, "after_update", dispose_database_engines)
+sqla.event.listen(Database, "after_delete", dispose_database_engines)
 
 
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
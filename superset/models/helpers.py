@@ -1452,6 +1452,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         timeseries_limit: Optional[int] = None,
         timeseries_limit_metric: Optional[Metric] = None,
         time_shift: Optional[str] = None,
+        time_offset_ranges: Optional[dict[str, tuple[datetime, datetime]]] = None,
     ) -> SqlaQuery:
         """Querying any sqla table from this common interface"""
         if granularity not in self.dttm_cols and granularity is not None:
@@ -1692,28 +1693,54 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 select_exprs.insert(0, timestamp)
                 groupby_all_columns[timestamp.name] = timestamp
 
-            # Use main dttm column to support index with secondary dttm columns.
-            if (
-                self.always_filter_main_dttm
-                and self.main_dttm_col in self.dttm_cols
-                and self.main_dttm_col != dttm_col.column_name
-            ):
-                time_filters.append(
-                    self.get_time_filter(
-                        time_col=columns_by_name[self.main_dttm_col],
-                        start_dttm=from_dttm,
-                        end_dttm=to_dttm,
-                        template_processor=template_processor,
+            # the rows of several time offsets can be read at once, in which case
+            # the time filter is the union of their time ranges
+            time_ranges = (
+                time_offset_ranges if time_offset_ranges else {"": (from_dttm, to_dttm)}
+            )
+            main_time_filters = []
+            offset_time_filters = {}
+            for offset, (start_dttm, end_dttm) in time_ranges.items():
+                # Use main dttm column to support index with secondary dttm columns.
+                if (
+                    self.always_filter_main_dttm
+                    and self.main_dttm_col in self.dttm_cols
+                    and self.main_dttm_col != dttm_col.column_name
+                ):
+                    main_time_filters.append(
+                        self.get_time_filter(
+                            time_col=columns_by_name[self.main_dttm_col],
+                            start_dttm=start_dttm,
+                            end_dttm=end_dttm,
+                            template_processor=template_processor,
+                        )
                     )
+
+                offset_time_filters[offset] = self.get_time_filter(
+                    time_col=dttm_col,
+                    start_dttm=start_dttm,
+                    end_dttm=end_dttm,
+                    template_processor=template_processor,
                 )
 
-            time_filter_column = self.get_time_filter(
-                time_col=dttm_col,
-                start_dttm=from_dttm,
-                end_dttm=to_dttm,
-                template_processor=template_processor,
-            )
-            time_filters.append(time_filter_column)
+            if main_time_filters:
+                time_filters.append(or_(*main_time_filters))
+            time_filters.append(or_(*offset_time_filters.values()))
+
+            if time_offset_ranges:
+                # label each row with the time offset it belongs to
+                time_offset = self.make_sqla_column_compatible(
+                    sa.case(
+                        *[
+                            (time_filter, sa.literal(offset))
+                            for offset, time_filter in offset_time_filters.items()
+                        ]
+                    ),
+                    utils.TIME_OFFSET_ALIAS,
+                )
+                select_exprs.append(time_offset)
+                if need_groupby:
+                    groupby_all_columns[utils.TIME_OFFSET_ALIAS] = time_offset
 
         # Always remove duplicates by column name, as sometimes `metrics_exprs`
         # can have the same name as a groupby column (e.g. when users use
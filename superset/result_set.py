@@ -16,8 +16,12 @@
 # under the License.
 """Superset wrapper around pyarrow.Table."""
 
+from __future__ import annotations
+
 import datetime
 import logging
+from collections.abc import Sequence
+from operator import itemgetter
 from typing import Any, Optional
 
 import numpy as np
@@ -99,21 +103,49 @@ def convert_to_string(value: Any) -> str:
     return str(value)
 
 
+def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+    """
+    Build a 1-D object array from a column of values.
+
+    ``np.array`` would turn a column of equally sized sequences into a 2-D array,
+    so the values are copied in one by one instead.
+    """
+    if isinstance(values, np.ndarray):
+        return values
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals
+    def __init__(
         self,
-        data: DbapiResult,
+        data: DbapiResult | pa.Table,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
+        columnar: bool = False,
     ):
+        """
+        :param data: Rows returned by the cursor, or a ``pyarrow.Table`` when the
+            engine spec fetched the results natively in a columnar format
+        :param cursor_description: The cursor description
+        :param db_engine_spec: The engine spec of the database
+        :param columnar: Transpose the rows straight into per-column arrays instead
+            of going through an intermediate NumPy structured array
+        """
         self.db_engine_spec = db_engine_spec
-        data = data or []
+        data = data if data is not None else []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[pa.Array | pa.ChunkedArray] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
         numpy_dtype: list[tuple[str, ...]] = []
         stringified_arr: NDArray[Any]
 
+        if isinstance(data, pa.Table) and not (
+            cursor_description and len(cursor_description) == data.num_columns
+        ):
+            cursor_description = [
+                (name, None, None, None, None, None, None) for name in data.column_names
+            ]
+
         if cursor_description:
             # get deduped list of column names
             column_names = dedup(
@@ -129,52 +161,30 @@ class SupersetResultSet:
             # generate numpy structured array dtype
             numpy_dtype = [(column_name, "object") for column_name in column_names]
 
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            if data.num_rows > 0:
+                for column in data.columns:
+                    if pa.types.is_nested(column.type):
+                        stringified_arr = stringify_values(
+                            to_object_array(column.to_pylist())
+                        )
+                        column = pa.array(stringified_arr.tolist())
+                    pa_data.append(column)
+        elif columnar:
+            if data and column_names:
+                # build one column at a time, so that only a single column of
+                # values is held next to the rows
+                for i in range(len(column_names)):
+                    values = list(map(itemgetter(i), data))
+                    pa_data.append(self._column_to_pa_array(values))
+        else:
+            # only do expensive recasting if datatype is not standard list of tuples
+            if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
+                data = [tuple(row) for row in data]
+            array = np.array(data, dtype=numpy_dtype)
+            if array.size > 0:
+                for column in column_names:
+                    pa_data.append(self._column_to_pa_array(array[column]))
 
         if not pa_data:
             column_names = []
@@ -191,6 +201,56 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    def _column_to_pa_array(self, values: Sequence[Any]) -> pa.Array:
+        """
+        Convert the values of a single column to an Arrow array.
+
+        :param values: The column values, either as a NumPy object array or a list
+        :return: The Arrow array
+        """
+        values_list = values.tolist() if isinstance(values, np.ndarray) else values
+        stringified_arr: NDArray[Any]
+        try:
+            pa_array = pa.array(values_list)
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            stringified_arr = stringify_values(to_object_array(values))
+            return pa.array(stringified_arr.tolist())
+
+        if pa.types.is_nested(pa_array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            stringified_arr = stringify_values(to_object_array(values))
+            pa_array = pa.array(stringified_arr.tolist())
+
+        elif pa.types.is_temporal(pa_array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = self.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        tz = sample.tzinfo
+                        series = pd.Series(to_object_array(values))
+                        series = pd.to_datetime(series)
+                        pa_array = pa.Array.from_pandas(
+                            series,
+                            type=pa.timestamp("ns", tz=tz),
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return pa_array
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
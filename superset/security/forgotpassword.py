@@ -60,22 +60,20 @@ class ExtraResetMyPasswordView(ResetMyPasswordView):
         # remove resetpw from db
         resetpw = self.appbuilder.sm.get_reset_password_hash(g.user.id)
         
-        connection = self.appbuilder.sm.get_doris_connection()
         try:
-            cursor = connection.cursor()
-            
-            cursor.execute(
-                "DELETE FROM reset_user_password WHERE id=%s and reset_hash=%s;",
-                params=[resetpw["id"], resetpw["reset_hash"]]
-            )
-            connection.commit()
+            with self.appbuilder.sm.doris_connection() as connection:
+                cursor = connection.cursor()
 
-            cursor.close()
-            connection.close()
+                cursor.execute(
+                    "DELETE FROM reset_user_password WHERE id=%s and reset_hash=%s;",
+                    params=[resetpw["id"], resetpw["reset_hash"]]
+                )
+                connection.commit()
+
+                cursor.close()
         except Exception as e:
             log.error(f"Error removing password reset hash from db. {str(e)}"
 """ Error removing password reset hash, format with err message """)
-            connection.rollback()
 
         flash(as_unicode(self.message), "info")
 
@@ -92,11 +90,12 @@ class PublicResetMyPasswordView(PublicFormView):
 
     @expose("/form/<string:reset_hash>", methods=["GET"])
     def this_form_get(self, reset_hash):
-        connection = self.appbuilder.sm.get_doris_connection()
-        cursor = connection.cursor(dictionary=True)
+        with self.appbuilder.sm.doris_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
 
-        cursor.execute("SELECT id, reset_hash, created_on, ack FROM reset_user_password WHERE reset_hash=%s;", params=[reset_hash])
-        resetpw = cursor.fetchone()
+            cursor.execute("SELECT id, reset_hash, created_on, ack FROM reset_user_password WHERE reset_hash=%s;", params=[reset_hash])
+            resetpw = cursor.fetchone()
+            cursor.close()
         valid = self.appbuilder.sm.check_expire_reset_password_hash(resetpw)
 
         # prevents browsing to the url while there's no valid reset_hash
@@ -117,11 +116,12 @@ class PublicResetMyPasswordView(PublicFormView):
 
     @expose("/form/<string:reset_hash>", methods=["POST"])
     def this_form_post(self, reset_hash):
-        connection = self.appbuilder.sm.get_doris_connection()
-        cursor = connection.cursor(dictionary=True)
+        with self.appbuilder.sm.doris_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
 
-        cursor.execute("SELECT id FROM reset_user_password WHERE reset_hash=%s;", params=[reset_hash])
-        resetpw = cursor.fetchone()
+            cursor.execute("SELECT id FROM reset_user_password WHERE reset_hash=%s;", params=[reset_hash])
+            resetpw = cursor.fetchone()
+            cursor.close()
         user_id = resetpw["id"]
 
         self._init_vars()
@@ -132,20 +132,19 @@ class PublicResetMyPasswordView(PublicFormView):
 
             # remove resetpw from db!
             try:
-                cursor = connection.cursor()
-                
-                cursor.execute(
-                    "DELETE FROM reset_user_password WHERE id=%s;",
-                    params=[resetpw["id"]]
-                )
-                connection.commit()
+                with self.appbuilder.sm.doris_connection() as connection:
+                    cursor = connection.cursor()
 
-                cursor.close()
-                connection.close()
+                    cursor.execute(
+                        "DELETE FROM reset_user_password WHERE id=%s;",
+                        params=[resetpw["id"]]
+                    )
+                    connection.commit()
+
+                    cursor.close()
             except Exception as e:
                 log.error(f"Error removing password reset hash from db. {str(e)} "
 """ Error removing password reset hash, format with err message """)
-                connection.rollback()
 
             response = self.form_post(form)
             if not response:
@@ -197,12 +196,12 @@ class ExtraResetPasswordView(ResetPasswordView):
         """
         false_error_message = lazy_gettext("Not able to reset the password")
         
-        connection = self.appbuilder.sm.get_doris_connection()
-        cursor = connection.cursor(dictionary=True)
-        
         try:
-            cursor.execute("SELECT id, reset_hash, created_on, ack FROM reset_user_password WHERE reset_hash=%s;", params=[reset_hash])
-            resetpw = cursor.fetchone()
+            with self.appbuilder.sm.doris_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("SELECT id, reset_hash, created_on, ack FROM reset_user_password WHERE reset_hash=%s;", params=[reset_hash])
+                resetpw = cursor.fetchone()
+                cursor.close()
         except:
             resetpw = None
 
@@ -212,18 +211,17 @@ class ExtraResetPasswordView(ResetPasswordView):
             if not_expired:
                 # confirm user is validated by email
                 try:
-                    cursor.execute(
-                        "UPDATE reset_user_password SET ack = %s WHERE id = %s;",
-                        params=[True, resetpw["id"]]
-                    )
-                    connection.commit()
+                    with self.appbuilder.sm.doris_connection() as connection:
+                        cursor = connection.cursor()
+                        cursor.execute(
+                            "UPDATE reset_user_password SET ack = %s WHERE id = %s;",
+                            params=[True, resetpw["id"]]
+                        )
+                        connection.commit()
+                        cursor.close()
                 except Exception as e:
                     log.error(f"Error saving password reset hash confirmation to db. {str(e)} "
 """ Error saving password reset hash confirmation to db, format with err message """)
-                    connection.rollback()
-                finally:
-                    cursor.close()
-                    connection.close()
 
                 if g.user is not None and g.user.is_authenticated:
                     return redirect(
@@ -19,9 +19,13 @@
 
 import logging
 import re
+import threading
 import time
 import uuid
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
 
 from flask import current_app, Flask, flash, g, Request, url_for, render_template
@@ -54,6 +58,7 @@ from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import eagerload
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.orm.query import Query as SqlaQuery
+from sqlalchemy.pool import QueuePool
 
 from superset.constants import RouteMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -77,6 +82,7 @@ from superset.utils.core import (
     get_user_id,
     RowLevelSecurityFilterType,
 )
+from superset.utils.decorators import stats_timing
 from superset.utils.filters import get_dataset_access_filters
 from superset.utils.urls import get_url_host
 from .register import OrtegeRegisterView
@@ -364,6 +370,9 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
     resetmypasswordview = ExtraResetMyPasswordView
     resetpasswordview = ExtraResetPasswordView
 
+    _doris_pool: Optional[QueuePool] = None
+    _doris_pool_lock = threading.Lock()
+
     def create_login_manager(self, app: Flask) -> LoginManager:
         lm = super().create_login_manager(app)
         lm.request_loader(self.request_loader)
@@ -394,24 +403,78 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
 
         return f"[{database}].[{catalog}]"
 
-    def get_doris_connection(self):
-        host = self.appbuilder.app.config["DORIS_HOST"]
-        user = self.appbuilder.app.config["DORIS_USER"]
-        password = self.appbuilder.app.config["DORIS_PASSWORD"]
+    def get_doris_pool(self) -> QueuePool:
+        """
+        Return the pool of connections to the Doris store holding the password reset
+        hashes, creating it on first use.
+        """
+        with self._doris_pool_lock:
+            if self._doris_pool is None:
+                self._doris_pool = self._create_doris_pool()
+        return self._doris_pool
+
+    def _create_doris_pool(self) -> QueuePool:
+        # pylint: disable=import-outside-toplevel
+        from mysql import connector
+        from sqlalchemy.dialects.mysql.mysqlconnector import (
+            MySQLDialect_mysqlconnector,
+        )
+
+        config = self.appbuilder.app.config
+        host = config["DORIS_HOST"]
+        user = config["DORIS_USER"]
+        password = config["DORIS_PASSWORD"]
 
         if host is None or user is None or password is None:
             logger.error("Invalid doris config.")
             raise ValueError("Invalid doris config.")
 
-        connection = connector.connect(
-            host=host,
-            port="9030",
-            user=user,
-            password=password,
-            database="studio"
+        pool_config = config["DORIS_POOL_CONFIG"]
+
+        def connect() -> Any:
+            return connector.connect(
+                host=host,
+                port=config["DORIS_PORT"],
+                user=user,
+                password=password,
+                database=config["DORIS_DATABASE"],
+                connection_timeout=pool_config["CONNECT_TIMEOUT"],
+            )
+
+        # the dialect is only used to ping connections before handing them out
+        return QueuePool(
+            connect,
+            pool_size=pool_config["POOL_SIZE"],
+            max_overflow=pool_config["MAX_OVERFLOW"],
+            timeout=pool_config["TIMEOUT"],
+            recycle=pool_config["RECYCLE"],
+            pre_ping=True,
+            dialect=MySQLDialect_mysqlconnector(dbapi=connector),
         )
-        
-        return connection
+
+    def get_doris_connection(self) -> Any:
+        """
+        Check out a connection from the Doris pool; closing it returns it to the pool.
+        """
+        pool = self.get_doris_pool()
+        stats_logger = self.appbuilder.app.config["STATS_LOGGER"]
+        with stats_timing("doris_pool.wait", stats_logger):
+            return pool.connect()
+
+    @contextmanager
+    def doris_connection(self) -> Iterator[Any]:
+        """
+        Check out a connection from the Doris pool for the duration of the block,
+        rolling back if the block raises.
+        """
+        connection = self.get_doris_connection()
+        try:
+            yield connection
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
 
     def forgot_password(self, email):
         """
@@ -424,15 +487,13 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         self.reset_pw_hash(user)
 
     def get_reset_password_hash(self, user_id: int):
-        connection = self.get_doris_connection()
-        cursor = connection.cursor(dictionary=True)
-        
         try:
-            cursor.execute("SELECT id, reset_hash, created_on, ack FROM reset_user_password WHERE id=%s;", params=[user_id])
-            result = cursor.fetchone()
-            cursor.close()
-            connection.close()
-            return result
+            with self.doris_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("SELECT id, reset_hash, created_on, ack FROM reset_user_password WHERE id=%s;", params=[user_id])
+                result = cursor.fetchone()
+                cursor.close()
+                return result
         except:
             return None
 
@@ -450,43 +511,37 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 return True
             else:
                 # delete the password reset_hash
-                connection = self.get_doris_connection()
                 try:
-                    cursor = connection.cursor()
-                    
-                    cursor.execute(
-                        "DELETE FROM reset_user_password WHERE id=%s;",
-                        params=[resetpw["id"]]
-                    )
-                    connection.commit()
+                    with self.doris_connection() as connection:
+                        cursor = connection.cursor()
+
+                        cursor.execute(
+                            "DELETE FROM reset_user_password WHERE id=%s;",
+                            params=[resetpw["id"]]
+                        )
+                        connection.commit()
 
-                    cursor.close()
-                    connection.close()
+                        cursor.close()
                 except Exception as e:
                     logger.error(f"Error deleting the expired password reset hash from db. {str(e)}")
-                    connection.rollback()
         return
 
     def create_reset_pw_hash(self, user_id: int, reset_hash: str):
-        connection = self.get_doris_connection()
         try:
-            created_on = datetime.now()
-            cursor = connection.cursor()
-            cursor.execute(
-                "INSERT INTO reset_user_password (id, reset_hash, created_on, ack) VALUES ( %s, %s, %s, %s);",
-                params=[user_id, reset_hash, created_on.strftime('%Y-%m-%d %H:%M:%S'), False]
-            )
-            connection.commit()
+            with self.doris_connection() as connection:
+                created_on = datetime.now()
+                cursor = connection.cursor()
+                cursor.execute(
+                    "INSERT INTO reset_user_password (id, reset_hash, created_on, ack) VALUES ( %s, %s, %s, %s);",
+                    params=[user_id, reset_hash, created_on.strftime('%Y-%m-%d %H:%M:%S'), False]
+                )
+                connection.commit()
 
-            cursor.close()
-            connection.close()
-            return True
+                cursor.close()
+                return True
         except Exception as e:
             logger.error(f"Error adding new password reset hash to db. {str(e)} "
 """ Error adding password reset hash, format with err message """)
-
-            connection.rollback()
-            connection.close()
             return False
 
     def reset_pw_hash(self, user: object):
@@ -20,6 +20,7 @@ from __future__ import annotations
 import enum
 import logging
 import re
+import time
 import urllib.parse
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -34,6 +35,11 @@ from sqlglot.errors import ParseError
 from sqlglot.optimizer.scope import Scope, ScopeType, traverse_scope
 
 from superset.exceptions import SupersetParseError
+from superset.sql.parse_cache import (
+    get_parsed_statements,
+    ParsedStatement,
+    set_parsed_statements,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -141,8 +147,9 @@ class BaseSQLStatement(Generic[InternalRepresentation]):
     Base class for SQL statements.
 
     The class should be instantiated with a string representation of the script and, for
-    efficiency reasons, optionally with a pre-parsed AST. This is useful with
-    `sqlglot.parse`, which will split a script in multiple already parsed statements.
+    efficiency reasons, optionally with a pre-parsed AST and its tables. This is useful
+    with `sqlglot.parse`, which will split a script in multiple already parsed
+    statements, and with statements read from the parse cache.
 
     The `engine` parameters comes from the `engine` attribute in a Superset DB engine
     spec.
@@ -153,11 +160,16 @@ class BaseSQLStatement(Generic[InternalRepresentation]):
         statement: str,
         engine: str,
         ast: InternalRepresentation | None = None,
+        tables: set[Table] | None = None,
     ):
         self._sql = statement
         self._parsed = ast or self._parse_statement(statement, engine)
         self.engine = engine
-        self.tables = self._extract_tables_from_statement(self._parsed, self.engine)
+        self.tables = (
+            tables
+            if tables is not None
+            else self._extract_tables_from_statement(self._parsed, self.engine)
+        )
 
     @classmethod
     def split_script(
@@ -242,9 +254,19 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         statement: str,
         engine: str,
         ast: exp.Expression | None = None,
+        tables: set[Table] | None = None,
     ):
         self._dialect = SQLGLOT_DIALECTS.get(engine)
-        super().__init__(statement, engine, ast)
+        self._is_mutating: bool | None = None
+        if ast is None:
+            # the statement might be read from the parse cache, along with its tables
+            # and whether it's mutating, which don't need to be computed again
+            parsed_statement = self._get_single_statement(statement, engine)
+            ast = parsed_statement._parsed
+            if tables is None:
+                tables = parsed_statement.tables
+            self._is_mutating = parsed_statement.is_mutating()
+        super().__init__(statement, engine, ast, tables)
 
     @classmethod
     def _parse(cls, script: str, engine: str) -> list[exp.Expression]:
@@ -275,6 +297,51 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         cls,
         script: str,
         engine: str,
+    ) -> list[SQLStatement]:
+        """
+        Split a script into multiple instantiated statements.
+
+        Parsed statements are cached by the content of the script. Their ASTs are
+        copied from the cache, since ASTs are mutable.
+        """
+        # pylint: disable=protected-access
+        if (cached := get_parsed_statements(script, engine)) is not None:
+            statements = []
+            for parsed_statement in cached:
+                statement = cls(
+                    parsed_statement.sql,
+                    engine,
+                    parsed_statement.ast.copy(),
+                    set(parsed_statement.tables),
+                )
+                statement._is_mutating = parsed_statement.is_mutating
+                statements.append(statement)
+            return statements
+
+        start = time.perf_counter()
+        statements = cls._split_script(script, engine)
+        duration_ms = (time.perf_counter() - start) * 1000
+        set_parsed_statements(
+            script,
+            engine,
+            [
+                ParsedStatement(
+                    sql=statement._sql,
+                    ast=statement._parsed.copy(),
+                    tables=frozenset(statement.tables),
+                    is_mutating=statement.is_mutating(),
+                )
+                for statement in statements
+            ],
+            duration_ms,
+        )
+        return statements
+
+    @classmethod
+    def _split_script(
+        cls,
+        script: str,
+        engine: str,
     ) -> list[SQLStatement]:
         if dialect := SQLGLOT_DIALECTS.get(engine):
             try:
@@ -319,19 +386,31 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         return statements
 
     @classmethod
-    def _parse_statement(
+    def _get_single_statement(
         cls,
         statement: str,
         engine: str,
-    ) -> exp.Expression:
+    ) -> SQLStatement:
         """
-        Parse a single SQL statement.
+        Split a string containing a single SQL statement.
         """
         statements = cls.split_script(statement, engine)
         if len(statements) != 1:
             raise SupersetParseError("SQLStatement should have exactly one statement")
 
-        return statements[0]._parsed  # pylint: disable=protected-access
+        return statements[0]
+
+    @classmethod
+    def _parse_statement(
+        cls,
+        statement: str,
+        engine: str,
+    ) -> exp.Expression:
+        """
+        Parse a single SQL statement.
+        """
+        parsed_statement = cls._get_single_statement(statement, engine)
+        return parsed_statement._parsed  # pylint: disable=protected-access
 
     @classmethod
     def _extract_tables_from_statement(
@@ -351,6 +430,11 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
 
         :return: True if the statement mutates data.
         """
+        if self._is_mutating is None:
+            self._is_mutating = self._check_mutating()
+        return self._is_mutating
+
+    def _check_mutating(self) -> bool:
         for node in self._parsed.walk():
             if isinstance(
                 node,
@@ -0,0 +1,195 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of parsed SQL.
+
+The same SQL, like the one of virtual datasets and saved queries, is parsed on every
+request, and parsing large scripts and extracting their tables takes tens of
+milliseconds. Parsed statements are cached by a hash of the script and engine, in a
+bounded in-process LRU and, optionally, in a cache shared by the workers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+from flask import current_app, has_app_context
+from flask_caching.backends import NullCache
+from sqlglot import exp
+
+if TYPE_CHECKING:
+    from superset.sql.parse import Table
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParsedStatement:
+    """
+    A statement parsed from a script, with its tables and mutation flag.
+
+    The AST is shared by the cache, and must be copied before being used.
+    """
+
+    sql: str
+    ast: exp.Expression
+    tables: frozenset[Table]
+    is_mutating: bool
+
+    def dump(self) -> dict[str, Any]:
+        return {
+            "sql": self.sql,
+            "ast": self.ast.dump(),
+            "tables": [
+                [table.table, table.schema, table.catalog] for table in self.tables
+            ],
+            "is_mutating": self.is_mutating,
+        }
+
+    @classmethod
+    def load(cls, payload: dict[str, Any]) -> ParsedStatement:
+        # pylint: disable=import-outside-toplevel
+        from superset.sql.parse import Table
+
+        return cls(
+            sql=payload["sql"],
+            ast=exp.Expression.load(payload["ast"]),
+            tables=frozenset(Table(*table) for table in payload["tables"]),
+            is_mutating=payload["is_mutating"],
+        )
+
+
+class SQLParseCache:
+    """
+    In-process LRU cache of parsed scripts, bounded by the number of scripts.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, list[ParsedStatement]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[ParsedStatement] | None:
+        with self._lock:
+            if (statements := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+            return statements
+
+    def set(self, key: str, statements: list[ParsedStatement]) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = statements
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_local_cache: SQLParseCache | None = None
+
+
+def get_local_cache() -> SQLParseCache:
+    global _local_cache  # pylint: disable=global-statement
+    if _local_cache is None:
+        _local_cache = SQLParseCache(current_app.config["SQL_PARSE_CACHE_SIZE"])
+    return _local_cache
+
+
+def get_cache_key(script: str, engine: str) -> str:
+    return hashlib.sha256(f"{engine}\0{script}".encode("utf-8")).hexdigest()
+
+
+def get_parsed_statements(script: str, engine: str) -> list[ParsedStatement] | None:
+    """
+    Return the cached statements of a script, if any.
+
+    :param script: The script
+    :param engine: The engine of the script
+    :returns: The statements of the script, or `None` if it isn't cached
+    """
+    if not has_app_context():
+        return None
+
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager, stats_logger_manager
+
+    key = get_cache_key(script, engine)
+    local_cache = get_local_cache()
+    if (statements := local_cache.get(key)) is not None:
+        stats_logger_manager.instance.incr("sql_parse_cache.hit")
+        return statements
+
+    shared_cache = cache_manager.sql_parse_cache
+    if not isinstance(shared_cache.cache, NullCache):
+        try:
+            payload = shared_cache.get(key)
+            if payload is not None:
+                statements = [ParsedStatement.load(item) for item in payload]
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not read parsed SQL from cache", exc_info=True)
+        if statements is not None:
+            stats_logger_manager.instance.incr("sql_parse_cache.shared_hit")
+            local_cache.set(key, statements)
+            return statements
+
+    stats_logger_manager.instance.incr("sql_parse_cache.miss")
+    return None
+
+
+def set_parsed_statements(
+    script: str,
+    engine: str,
+    statements: list[ParsedStatement],
+    duration_ms: float,
+) -> None:
+    """
+    Cache the statements of a script.
+
+    :param script: The script
+    :param engine: The engine of the script
+    :param statements: The statements of the script
+    :param duration_ms: How long parsing the script took, in milliseconds
+    """
+    if not has_app_context():
+        return
+
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager, stats_logger_manager
+
+    stats_logger_manager.instance.timing("sql_parse.time", duration_ms)
+
+    key = get_cache_key(script, engine)
+    get_local_cache().set(key, statements)
+
+    shared_cache = cache_manager.sql_parse_cache
+    if not isinstance(shared_cache.cache, NullCache):
+        try:
+            shared_cache.set(key, [statement.dump() for statement in statements])
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not write parsed SQL to cache", exc_info=True)
@@ -59,14 +59,16 @@ from superset.sql_parse import (
     insert_rls_in_predicate,
     ParsedQuery,
 )
+from superset.sqllab import results_codec
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
-from superset.utils import json
-from superset.utils.core import (
-    override_user,
-    QuerySource,
-    zlib_compress,
+from superset.sqllab.utils import (
+    IPCBatchWriter,
+    store_ipc_batches,
+    write_ipc_batches,
+    write_ipc_buffer,
 )
+from superset.utils import json
+from superset.utils.core import override_user, QuerySource
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
 
@@ -76,6 +78,9 @@ SQLLAB_TIMEOUT = config["SQLLAB_ASYNC_TIME_LIMIT_SEC"]
 SQLLAB_HARD_TIMEOUT = SQLLAB_TIMEOUT + 60
 SQL_MAX_ROW = config["SQL_MAX_ROW"]
 SQLLAB_CTAS_NO_LIMIT = config["SQLLAB_CTAS_NO_LIMIT"]
+RESULT_SET_COLUMNAR_INGESTION = config["RESULT_SET_COLUMNAR_INGESTION"]
+SQLLAB_RESULTS_BATCH_ROWS = config["SQLLAB_RESULTS_BATCH_ROWS"]
+SQLLAB_STREAM_RESULTS = config["SQLLAB_STREAM_RESULTS"]
 log_query = config["QUERY_LOGGER"]
 logger = logging.getLogger(__name__)
 
@@ -195,14 +200,20 @@ def get_sql_results(  # pylint: disable=too-many-arguments
                 return handle_query_error(ex, query)
 
 
-def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-locals
+def execute_sql_statement(  # pylint: disable=too-many-arguments, too-many-statements, too-many-locals
     sql_statement: str,
     query: Query,
     cursor: Any,
     log_params: Optional[dict[str, Any]],
     apply_ctas: bool = False,
-) -> SupersetResultSet:
-    """Executes a single SQL statement"""
+    results_writer: Optional[IPCBatchWriter] = None,
+) -> Optional[SupersetResultSet]:
+    """
+    Executes a single SQL statement
+
+    When a `results_writer` is passed the results are fetched in chunks and written
+    to it as they're fetched, and no result set is returned.
+    """
     database: Database = query.database
     db_engine_spec = database.db_engine_spec
 
@@ -307,12 +318,10 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                     query.id,
                     str(query.to_dict()),
                 )
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
-                if query.limit is None or len(data) <= query.limit:
-                    query.limiting_factor = LimitingFactor.NOT_LIMITED
-                else:
-                    # return 1 row less than increased_query
-                    data = data[:-1]
+                if results_writer:
+                    _stream_results(cursor, query, results_writer, increased_limit)
+                    return None
+                data = _fetch_results(cursor, query, increased_limit)
     except SoftTimeLimitExceeded as ex:
         query.status = QueryStatus.TIMED_OUT
 
@@ -344,7 +353,64 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
 
     logger.debug("Query %d: Fetching cursor description", query.id)
     cursor_description = cursor.description
-    return SupersetResultSet(data, cursor_description, db_engine_spec)
+    return SupersetResultSet(
+        data,
+        cursor_description,
+        db_engine_spec,
+        columnar=RESULT_SET_COLUMNAR_INGESTION,
+    )
+
+
+def _fetch_results(
+    cursor: Any,
+    query: Query,
+    increased_limit: Optional[int],
+) -> Any:
+    db_engine_spec = query.database.db_engine_spec
+    data = None
+    if RESULT_SET_COLUMNAR_INGESTION:
+        data = db_engine_spec.fetch_data_columnar(cursor, increased_limit)
+    if data is None:
+        data = db_engine_spec.fetch_data(cursor, increased_limit)
+    if query.limit is None or len(data) <= query.limit:
+        query.limiting_factor = LimitingFactor.NOT_LIMITED
+    else:
+        # return 1 row less than increased_query
+        data = data[:-1]
+    return data
+
+
+def _stream_results(
+    cursor: Any,
+    query: Query,
+    results_writer: IPCBatchWriter,
+    increased_limit: Optional[int],
+) -> None:
+    db_engine_spec = query.database.db_engine_spec
+    rows = 0
+    limited = False
+    for data in db_engine_spec.fetch_data_chunks(
+        cursor,
+        results_writer.batch_rows,
+        increased_limit,
+    ):
+        if query.limit is not None and rows + len(data) > query.limit:
+            # drop the row past the limit
+            data = data[: query.limit - rows]
+            limited = True
+        rows += len(data)
+        results_writer.write(
+            SupersetResultSet(
+                data,
+                cursor.description,
+                db_engine_spec,
+                columnar=RESULT_SET_COLUMNAR_INGESTION,
+            )
+        )
+    results_writer.close()
+
+    if not limited:
+        query.limiting_factor = LimitingFactor.NOT_LIMITED
 
 
 def apply_limit_if_exists(
@@ -375,7 +441,8 @@ def _serialize_and_expand_data(
     db_engine_spec: BaseEngineSpec,
     use_msgpack: Optional[bool] = False,
     expand_data: bool = False,
-) -> tuple[Union[bytes, str], list[Any], list[Any], list[Any]]:
+    batch_rows: Optional[int] = None,
+) -> tuple[Union[bytes, str, list[bytes]], list[Any], list[Any], list[Any]]:
     selected_columns = result_set.columns
     all_columns: list[Any]
     expanded_columns: list[Any]
@@ -384,7 +451,10 @@ def _serialize_and_expand_data(
         with stats_timing(
             "sqllab.query.results_backend_pa_serialization", stats_logger
         ):
-            data = write_ipc_buffer(result_set.pa_table).to_pybytes()
+            if batch_rows:
+                data = write_ipc_batches(result_set.pa_table, batch_rows)
+            else:
+                data = write_ipc_buffer(result_set.pa_table).to_pybytes()
 
         # expand when loading data from results backend
         all_columns, expanded_columns = (selected_columns, [])
@@ -487,6 +557,25 @@ def execute_sql_statements(
             )
         )
 
+    cache_timeout = database.cache_timeout
+    if cache_timeout is None:
+        cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+    use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
+    batch_rows = SQLLAB_RESULTS_BATCH_ROWS if use_arrow_data else None
+    key = str(uuid.uuid4())
+
+    # the results of asynchronous queries can be written to the results backend as
+    # they're fetched, rather than once they've all been fetched
+    results_writer = (
+        IPCBatchWriter(key, batch_rows, cache_timeout)
+        if SQLLAB_STREAM_RESULTS
+        and batch_rows
+        and results_backend
+        and not return_results
+        else None
+    )
+
     with database.get_raw_connection(
         catalog=query.catalog,
         schema=query.schema,
@@ -527,6 +616,7 @@ def execute_sql_statements(
                     cursor,
                     log_params,
                     apply_ctas,
+                    results_writer=results_writer if i == statement_count - 1 else None,
                 )
             except SqlLabQueryStoppedException:
                 payload.update({"status": QueryStatus.STOPPED})
@@ -554,10 +644,16 @@ def execute_sql_statements(
             conn.commit()
 
     # Success, updating the query entry in database
-    query.rows = result_set.size
+    if results_writer:
+        query.rows = results_writer.rows
+        columns = results_writer.columns
+    else:
+        result_set = cast(SupersetResultSet, result_set)
+        query.rows = result_set.size
+        columns = result_set.columns
     query.progress = 100
     query.set_extra_json_key("progress", None)
-    query.set_extra_json_key("columns", result_set.columns)
+    query.set_extra_json_key("columns", columns)
     if query.select_as_cta:
         query.select_sql = database.select_star(
             Table(query.tmp_table_name, query.tmp_schema_name),
@@ -567,10 +663,20 @@ def execute_sql_statements(
         )
     query.end_time = now_as_float()
 
-    use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
-    )
+    if results_writer:
+        # the batches of the results are already stored
+        data: Any = None
+        selected_columns = all_columns = columns
+        expanded_columns: list[Any] = []
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data, batch_rows
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -586,23 +692,37 @@ def execute_sql_statements(
     payload["query"]["state"] = QueryStatus.SUCCESS
 
     if store_results and results_backend:
-        key = str(uuid.uuid4())
         payload["query"]["resultsKey"] = key
         logger.info(
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
         )
         with stats_timing("sqllab.query.results_backend_write", stats_logger):
+            stored_payload = payload
+            if results_writer:
+                stored_payload = {
+                    **payload,
+                    "batch_rows": results_writer.batch_rows,
+                    "batch_count": results_writer.batch_count,
+                }
+            elif batch_rows:
+                # the batches are stored before the payload which indexes them, so
+                # that they can be read as soon as the payload is
+                store_ipc_batches(key, cast(list[bytes], data), cache_timeout)
+                stored_payload = {
+                    **payload,
+                    "data": None,
+                    "batch_rows": batch_rows,
+                    "batch_count": len(data),
+                }
+
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
                 serialized_payload = _serialize_payload(
-                    payload, cast(bool, results_backend_use_msgpack)
+                    stored_payload, cast(bool, results_backend_use_msgpack)
                 )
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
 
-            compressed = zlib_compress(serialized_payload)
+            compressed = results_codec.compress(serialized_payload)
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
@@ -15,7 +15,6 @@
 # specific language governing permissions and limitations
 # under the License.
 
-# pylint: disable=too-many-lines
 from __future__ import annotations
 
 from __future__ import annotations
@@ -62,7 +61,6 @@ from superset.exceptions import (
     SupersetSecurityException,
 )
 from superset.sql.parse import (
-    extract_tables_from_statement,
     SQLGLOT_DIALECTS,
     SQLScript,
     SQLStatement,
@@ -265,10 +263,7 @@ class ParsedQuery:
         Note: this uses sqlglot, since it's better at catching more edge cases.
         """
         try:
-            statements = [
-                statement._parsed  # pylint: disable=protected-access
-                for statement in SQLScript(self.stripped(), self._engine).statements
-            ]
+            statements = SQLScript(self.stripped(), self._engine).statements
         except SupersetParseError as ex:
             logger.warning("Unable to parse SQL (%s): %s", self._dialect, self.sql)
             raise SupersetSecurityException(
@@ -281,12 +276,7 @@ class ParsedQuery:
                 )
             ) from ex
 
-        return {
-            table
-            for statement in statements
-            for table in extract_tables_from_statement(statement, self._dialect)
-            if statement
-        }
+        return {table for statement in statements for table in statement.tables}
 
     @property
     def limit(self) -> int | None:
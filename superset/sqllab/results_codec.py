@@ -0,0 +1,197 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the blobs of SQL Lab results stored in the results backend.
+
+Blobs are prefixed by a header naming the codec that compressed them, so that they're
+always decompressed with the right codec, and the codec can be changed without
+flushing the results backend. Blobs without a header are zlib streams, as written
+before codecs were introduced.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+
+import pyarrow as pa
+from flask import current_app
+
+# the first byte of a zlib stream is 0x?8, so blobs starting with the magic bytes
+# can't be mistaken for zlib streams
+MAGIC = b"SRC1"
+HEADER = struct.Struct(">4sB")
+SIZE = struct.Struct(">Q")
+
+
+class ResultsCodec(ABC):
+    """
+    Compresses and decompresses the blobs stored in the results backend.
+    """
+
+    name: str
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes: ...
+
+    @abstractmethod
+    def decompress(self, data: bytes, size: int) -> bytes:
+        """
+        :param data: The compressed data
+        :param size: The size of the decompressed data
+        """
+
+
+class ZlibResultsCodec(ResultsCodec):
+    """
+    Compress blobs with zlib.
+
+    The blobs are written without a header, so that they can be read by workers
+    running a version of Superset that predates codecs.
+    """
+
+    name = "zlib"
+
+    def __init__(self, level: int = -1) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes, size: int) -> bytes:
+        return zlib.decompress(data)
+
+
+class ArrowResultsCodec(ResultsCodec):
+    """
+    Compress blobs with one of the codecs bundled with PyArrow, eg, ``zstd`` or
+    ``lz4``.
+    """
+
+    def __init__(self, name: str = "zstd", level: int | None = None) -> None:
+        """
+        :param name: The name of the codec, see ``pyarrow.Codec``
+        :param level: The compression level, when supported by the codec
+        """
+        self.name = name
+        self.level = level
+        self._codec = pa.Codec(name, level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._codec.compress(data, asbytes=True)
+
+    def decompress(self, data: bytes, size: int) -> bytes:
+        return self._codec.decompress(data, decompressed_size=size, asbytes=True)
+
+
+def get_codec(name: str, codec: ResultsCodec | None = None) -> ResultsCodec:
+    """
+    Return a codec able to decompress the blobs compressed by the codec `name`.
+
+    :param name: The name of the codec in the header of the blob
+    :param codec: The configured codec, used when it has the same name
+    :raises ValueError: If the codec is unknown
+    """
+    if codec is not None and codec.name == name:
+        return codec
+    if name == ZlibResultsCodec.name:
+        return ZlibResultsCodec()
+    try:
+        if pa.Codec.is_available(name):
+            return ArrowResultsCodec(name)
+    except ValueError:
+        pass
+    raise ValueError(f"Unknown results codec: {name}")
+
+
+def compress(data: bytes | str, codec: ResultsCodec | None = None) -> bytes:
+    """
+    Compress a blob, prefixing it with a header naming the codec.
+
+    :param data: The blob, strings are encoded as UTF-8
+    :param codec: The codec to compress the blob with, `RESULTS_BACKEND_CODEC` by
+        default
+    :returns: The compressed blob
+    """
+    codec = codec or current_app.config["RESULTS_BACKEND_CODEC"]
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    start = time.perf_counter()
+    compressed = codec.compress(data)
+    _log_stats(codec, "compress", start, len(data), len(compressed))
+    if isinstance(codec, ZlibResultsCodec):
+        return compressed
+
+    name = codec.name.encode("utf-8")
+    return b"".join(
+        [HEADER.pack(MAGIC, len(name)), name, SIZE.pack(len(data)), compressed]
+    )
+
+
+def decompress(
+    blob: bytes,
+    decode: bool | None = True,
+    codec: ResultsCodec | None = None,
+) -> bytes | str:
+    """
+    Decompress a blob with the codec named in its header.
+
+    :param blob: The compressed blob
+    :param decode: Whether to decode the blob as a UTF-8 string
+    :param codec: The configured codec, `RESULTS_BACKEND_CODEC` by default
+    :returns: The decompressed blob
+    """
+    codec = codec or current_app.config["RESULTS_BACKEND_CODEC"]
+    if blob[: len(MAGIC)] == MAGIC:
+        _, name_size = HEADER.unpack_from(blob)
+        offset = HEADER.size + name_size
+        name = blob[HEADER.size : offset].decode("utf-8")
+        (size,) = SIZE.unpack_from(blob, offset)
+        compressed = memoryview(blob)[offset + SIZE.size :]
+        codec = get_codec(name, codec)
+    else:
+        size = 0
+        compressed = memoryview(blob)
+        codec = get_codec(ZlibResultsCodec.name, codec)
+
+    start = time.perf_counter()
+    data = codec.decompress(compressed, size)  # type: ignore
+    _log_stats(codec, "decompress", start, len(data), len(compressed))
+    return data.decode("utf-8") if decode else data
+
+
+def _log_stats(
+    codec: ResultsCodec,
+    operation: str,
+    start: float,
+    size: int,
+    compressed_size: int,
+) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import stats_logger_manager
+
+    stats_logger = stats_logger_manager.instance
+    duration_ms = (time.perf_counter() - start) * 1000
+    stats_logger.timing(f"results_backend.{codec.name}.{operation}_time", duration_ms)
+    if operation == "compress" and compressed_size:
+        stats_logger.gauge(
+            f"results_backend.{codec.name}.compression_ratio",
+            size / compressed_size,
+        )
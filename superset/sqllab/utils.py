@@ -16,14 +16,20 @@
 # under the License.
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 import pyarrow as pa
 
-from superset import db, is_feature_enabled
+from superset import db, is_feature_enabled, results_backend
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
+from superset.exceptions import SerializationError
 from superset.models.sql_lab import TabState
+from superset.sqllab import results_codec
+from superset.superset_typing import ResultSetColumnType
+
+if TYPE_CHECKING:
+    from superset.result_set import SupersetResultSet
 
 DATABASE_KEYS = [
     "allow_file_upload",
@@ -80,6 +86,195 @@ def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
     return sink.getvalue()
 
 
+def get_batch_key(key: str, index: int) -> str:
+    return f"{key}-{index}"
+
+
+def write_ipc_batches(table: pa.Table, batch_rows: int) -> list[bytes]:
+    """
+    Split a table in IPC streams of at most `batch_rows` rows each.
+
+    There's always at least one batch, so that the schema of an empty table is kept.
+
+    :param table: The table to split
+    :param batch_rows: The maximum number of rows of a batch
+    :returns: The IPC streams of the batches
+    """
+    return [
+        write_ipc_buffer(table.slice(offset, batch_rows)).to_pybytes()
+        for offset in range(0, table.num_rows or 1, batch_rows)
+    ]
+
+
+def store_ipc_batches(key: str, batches: list[bytes], timeout: int | None) -> None:
+    """
+    Store each batch of a result set under its own key in the results backend.
+    """
+    results_backend.set_many(
+        {
+            get_batch_key(key, index): results_codec.compress(batch)
+            for index, batch in enumerate(batches)
+        },
+        timeout,
+    )
+
+
+class IPCBatchWriter:
+    """
+    Store the rows of a result set in the results backend as they're fetched.
+
+    The rows are stored in batches of `batch_rows` rows, each compressed and stored
+    under its own key as soon as it's full, so that only about a batch of rows is
+    held in memory at a time. The batches are read back with `read_ipc_batches`.
+    """
+
+    def __init__(self, key: str, batch_rows: int, timeout: int | None) -> None:
+        self.key = key
+        self.batch_rows = batch_rows
+        self.timeout = timeout
+        self.rows = 0
+        self.batch_count = 0
+        self.columns: list[ResultSetColumnType] = []
+        self._pending: list[pa.Table] = []
+        self._pending_rows = 0
+
+    def write(self, result_set: SupersetResultSet) -> None:
+        """
+        Add the rows of a chunk of the results, storing the batches they fill.
+        """
+        table = result_set.pa_table
+        if not table.num_rows:
+            return
+
+        if not self.columns:
+            self.columns = result_set.columns
+        else:
+            # the type of a column is unknown until a chunk has a value for it
+            self.columns = [
+                column if column["type"] is not None else chunk_column
+                for column, chunk_column in zip(self.columns, result_set.columns)
+            ]
+        self.rows += table.num_rows
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        while self._pending_rows >= self.batch_rows:
+            pending = concat_batches(self._pending)
+            self._store(pending.slice(0, self.batch_rows))
+            self._pending = [pending.slice(self.batch_rows)]
+            self._pending_rows -= self.batch_rows
+
+    def close(self) -> None:
+        """
+        Store the last batch of the results.
+
+        There's always at least one batch, so that empty results can be read back.
+        """
+        if self._pending_rows or not self.batch_count:
+            self._store(
+                concat_batches(self._pending) if self._pending else pa.table({})
+            )
+        self._pending = []
+        self._pending_rows = 0
+
+    def _store(self, table: pa.Table) -> None:
+        results_backend.set(
+            get_batch_key(self.key, self.batch_count),
+            results_codec.compress(write_ipc_buffer(table).to_pybytes()),
+            self.timeout,
+        )
+        self.batch_count += 1
+
+
+def concat_batches(tables: list[pa.Table]) -> pa.Table:
+    """
+    Concatenate the batches of a result set.
+
+    The types of the columns of results stored by `IPCBatchWriter` are inferred from
+    the rows of each chunk, so they can differ between batches. They're promoted to a
+    common type, and columns of incompatible types are read as strings.
+
+    :param tables: The batches
+    :returns: The rows of all the batches
+    """
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        fields: dict[str, list[pa.Field]] = {}
+        for table in tables:
+            for field in table.schema:
+                fields.setdefault(field.name, []).append(field)
+
+        mismatched = set()
+        for name, fields_ in fields.items():
+            try:
+                pa.unify_schemas(
+                    [pa.schema([field]) for field in fields_],
+                    promote_options="permissive",
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                mismatched.add(name)
+
+        return pa.concat_tables(
+            [
+                pa.table(
+                    {
+                        name: column.cast(pa.string()) if name in mismatched else column
+                        for name, column in zip(table.column_names, table.columns)
+                    }
+                )
+                for table in tables
+            ],
+            promote_options="permissive",
+        )
+
+
+def read_ipc_batches(
+    key: str,
+    batch_rows: int,
+    batch_count: int,
+    offset: int = 0,
+    limit: int | None = None,
+) -> pa.Table:
+    """
+    Read a range of rows of a result set stored in batches.
+
+    Only the batches overlapping the range are read from the results backend and
+    decoded.
+
+    :param key: The key of the results
+    :param batch_rows: The maximum number of rows of a batch
+    :param batch_count: The number of batches
+    :param offset: The first row to read
+    :param limit: The maximum number of rows to read, or all the remaining rows
+    :returns: The rows in the range
+    :raises SerializationError: If a batch is missing or can't be decoded
+    """
+    first = min(offset // batch_rows, batch_count - 1)
+    last = batch_count - 1
+    if limit is not None:
+        last = max(first, min((offset + limit - 1) // batch_rows, last))
+
+    blobs = results_backend.get_many(
+        *[get_batch_key(key, index) for index in range(first, last + 1)]
+    )
+    if any(blob is None for blob in blobs):
+        raise SerializationError("Unable to read the batches of the results")
+
+    try:
+        table = concat_batches(
+            [
+                pa.ipc.open_stream(
+                    pa.BufferReader(results_codec.decompress(blob, decode=False))
+                ).read_all()
+                for blob in blobs
+            ]
+        )
+    except pa.ArrowSerializationError as ex:
+        raise SerializationError("Unable to deserialize table") from ex
+
+    return table.slice(offset - first * batch_rows, limit)
+
+
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
@@ -84,6 +84,12 @@ def load_chart_data_into_cache(
     job_metadata: dict[str, Any],
     form_data: dict[str, Any],
 ) -> None:
+    """
+    Run a chart data query and cache its results.
+
+    Jobs with `refresh` set in their metadata refresh stale results in the
+    background, and have no client waiting for their completion.
+    """
     # pylint: disable=import-outside-toplevel
     from superset.commands.chart.data.get_data_command import ChartDataCommand
 
@@ -93,6 +99,8 @@ def load_chart_data_into_cache(
             query_context = _create_query_context_from_form(form_data)
             command = ChartDataCommand(query_context)
             result = command.run(cache=True)
+            if job_metadata.get("refresh"):
+                return
             cache_key = result["cache_key"]
             result_url = f"/api/v1/chart/data/{cache_key}"
             async_query_manager.update_job(
@@ -104,6 +112,8 @@ def load_chart_data_into_cache(
             logger.warning("A timeout occurred while loading chart data, error: %s", ex)
             raise
         except Exception as ex:
+            if job_metadata.get("refresh"):
+                raise
             # TODO: QueryContext should support SIP-40 style errors
             error = str(ex.message if hasattr(ex, "message") else ex)
             errors = [{"message": error}]
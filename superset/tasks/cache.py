@@ -14,30 +14,48 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import heapq
 import logging
-from typing import Any, Optional, Union
+import math
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, cast, Optional, Union
 from urllib import request
 from urllib.error import URLError
 
+from cachelib.redis import RedisCache
 from celery.beat import SchedulingError
 from celery.utils.log import get_task_logger
+from flask import Flask
+from flask_appbuilder.security.sqla.models import User
 from sqlalchemy import and_, func
 
 from superset import app, db, security_manager
-from superset.extensions import celery_app
-from superset.models.core import Log
+from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+from superset.connectors.sqla.models import SqlaTable
+from superset.extensions import cache_manager, celery_app, stats_logger_manager
+from superset.models.core import Database, Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.tags.models import Tag, TaggedObject
 from superset.tasks.utils import fetch_csrf_token
 from superset.utils import json
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path
+from superset.viz import viz_types
 
 logger = get_task_logger(__name__)
 logger.setLevel(logging.INFO)
 
+# how long the duration of the last warm up of a chart is kept
+DURATION_TIMEOUT = int(timedelta(days=30).total_seconds())
+
 
 def get_payload(chart: Slice, dashboard: Optional[Dashboard] = None) -> dict[str, int]:
     """Return payload for warming up a given chart/table cache."""
@@ -47,7 +65,12 @@ def get_payload(chart: Slice, dashboard: Optional[Dashboard] = None) -> dict[str
     return payload
 
 
-class Strategy:  # pylint: disable=too-few-public-methods
+def get_duration_cache_key(chart_id: int) -> str:
+    """Return the cache key of the duration of the last warm up of a chart"""
+    return f"cache_warmup:duration:{chart_id}"
+
+
+class Strategy:
     """
     A cache warm up strategy.
 
@@ -76,8 +99,12 @@ class Strategy:  # pylint: disable=too-few-public-methods
     def get_payloads(self) -> list[dict[str, int]]:
         raise NotImplementedError("Subclasses must implement get_payloads!")
 
+    def get_report(self) -> Optional[dict[str, Any]]:
+        """Return a report on the payloads, once they're returned"""
+        return None
 
-class DummyStrategy(Strategy):  # pylint: disable=too-few-public-methods
+
+class DummyStrategy(Strategy):
     """
     Warm up all charts.
 
@@ -99,7 +126,7 @@ class DummyStrategy(Strategy):  # pylint: disable=too-few-public-methods
         return [get_payload(chart) for chart in db.session.query(Slice).all()]
 
 
-class TopNDashboardsStrategy(Strategy):  # pylint: disable=too-few-public-methods
+class TopNDashboardsStrategy(Strategy):
     """
     Warm up charts in the top-n dashboards.
 
@@ -145,7 +172,7 @@ class TopNDashboardsStrategy(Strategy):  # pylint: disable=too-few-public-method
         ]
 
 
-class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
+class DashboardTagsStrategy(Strategy):
     """
     Warm up charts in dashboards with custom tags.
 
@@ -210,7 +237,511 @@ class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
         return payloads
 
 
-strategies = [DummyStrategy, TopNDashboardsStrategy, DashboardTagsStrategy]
+class PriorityStrategy(Strategy):
+    """
+    Warm up the charts whose cache misses would cost users the most latency, within
+    a budget of warehouse seconds.
+
+    The score of a chart is the latency its warm up is expected to save before the
+    next run, in `interval` seconds: the duration of its queries, times the
+    probability that it's requested between the expiry of its cached queries and the
+    next run, given how often it was requested `since` according to the logs. Charts
+    are warmed up by decreasing score, as long as their durations fit in `budget`.
+
+    The duration of a chart is the one measured by its last in process warm up, or
+    the longest request for its data in the logs otherwise.
+
+    Each run reports the requests expected for the charts warmed up by the previous
+    run, and the requests that actually were logged since.
+
+        beat_schedule = {
+            'cache-warmup-hourly': {
+                'task': 'cache-warmup',
+                'schedule': crontab(minute=1, hour='*'),  # @hourly
+                'kwargs': {
+                    'strategy_name': 'priority',
+                    'budget': 600,
+                    'interval': 3600,
+                    'since': '7 days ago',
+                },
+            },
+        }
+
+    """
+
+    name = "priority"
+
+    # actions logged when the data of a chart is requested
+    actions = ("ChartDataRestApi.data", "explore_json")
+
+    # cache key of the charts warmed up by the last run
+    last_run_cache_key = "cache_warmup:priority:last_run"
+
+    def __init__(
+        self,
+        budget: float = 600,
+        interval: int = 3600,
+        since: str = "7 days ago",
+        default_duration: float = 1.0,
+    ) -> None:
+        """
+        :param budget: The warehouse seconds a run can spend
+        :param interval: The seconds between runs
+        :param since: The start of the logs the request rates are computed from
+        :param default_duration: The duration, in seconds, of charts never measured
+        """
+        super().__init__()
+        self.budget = budget
+        self.interval = interval
+        self.since = parse_human_datetime(since)
+        self.default_duration = default_duration
+        self.report: Optional[dict[str, Any]] = None
+
+    @staticmethod
+    def get_remaining_timeout(cache_key: str) -> Optional[int]:
+        """
+        Return the number of seconds before a query result expires from the data
+        cache, 0 if it's not cached, or `None` if it never expires.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.common.utils.query_cache_manager import (
+            get_remaining_timeout,
+        )
+
+        backend = cache_manager.data_cache.cache
+        if isinstance(backend, RedisCache):
+            # reading the TTL spares loading the result from Redis
+            client = backend._read_client  # pylint: disable=protected-access
+            ttl = client.ttl(backend.key_prefix + cache_key)
+            if ttl == -1:
+                return None
+            swr_config = app.config["STALE_WHILE_REVALIDATE_CONFIG"]
+            if swr_config["ENABLED"]:
+                ttl -= swr_config["GRACE_PERIOD"]
+            return max(ttl, 0)
+
+        if not (value := cache_manager.data_cache.get(cache_key)):
+            return 0
+        remaining_timeout = get_remaining_timeout(value)
+        return None if remaining_timeout is None else max(remaining_timeout, 0)
+
+    def get_requests(
+        self,
+        chart_ids: Optional[list[int]] = None,
+        since: Optional[datetime] = None,
+    ) -> dict[int, tuple[int, Optional[int]]]:
+        """
+        Return the number of requests for the data of charts, and the duration of
+        the longest of them in milliseconds, by chart ID.
+        """
+        query = db.session.query(
+            Log.slice_id,
+            func.count(Log.id),
+            func.max(Log.duration_ms),
+        ).filter(
+            Log.action.in_(self.actions),
+            Log.slice_id.isnot(None),
+            Log.dttm >= (since or self.since),
+        )
+        if chart_ids is not None:
+            query = query.filter(Log.slice_id.in_(chart_ids))
+        return {
+            chart_id: (count, duration_ms)
+            for chart_id, count, duration_ms in query.group_by(Log.slice_id)
+        }
+
+    def get_scores(self) -> list[dict[str, Any]]:
+        """
+        Return the charts requested since `since`, with their score, expected
+        requests before the next run and duration, by decreasing score.
+        """
+        window = max((datetime.now() - self.since).total_seconds(), 1)
+        requests = self.get_requests()
+        charts = db.session.query(Slice).filter(Slice.id.in_(requests)).all()
+        durations = cache_manager.cache.get_dict(
+            *[get_duration_cache_key(chart.id) for chart in charts]
+        )
+
+        scores = []
+        for chart in charts:
+            count, duration_ms = requests[chart.id]
+            duration = durations.get(get_duration_cache_key(chart.id))
+            if duration is None:
+                duration = duration_ms / 1000 if duration_ms else self.default_duration
+
+            # charts whose cache keys are unknown until they run are deemed expired
+            remaining_timeouts = [
+                self.get_remaining_timeout(cache_key)
+                for cache_key in InProcessWarmUpExecutor.get_cache_keys(chart)
+            ]
+            if any(timeout is None for timeout in remaining_timeouts):
+                continue
+            remaining_timeout = min(cast(list[int], remaining_timeouts), default=0)
+
+            rate = count / window
+            uncovered = max(self.interval - remaining_timeout, 0)
+            probability = 1 - math.exp(-rate * uncovered)
+            scores.append(
+                {
+                    "chart_id": chart.id,
+                    "score": duration * probability,
+                    "duration": duration,
+                    "expected_requests": rate * self.interval,
+                }
+            )
+
+        return sorted(scores, key=lambda score: score["score"], reverse=True)
+
+    def get_payloads(self) -> list[dict[str, int]]:
+        last_run = cache_manager.cache.get(self.last_run_cache_key)
+
+        selected = []
+        budget = self.budget
+        for score in self.get_scores():
+            if score["score"] <= 0:
+                break
+            if score["duration"] <= budget:
+                selected.append(score)
+                budget -= score["duration"]
+
+        self.report = self._get_report(last_run)
+        cache_manager.cache.set(
+            self.last_run_cache_key,
+            {
+                # the logs are timestamped in UTC
+                "dttm": datetime.utcnow().isoformat(),
+                "expected_requests": {
+                    score["chart_id"]: score["expected_requests"] for score in selected
+                },
+            },
+            timeout=0,
+        )
+        logger.info(
+            "Warming up %s charts for %.2f of %.2f warehouse seconds",
+            len(selected),
+            self.budget - budget,
+            self.budget,
+        )
+        return [{"chart_id": score["chart_id"]} for score in selected]
+
+    def get_report(self) -> Optional[dict[str, Any]]:
+        return self.report
+
+    def _get_report(
+        self, last_run: Optional[dict[str, Any]]
+    ) -> Optional[dict[str, Any]]:
+        """
+        Compare the requests expected for the charts warmed up by the last run with
+        the requests logged since.
+        """
+        if not last_run:
+            return None
+
+        expected_requests = last_run["expected_requests"]
+        requests = self.get_requests(
+            chart_ids=list(expected_requests),
+            since=datetime.fromisoformat(last_run["dttm"]),
+        )
+        charts = [
+            {
+                "chart_id": chart_id,
+                "expected_requests": expected,
+                "actual_requests": requests.get(chart_id, (0, None))[0],
+            }
+            for chart_id, expected in expected_requests.items()
+        ]
+        report = {
+            "last_run": last_run["dttm"],
+            "expected_requests": sum(chart["expected_requests"] for chart in charts),
+            "actual_requests": sum(chart["actual_requests"] for chart in charts),
+            "charts": charts,
+        }
+
+        stats_logger = stats_logger_manager.instance
+        stats_logger.gauge(
+            "cache_warmup.priority.expected_requests", report["expected_requests"]
+        )
+        stats_logger.gauge(
+            "cache_warmup.priority.actual_requests", report["actual_requests"]
+        )
+        return report
+
+
+strategies = [
+    DummyStrategy,
+    TopNDashboardsStrategy,
+    DashboardTagsStrategy,
+    PriorityStrategy,
+]
+
+
+@dataclass
+class WarmUpReport:  # pylint: disable=too-many-instance-attributes
+    """
+    Summary of an in process cache warm up.
+
+    Charts are counted as `warmed` when their queries ran, `skipped` when all their
+    queries were already warmed by the run, or cached when not forced, and `failed`
+    otherwise. `hits` and `misses` count the queries found, or not, in the data cache
+    before the warm up, and `duplicates` the queries sharing the cache key of a query
+    warmed earlier in the run.
+    """
+
+    charts: int = 0
+    warmed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    hits: int = 0
+    misses: int = 0
+    duplicates: int = 0
+    duration: float = 0.0
+    database_durations: dict[str, float] = field(default_factory=dict)
+    slowest: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+
+class InProcessWarmUpExecutor:
+    """
+    Warm up the caches of charts by running `ChartWarmUpCacheCommand` in the Celery
+    worker, rather than by requesting `/api/v1/chart/warm_up_cache`.
+
+    Charts are grouped by datasource, and the groups of a database are spread over
+    at most `database_concurrency` threads, so that charts sharing a datasource are
+    warmed up one after the other, and the queries they share run once.
+    """
+
+    # number of slowest charts kept in the report
+    slowest_count = 10
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        database_concurrency: int = 2,
+        database_concurrency_by_name: Optional[dict[str, int]] = None,
+        force: bool = True,
+    ) -> None:
+        self.max_workers = max_workers
+        self.database_concurrency = database_concurrency
+        self.database_concurrency_by_name = database_concurrency_by_name or {}
+        self.force = force
+        self._lock = threading.Lock()
+        self._seen_keys: set[str] = set()
+        self._timings: list[dict[str, Any]] = []
+
+    @classmethod
+    def from_config(cls) -> "InProcessWarmUpExecutor":
+        config = app.config["CACHE_WARMUP_EXECUTOR_CONFIG"]
+        return cls(
+            max_workers=config["MAX_WORKERS"],
+            database_concurrency=config["DATABASE_CONCURRENCY"],
+            database_concurrency_by_name=config["DATABASE_CONCURRENCY_BY_NAME"],
+            force=config["FORCE"],
+        )
+
+    def get_concurrency(self, database_name: str) -> int:
+        return max(
+            self.database_concurrency_by_name.get(
+                database_name, self.database_concurrency
+            ),
+            1,
+        )
+
+    @staticmethod
+    def get_charts(
+        payloads: list[dict[str, int]],
+    ) -> list[tuple[dict[str, int], str, str]]:
+        """
+        Return the payloads of existing charts, with the name of their database and
+        the UID of their datasource. Duplicated payloads are dropped.
+        """
+        chart_ids = {payload["chart_id"] for payload in payloads}
+        rows = (
+            db.session.query(
+                Slice.id,
+                Slice.datasource_id,
+                Slice.datasource_type,
+                Database.database_name,
+            )
+            .outerjoin(
+                SqlaTable,
+                and_(
+                    Slice.datasource_type == "table",
+                    Slice.datasource_id == SqlaTable.id,
+                ),
+            )
+            .outerjoin(Database, SqlaTable.database_id == Database.id)
+            .filter(Slice.id.in_(chart_ids))
+            .all()
+        )
+        datasources = {
+            row.id: (
+                row.database_name or "",
+                f"{row.datasource_id}__{row.datasource_type}",
+            )
+            for row in rows
+        }
+
+        charts = {}
+        for payload in payloads:
+            if payload["chart_id"] in datasources:
+                key = tuple(sorted(payload.items()))
+                charts[key] = (payload, *datasources[payload["chart_id"]])
+        return list(charts.values())
+
+    def get_lanes(
+        self,
+        charts: list[tuple[dict[str, int], str, str]],
+    ) -> list[tuple[str, list[dict[str, int]]]]:
+        """
+        Split the payloads of charts into lanes, warmed up one chart after the other
+        by a thread, and return them with the name of their database. The charts of a
+        datasource are in the same lane, and the charts of a database are spread over
+        at most its concurrency lanes, largest datasources first.
+        """
+        groups: dict[str, dict[str, list[dict[str, int]]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for payload, database_name, datasource_uid in charts:
+            groups[database_name][datasource_uid].append(payload)
+
+        lanes: list[tuple[str, list[dict[str, int]]]] = []
+        for database_name, datasources in groups.items():
+            size = min(self.get_concurrency(database_name), len(datasources))
+            database_lanes: list[list[dict[str, int]]] = [[] for _ in range(size)]
+            heap = [(0, index) for index in range(size)]
+            for payloads in sorted(datasources.values(), key=len, reverse=True):
+                count, index = heapq.heappop(heap)
+                database_lanes[index].extend(payloads)
+                heapq.heappush(heap, (count + len(payloads), index))
+            lanes.extend((database_name, lane) for lane in database_lanes)
+        return lanes
+
+    @staticmethod
+    def get_cache_keys(chart: Slice) -> list[str]:
+        """
+        Return the cache keys of the queries of a chart, or none if they can't be
+        computed ahead of running them, eg, for legacy charts.
+        """
+        if chart.viz_type in viz_types:
+            return []
+        try:
+            query_context = chart.get_query_context()
+            if not query_context:
+                return []
+            return [
+                cache_key
+                for query in query_context.queries
+                if (cache_key := query_context.query_cache_key(query))
+            ]
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to compute the cache keys of chart %s", chart.id)
+            return []
+
+    def run(self, payloads: list[dict[str, int]], user: User) -> WarmUpReport:
+        """
+        Warm up the caches of charts as a given user.
+
+        :param payloads: The payloads of the charts, as returned by a `Strategy`
+        :param user: The user the queries run as
+        :returns: The summary of the warm up
+        """
+        start = time.perf_counter()
+        self._seen_keys = set()
+        self._timings = []
+        charts = self.get_charts(payloads)
+        report = WarmUpReport(charts=len(charts))
+        report.failed = len(payloads) - len(charts)
+
+        flask_app = app._get_current_object()  # pylint: disable=protected-access
+        lanes = self.get_lanes(charts)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._run_lane,
+                    flask_app,
+                    user.username,
+                    database_name,
+                    lane,
+                    report,
+                )
+                for database_name, lane in lanes
+            ]
+            for future in futures:
+                future.result()
+
+        report.duration = time.perf_counter() - start
+        report.slowest = sorted(
+            self._timings,
+            key=lambda timing: timing["duration"],
+            reverse=True,
+        )[: self.slowest_count]
+        return report
+
+    def _run_lane(  # pylint: disable=too-many-arguments
+        self,
+        flask_app: Flask,
+        username: str,
+        database_name: str,
+        lane: list[dict[str, int]],
+        report: WarmUpReport,
+    ) -> None:
+        with flask_app.app_context():
+            try:
+                with override_user(security_manager.find_user(username)):
+                    for payload in lane:
+                        self._warm_up(payload, database_name, report)
+            finally:
+                db.session.remove()
+
+    def _warm_up(
+        self,
+        payload: dict[str, int],
+        database_name: str,
+        report: WarmUpReport,
+    ) -> None:
+        chart = Slice.get(payload["chart_id"])
+        if not chart:
+            with self._lock:
+                report.failed += 1
+            return
+
+        cache_keys = self.get_cache_keys(chart)
+        with self._lock:
+            new_keys = [key for key in cache_keys if key not in self._seen_keys]
+            self._seen_keys.update(new_keys)
+            report.duplicates += len(cache_keys) - len(new_keys)
+
+        hits = sum(cache_manager.data_cache.has(key) for key in new_keys)
+        with self._lock:
+            report.hits += hits
+            report.misses += len(new_keys) - hits
+            if cache_keys and (
+                not new_keys or (not self.force and hits == len(new_keys))
+            ):
+                report.skipped += 1
+                return
+
+        start = time.perf_counter()
+        result = ChartWarmUpCacheCommand(chart, payload.get("dashboard_id"), None).run()
+        duration = time.perf_counter() - start
+
+        with self._lock:
+            report.database_durations[database_name] = (
+                report.database_durations.get(database_name, 0.0) + duration
+            )
+            self._timings.append({**payload, "duration": duration})
+            if result["viz_error"]:
+                report.failed += 1
+                report.errors.append({**payload, "error": result["viz_error"]})
+            else:
+                report.warmed += 1
+
+        if not result["viz_error"]:
+            cache_manager.cache.set(
+                get_duration_cache_key(chart.id),
+                duration,
+                timeout=DURATION_TIMEOUT,
+            )
 
 
 @celery_app.task(name="fetch_url")
@@ -253,11 +784,13 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
-) -> Union[dict[str, list[str]], str]:
+) -> Union[dict[str, Any], str]:
     """
     Warm up cache.
 
-    This task periodically hits charts to warm up the cache.
+    This task periodically hits charts to warm up the cache, in process when
+    `CACHE_WARMUP_EXECUTOR_CONFIG["IN_PROCESS"]` is set, and otherwise by scheduling a
+    `fetch_url` task per chart.
 
     """
     logger.info("Loading strategy")
@@ -280,14 +813,38 @@ def cache_warmup(
         return message
 
     user = security_manager.get_user_by_username(app.config["THUMBNAIL_SELENIUM_USER"])
+    with override_user(user):
+        payloads = strategy.get_payloads()
+
+    results: dict[str, Any]
+    if app.config["CACHE_WARMUP_EXECUTOR_CONFIG"]["IN_PROCESS"]:
+        executor = InProcessWarmUpExecutor.from_config()
+        report = executor.run(payloads, user)
+        logger.info(
+            "Warmed up %s charts in %.2fs: %s warmed, %s skipped, %s failed, "
+            "%s hits, %s misses, %s duplicates",
+            report.charts,
+            report.duration,
+            report.warmed,
+            report.skipped,
+            report.failed,
+            report.hits,
+            report.misses,
+            report.duplicates,
+        )
+        results = asdict(report)
+        if strategy_report := strategy.get_report():
+            results["strategy_report"] = strategy_report
+        return results
+
     cookies = MachineAuthProvider.get_auth_cookies(user)
     headers = {
         "Cookie": f"session={cookies.get('session', '')}",
         "Content-Type": "application/json",
     }
 
-    results: dict[str, list[str]] = {"scheduled": [], "errors": []}
-    for payload in strategy.get_payloads():
+    results = {"scheduled": [], "errors": []}
+    for payload in payloads:
         try:
             payload = json.dumps(payload)
             logger.info("Scheduling %s", payload)
@@ -297,4 +854,6 @@ def cache_warmup(
             logger.exception("Error scheduling fetch_url for payload: %s", payload)
             results["errors"].append(payload)
 
+    if strategy_report := strategy.get_report():
+        results["strategy_report"] = strategy_report
     return results
@@ -27,9 +27,7 @@ from flask_caching import Cache
 from flask_caching.backends import NullCache
 from werkzeug.wrappers import Response
 
-from superset import db
 from superset.extensions import cache_manager
-from superset.models.cache import CacheKey
 from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.json import json_int_dttm_ser
 
@@ -68,12 +66,9 @@ def set_and_log_cache(
         stats_logger.incr("set_cache_key")
 
         if datasource_uid and config["STORE_CACHE_KEYS_IN_METADATA_DB"]:
-            ck = CacheKey(
-                cache_key=cache_key,
-                cache_timeout=cache_timeout,
-                datasource_uid=datasource_uid,
+            config["CACHE_KEY_INDEX"].add(
+                cache_instance, cache_key, datasource_uid, timeout
             )
-            db.session.add(ck)
     except Exception as ex:  # pylint: disable=broad-except
         # cache.set call can fail if the backend is down or if
         # the key is too large or whatever other reasons
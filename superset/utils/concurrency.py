@@ -0,0 +1,136 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from flask import current_app, g, has_request_context
+from flask.globals import request_ctx
+from sqlalchemy import inspect
+
+from superset import db
+
+T = TypeVar("T")
+
+# whether the current thread is a worker of `run_concurrently`
+_worker = threading.local()
+
+
+def run_concurrently(funcs: Sequence[Callable[[], T]], max_workers: int) -> list[T]:
+    """
+    Run functions in a bounded pool of threads, returning their results in order.
+
+    Flask contexts are local to the thread that handles the request, so each function
+    runs in a new application context with a copy of `flask.g`, which holds the
+    current user, and in a copy of the request context if there's one. Functions run
+    serially when `max_workers` is 1 or less, and when called from a function already
+    run concurrently, so that nested calls don't multiply the number of threads.
+
+    :param funcs: The functions to run
+    :param max_workers: The maximum number of functions to run at once
+    :returns: The results of the functions, in the same order
+    :raises Exception: The first exception raised by a function, in order
+    """
+    if max_workers <= 1 or len(funcs) <= 1 or getattr(_worker, "active", False):
+        return [func() for func in funcs]
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    g_copy = g._get_current_object()  # pylint: disable=protected-access
+    request_context = request_ctx.copy() if has_request_context() else None
+
+    def run(func: Callable[[], T]) -> T:
+        with app.app_context():
+            for key, value in g_copy.__dict__.items():
+                setattr(g, key, value)
+            _worker.active = True
+            try:
+                if request_context is None:
+                    return func()
+                with request_context.copy():
+                    return func()
+            finally:
+                _worker.active = False
+                # sessions are scoped to the thread
+                db.session.remove()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(funcs))) as executor:
+        futures = [executor.submit(run, func) for func in funcs]
+        return [future.result() for future in futures]
+
+
+def attach_to_thread_session(instance: T) -> T:
+    """
+    Return an ORM instance attached to the session of the current thread.
+
+    Sessions, and the instances they load, can't be shared by threads, so functions run
+    by `run_concurrently` must not use the instances of the calling thread. Those are
+    merged into the session of the thread without being reloaded, copying the
+    attributes and relationships already loaded, so they must not have pending
+    changes. Instances of the current session, detached instances and objects which
+    aren't mapped are returned as is.
+
+    :param instance: The instance to attach
+    :returns: The instance, or its copy in the session of the current thread
+    """
+    state = inspect(instance, raiseerr=False)
+    if state is None or state.session in (None, db.session()):
+        return instance
+    return db.session.merge(instance, load=False)
+
+
+def run_in_processes(
+    func: Callable[..., T],
+    args: Sequence[tuple[Any, ...]],
+    max_workers: int,
+) -> list[T]:
+    """
+    Call a function with each tuple of arguments in a bounded pool of processes,
+    returning their results in order.
+
+    Each process creates its own app, with the configuration of the current process,
+    so the function and its arguments must be picklable. Calls run serially in the
+    current process when `max_workers` is 1 or less.
+
+    :param func: The function to call, defined at the top level of a module
+    :param args: The arguments of each call
+    :param max_workers: The maximum number of processes
+    :returns: The results of the calls, in the same order
+    :raises Exception: The first exception raised by a call, in order
+    """
+    if max_workers <= 1 or len(args) <= 1:
+        return [func(*arg) for arg in args]
+
+    # processes are spawned rather than forked, forking copies the connections of
+    # the pools of the current process
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(args)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_process,
+    ) as executor:
+        futures = [executor.submit(func, *arg) for arg in args]
+        return [future.result() for future in futures]
+
+
+def _init_process() -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.app import create_app
+
+    create_app().app_context().push()
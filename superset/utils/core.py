@@ -112,6 +112,8 @@ DTTM_ALIAS = "__timestamp"
 
 TIME_COMPARISON = "__"
 
+TIME_OFFSET_ALIAS = "__time_offset"
+
 JS_MAX_INTEGER = 9007199254740991  # Largest int Java Script can handle 2^53-1
 
 InputType = TypeVar("InputType")  # pylint: disable=invalid-name
@@ -14,20 +14,32 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import codecs
+import io
 import logging
 import re
 import urllib.request
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from superset.utils import json
 from superset.utils.core import GenericDataType
 
 logger = logging.getLogger(__name__)
 
+# Number of cells pandas formats at once when writing a CSV, see
+# ``pandas.io.formats.csvs._DEFAULT_CHUNKSIZE_CELLS``
+CSV_CHUNK_SIZE_CELLS = 100_000
+
+# Minimum number of rows escaped and written at once when exporting a CSV
+CSV_EXPORT_CHUNK_SIZE = 50_000
+
 negative_number_re = re.compile(r"^-[0-9.]+$")
 
 # This regex will match if the string starts with:
@@ -38,6 +50,16 @@ negative_number_re = re.compile(r"^-[0-9.]+$")
 #
 problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
 
+# RE2 equivalents of the regexes above, used with Arrow compute kernels. RE2 has no
+# lookaheads, its ``$`` doesn't match before a trailing newline and its ``\s`` only
+# matches ASCII whitespace, so those are spelled out explicitly.
+whitespace_re2 = (
+    r"[\t\n\x0b\x0c\r\x1c-\x20\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}"
+    r"\x{2029}\x{202f}\x{205f}\x{3000}]"
+)
+problematic_chars_re2 = rf'^(?:"{{2}}|{whitespace_re2}+)[\-@+|=%]|^[\-@+|=%]'
+negative_number_re2 = r"^-[0-9.]+\n?$"
+
 
 def escape_value(value: str) -> str:
     """
@@ -64,7 +86,53 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+def get_escaping_mask(column: pd.Series) -> np.ndarray:
+    """
+    Return a boolean mask of the values in a column that need to be escaped.
+
+    Columns with only strings (and nulls) are matched with Arrow compute kernels,
+    while columns with mixed types fall back to the pandas string accessor, which
+    ignores non-string values.
+    """
+    if pd.api.types.infer_dtype(column, skipna=True) == "string":
+        strings = pa.array(column.to_numpy(), type=pa.string(), from_pandas=True)
+        needs_escaping = pc.match_substring_regex(strings, problematic_chars_re2)
+        is_negative_number = pc.match_substring_regex(strings, negative_number_re2)
+        mask = pc.and_(needs_escaping, pc.invert(is_negative_number))
+        return mask.fill_null(False).to_numpy(zero_copy_only=False)
+
+    try:
+        strings = column.str
+    except AttributeError:
+        # the column has no string values
+        return np.zeros(len(column), dtype=bool)
+
+    needs_escaping = strings.match(problematic_chars_re.pattern, na=False)
+    is_negative_number = strings.match(negative_number_re.pattern, na=False)
+    return (needs_escaping & ~is_negative_number).to_numpy(dtype=bool)
+
+
+def escape_column(column: pd.Series) -> pd.Series:
+    """
+    Escapes the string values of a column, leaving any other values untouched.
+
+    This is the vectorized equivalent of calling ``escape_value`` on every string
+    value of the column.
+    """
+    mask = get_escaping_mask(column)
+    if not mask.any():
+        return column
+
+    column = column.copy()
+    column.iloc[mask] = "'" + column.iloc[mask].str.replace("|", "\\|", regex=False)
+    return column
+
+
+def escape_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Escapes the headers and the string values of a dataframe.
+    """
+
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
@@ -72,13 +140,73 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     df = df.rename(columns=escape_values)
 
     # Escape csv values
-    for name, column in df.items():
+    for i in range(len(df.columns)):
+        column = df.iloc[:, i]
         if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+            escaped = escape_column(column)
+            if escaped is not column:
+                df.isetitem(i, escaped)
+
+    return df
+
+
+def get_csv_chunk_size(df: pd.DataFrame, **kwargs: Any) -> int:
+    """
+    Return the number of rows in each chunk when writing a dataframe as CSV.
+
+    Pandas already formats values in chunks of ``_DEFAULT_CHUNKSIZE_CELLS`` cells
+    when writing a CSV, and some formats (eg, dates without a time part) depend on
+    the values in the chunk. Using a multiple of its chunk size guarantees the
+    output is identical to writing the whole dataframe at once.
+    """
+    columns = kwargs.get("columns")
+    num_columns = len(columns if columns is not None else df.columns) or 1
+    pandas_chunk_size = (
+        kwargs.get("chunksize") or (CSV_CHUNK_SIZE_CELLS // num_columns) or 1
+    )
+    return max(CSV_EXPORT_CHUNK_SIZE // pandas_chunk_size, 1) * pandas_chunk_size
+
+
+def df_to_escaped_csv_chunks(df: pd.DataFrame, **kwargs: Any) -> Iterator[str]:
+    """
+    Escape and write a dataframe as CSV, yielding the output chunk by chunk.
 
-    return df.to_csv(escapechar="\\", **kwargs)
+    Only a single chunk of the dataframe is escaped at a time, so the escaped copy
+    of the whole dataframe is never held in memory.
+    """
+    kwargs.pop("path_or_buf", None)
+    chunk_size = get_csv_chunk_size(df, **kwargs)
+    header = kwargs.pop("header", True)
+
+    for start in range(0, max(len(df), 1), chunk_size):
+        chunk = escape_df(df.iloc[start : start + chunk_size])
+        yield chunk.to_csv(
+            escapechar="\\",
+            header=header if start == 0 else False,
+            **kwargs,
+        )
+
+
+def encode_csv_chunks(chunks: Iterable[str], encoding: str) -> Iterator[bytes]:
+    """
+    Encode the chunks of a CSV as a single stream, so that encodings with a BOM, eg,
+    ``utf-8-sig``, only write it at the start of the file.
+    """
+    encoder = codecs.getincrementalencoder(encoding)()
+    for chunk in chunks:
+        if data := encoder.encode(chunk):
+            yield data
+    if data := encoder.encode("", final=True):
+        yield data
+
+
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    path_or_buf = kwargs.pop("path_or_buf", None)
+    buffer = path_or_buf if path_or_buf is not None else io.StringIO()
+    for chunk in df_to_escaped_csv_chunks(df, **kwargs):
+        buffer.write(chunk)
+
+    return buffer.getvalue() if path_or_buf is None else None
 
 
 def get_chart_csv_data(
@@ -101,16 +229,24 @@ def get_chart_csv_data(
 def get_chart_dataframe(
     chart_url: str, auth_cookies: Optional[dict[str, str]] = None
 ) -> Optional[pd.DataFrame]:
-    # Disable all the unnecessary-lambda violations in this function
-    # pylint: disable=unnecessary-lambda
     content = get_chart_csv_data(chart_url, auth_cookies)
     if content is None:
         return None
 
     result = json.loads(content.decode("utf-8"))
+    return get_query_dataframe(result["result"][0])
+
+
+def get_query_dataframe(query: dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Build a dataframe from the JSON results of a chart data query, restoring its
+    temporal columns and its hierarchical columns and index.
+    """
+    # Disable all the unnecessary-lambda violations in this function
+    # pylint: disable=unnecessary-lambda
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(query["data"])
 
     if df.empty:
         return None
@@ -118,22 +254,22 @@ def get_chart_dataframe(
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in query["coltypes"]:
+            for i in range(len(query["coltypes"])):
+                if query["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[query["colnames"][i]] = df[query["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
-    # rebuild hierarchical columns and index
+    # rebuild hierarchical columns and index, which are lists once serialized
     df.columns = pd.MultiIndex.from_tuples(
-        tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
+        tuple(colname) if isinstance(colname, (list, tuple)) else (colname,)
+        for colname in query["colnames"]
     )
     df.index = pd.MultiIndex.from_tuples(
-        tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        tuple(indexname) if isinstance(indexname, (list, tuple)) else (indexname,)
+        for indexname in query["indexnames"]
     )
     return df
@@ -15,9 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 import io
+import math
+import tempfile
+from collections.abc import Iterator
 from typing import Any
 
 import pandas as pd
+import xlsxwriter
 
 from superset.utils.core import GenericDataType
 
@@ -32,6 +36,79 @@ def df_to_excel(df: pd.DataFrame, **kwargs: Any) -> Any:
     return output.getvalue()
 
 
+# Size of the chunks yielded when streaming an Excel file
+EXCEL_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def to_excel_value(value: Any) -> Any:
+    """
+    Convert a dataframe value to something xlsxwriter can write to a cell.
+    """
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if math.isinf(value):
+            # same representation as ``DataFrame.to_excel``
+            return "inf" if value > 0 else "-inf"
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, (list, dict, tuple, set)):
+        return str(value)
+    return value
+
+
+def df_to_excel_chunks(df: pd.DataFrame, **kwargs: Any) -> Iterator[bytes]:
+    """
+    Write a dataframe as an Excel file, yielding the contents of the file in chunks.
+
+    Rows are written one at a time in xlsxwriter's ``constant_memory`` mode, and the
+    workbook is assembled in a temporary file, so memory usage doesn't grow with the
+    number of rows. Only the ``sheet_name``, ``index`` and ``header`` arguments of
+    ``DataFrame.to_excel`` are supported, and hierarchical columns or indexes are
+    written as flat strings.
+    """
+    sheet_name = kwargs.get("sheet_name", "Sheet1")
+    index = kwargs.get("index", True)
+    header = kwargs.get("header", True)
+
+    with tempfile.TemporaryFile() as output:
+        workbook = xlsxwriter.Workbook(
+            output,
+            {
+                "constant_memory": True,
+                "remove_timezone": True,
+                # write values as plain strings, never as formulas or links
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            },
+        )
+        worksheet = workbook.add_worksheet(sheet_name)
+
+        row_idx = 0
+        if header:
+            header_format = workbook.add_format(
+                {"bold": True, "border": 1, "align": "center", "valign": "top"}
+            )
+            names = [str(column) for column in df.columns]
+            if index:
+                names.insert(0, str(df.index.name or ""))
+            worksheet.write_row(row_idx, 0, names, header_format)
+            row_idx += 1
+
+        for row in df.itertuples(index=index, name=None):
+            worksheet.write_row(row_idx, 0, [to_excel_value(value) for value in row])
+            row_idx += 1
+
+        workbook.close()
+
+        output.seek(0)
+        while chunk := output.read(EXCEL_STREAM_CHUNK_SIZE):
+            yield chunk
+
+
 def apply_column_types(
     df: pd.DataFrame, column_types: list[GenericDataType]
 ) -> pd.DataFrame:
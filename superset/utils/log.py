@@ -16,23 +16,29 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, request
+from flask import current_app, Flask, g, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
 from superset.extensions import stats_logger_manager
 from superset.utils import json
 from superset.utils.core import get_user_id, LoggerLevel, to_int
+from superset.utils.decorators import stats_timing
 
 if TYPE_CHECKING:
     pass
@@ -386,14 +392,9 @@ class DBEventLogger(AbstractEventLogger):
         records = kwargs.get("records", [])
         logs = []
         for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
             log = Log(
                 action=action,
-                json=json_string,
+                json=self.serialize_record(record),
                 dashboard_id=dashboard_id,
                 slice_id=slice_id,
                 duration_ms=duration_ms,
@@ -408,6 +409,158 @@ class DBEventLogger(AbstractEventLogger):
             logging.error("DBEventLogger failed to log event(s)")
             logging.exception(ex)
 
+    @staticmethod
+    def serialize_record(record: Any) -> str | None:
+        try:
+            return json.dumps(record)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+
+class BufferedDBEventLogger(DBEventLogger):
+    """
+    Event logger that commits logs to Superset DB in batches, from a background thread
+
+    Logs are queued in memory and written once `batch_size` of them are pending, or
+    every `flush_interval` seconds, so that requests don't wait on the metadata
+    database. When the queue is full new logs are dropped instead of blocking the
+    request. Pending logs are written when the process exits.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 5,
+        max_queue_size: int = 10_000,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._queue: queue.Queue[dict[str, Any] | None] = queue.Queue(max_queue_size)
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._ensure_thread()
+        stats_logger = stats_logger_manager.instance
+        # the logs are written later, so they are timestamped now
+        dttm = datetime.utcnow()
+        for record in kwargs.get("records", []):
+            try:
+                self._queue.put_nowait(
+                    {
+                        "action": action,
+                        "json": self.serialize_record(record),
+                        "dashboard_id": dashboard_id,
+                        "slice_id": slice_id,
+                        "duration_ms": duration_ms,
+                        "referrer": referrer,
+                        "user_id": user_id,
+                        "dttm": dttm,
+                    }
+                )
+            except queue.Full:
+                stats_logger.incr("event_logger.dropped")
+        stats_logger.gauge("event_logger.queue_depth", self._queue.qsize())
+
+    def _ensure_thread(self) -> None:
+        """Start the thread writing the logs, in each process"""
+        if self._thread and self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._thread and self._pid == os.getpid():
+                return
+
+            # threads don't survive a fork, and the queue could have been copied
+            # while locked
+            if self._pid is not None:
+                self._queue = queue.Queue(self.max_queue_size)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(current_app._get_current_object(),),  # pylint: disable=protected-access
+                name="BufferedDBEventLogger",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def shutdown(self, timeout: float = 10) -> None:
+        """Write the pending logs and stop the thread"""
+        if not self._thread or self._pid != os.getpid():
+            return
+
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("BufferedDBEventLogger failed to stop in time")
+            return
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self, app: Flask) -> None:
+        stopped = False
+        while not stopped:
+            batch: list[dict[str, Any]] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    row = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopped = True
+                    break
+                batch.append(row)
+
+            if stopped:
+                # drain the queue
+                while True:
+                    try:
+                        row = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if row is not None:
+                        batch.append(row)
+
+            if batch:
+                with app.app_context():
+                    for i in range(0, len(batch), self.batch_size):
+                        self._write(batch[i : i + self.batch_size])
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
+        stats_logger = stats_logger_manager.instance
+        try:
+            with stats_timing("event_logger.flush", stats_logger):
+                db.session.bulk_insert_mappings(Log, rows)
+                db.session.commit()  # pylint: disable=consider-using-transaction
+        except SQLAlchemyError:
+            # the writer thread owns its session, and drops the batch rather than retrying
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+            logger.exception(
+                "BufferedDBEventLogger failed to log %i event(s)", len(rows)
+            )
+            for _ in rows:
+                stats_logger.incr("event_logger.dropped")
+        finally:
+            db.session.remove()
+
 
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
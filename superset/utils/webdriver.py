@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from abc import ABC, abstractmethod
 from enum import Enum
 from time import sleep
@@ -38,6 +39,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from superset import feature_flag_manager
 from superset.extensions import machine_auth_provider_factory
 from superset.utils.retries import retry_call
+from superset.utils.webdriver_pool import get_pool
 
 WindowSize = tuple[int, int]
 logger = logging.getLogger(__name__)
@@ -47,10 +49,12 @@ if TYPE_CHECKING:
 
 if feature_flag_manager.is_feature_enabled("PLAYWRIGHT_REPORTS_AND_THUMBNAILS"):
     from playwright.sync_api import (
+        Browser,
         BrowserContext,
         Error as PlaywrightError,
         Locator,
         Page,
+        Playwright,
         sync_playwright,
         TimeoutError as PlaywrightTimeout,
     )
@@ -83,6 +87,10 @@ class WebDriverProxy(ABC):
 
 
 class WebDriverPlaywright(WebDriverProxy):
+    # the Playwright instances of the threads using the pool, as the objects of the
+    # sync API can't be shared by threads
+    _local = threading.local()
+
     @staticmethod
     def auth(user: User, context: BrowserContext) -> BrowserContext:
         return machine_auth_provider_factory.instance.authenticate_browser_context(
@@ -133,113 +141,160 @@ class WebDriverPlaywright(WebDriverProxy):
 
         return error_messages
 
-    def get_screenshot(  # pylint: disable=too-many-locals, too-many-statements
-        self, url: str, element_name: str, user: User
-    ) -> bytes | None:
+    def create(
+        self, playwright: Playwright, user: User
+    ) -> tuple[Browser, BrowserContext]:
+        browser_args = current_app.config["WEBDRIVER_OPTION_ARGS"]
+        browser = playwright.chromium.launch(args=browser_args)
+        pixel_density = current_app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
+        context = browser.new_context(
+            bypass_csp=True,
+            viewport={
+                "height": self._window[1],
+                "width": self._window[0],
+            },
+            device_scale_factor=pixel_density,
+        )
+        context.set_default_timeout(
+            current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+        )
+        self.auth(user, context)
+        return browser, context
+
+    @staticmethod
+    def destroy(driver: tuple[Browser, BrowserContext]) -> None:
+        """Destroy a browser and its context"""
+        browser, context = driver
+        try:
+            context.close()
+        finally:
+            browser.close()
+
+    @staticmethod
+    def is_healthy(driver: tuple[Browser, BrowserContext]) -> bool:
+        browser, _ = driver
+        return browser.is_connected()
+
+    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
+        if pool := get_pool():
+            with pool.lease(
+                ("playwright", threading.get_ident(), user.username),
+                create=lambda: self.create(self._get_playwright(), user),
+                destroy=self.destroy,
+                is_healthy=self.is_healthy,
+            ) as pooled:
+                _, context = pooled.driver
+                page = context.new_page()
+                try:
+                    page.set_viewport_size(
+                        {"height": self._window[1], "width": self._window[0]}
+                    )
+                    img = self._take_screenshot(page, url, element_name, user)
+                finally:
+                    page.close()
+                if img is None:
+                    pooled.discard()
+                return img
+
         with sync_playwright() as playwright:
-            browser_args = current_app.config["WEBDRIVER_OPTION_ARGS"]
-            browser = playwright.chromium.launch(args=browser_args)
-            pixel_density = current_app.config["WEBDRIVER_WINDOW"].get(
-                "pixel_density", 1
-            )
-            context = browser.new_context(
-                bypass_csp=True,
-                viewport={
-                    "height": self._window[1],
-                    "width": self._window[0],
-                },
-                device_scale_factor=pixel_density,
+            driver = self.create(playwright, user)
+            try:
+                return self._take_screenshot(
+                    driver[1].new_page(), url, element_name, user
+                )
+            finally:
+                self.destroy(driver)
+
+    @classmethod
+    def _get_playwright(cls) -> Playwright:
+        if getattr(cls._local, "playwright", None) is None:
+            cls._local.playwright = sync_playwright().start()
+        return cls._local.playwright
+
+    def _take_screenshot(
+        self, page: Page, url: str, element_name: str, user: User
+    ) -> bytes | None:
+        try:
+            page.goto(
+                url,
+                wait_until=current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
             )
-            context.set_default_timeout(
-                current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+        except PlaywrightTimeout:
+            logger.exception(
+                "Web event %s not detected. Page %s might not have been fully loaded",
+                current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                url,
             )
-            self.auth(user, context)
-            page = context.new_page()
+
+        img: bytes | None = None
+        selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+        logger.debug("Sleeping for %i seconds", selenium_headstart)
+        page.wait_for_timeout(selenium_headstart * 1000)
+        element: Locator
+        try:
             try:
-                page.goto(
-                    url,
-                    wait_until=current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                # page didn't load
+                logger.debug(
+                    "Wait for the presence of %s at url: %s", element_name, url
                 )
+                element = page.locator(f".{element_name}")
+                element.wait_for()
+            except PlaywrightTimeout:
+                logger.exception("Timed out requesting url %s", url)
+                raise
+
+            try:
+                # chart containers didn't render
+                logger.debug("Wait for chart containers to draw at url: %s", url)
+                slice_container_locator = page.locator(".chart-container")
+                slice_container_locator.first.wait_for()
+                for slice_container_elem in slice_container_locator.all():
+                    slice_container_elem.wait_for()
             except PlaywrightTimeout:
                 logger.exception(
-                    "Web event %s not detected. Page %s might not have been fully loaded",
-                    current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                    "Timed out waiting for chart containers to draw at url %s",
                     url,
                 )
-
-            img: bytes | None = None
-            selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-            logger.debug("Sleeping for %i seconds", selenium_headstart)
-            page.wait_for_timeout(selenium_headstart * 1000)
-            element: Locator
+                raise
             try:
-                try:
-                    # page didn't load
-                    logger.debug(
-                        "Wait for the presence of %s at url: %s", element_name, url
-                    )
-                    element = page.locator(f".{element_name}")
-                    element.wait_for()
-                except PlaywrightTimeout:
-                    logger.exception("Timed out requesting url %s", url)
-                    raise
-
-                try:
-                    # chart containers didn't render
-                    logger.debug("Wait for chart containers to draw at url: %s", url)
-                    slice_container_locator = page.locator(".chart-container")
-                    slice_container_locator.first.wait_for()
-                    for slice_container_elem in slice_container_locator.all():
-                        slice_container_elem.wait_for()
-                except PlaywrightTimeout:
-                    logger.exception(
-                        "Timed out waiting for chart containers to draw at url %s",
-                        url,
-                    )
-                    raise
-                try:
-                    # charts took too long to load
-                    logger.debug(
-                        "Wait for loading element of charts to be gone at url: %s", url
-                    )
-                    for loading_element in page.locator(".loading").all():
-                        loading_element.wait_for(state="detached")
-                except PlaywrightTimeout:
-                    logger.exception(
-                        "Timed out waiting for charts to load at url %s", url
-                    )
-                    raise
-
-                selenium_animation_wait = current_app.config[
-                    "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
-                ]
-                logger.debug(
-                    "Wait %i seconds for chart animation", selenium_animation_wait
-                )
-                page.wait_for_timeout(selenium_animation_wait * 1000)
+                # charts took too long to load
                 logger.debug(
-                    "Taking a PNG screenshot of url %s as user %s",
-                    url,
-                    user.username,
+                    "Wait for loading element of charts to be gone at url: %s", url
                 )
-                if current_app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
-                    unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
-                    if unexpected_errors:
-                        logger.warning(
-                            "%i errors found in the screenshot. URL: %s. Errors are: %s",
-                            len(unexpected_errors),
-                            url,
-                            unexpected_errors,
-                        )
-                img = element.screenshot()
+                for loading_element in page.locator(".loading").all():
+                    loading_element.wait_for(state="detached")
             except PlaywrightTimeout:
-                # raise again for the finally block, but handled above
-                pass
-            except PlaywrightError:
-                logger.exception(
-                    "Encountered an unexpected error when requesting url %s", url
-                )
-            return img
+                logger.exception("Timed out waiting for charts to load at url %s", url)
+                raise
+
+            selenium_animation_wait = current_app.config[
+                "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
+            ]
+            logger.debug("Wait %i seconds for chart animation", selenium_animation_wait)
+            page.wait_for_timeout(selenium_animation_wait * 1000)
+            logger.debug(
+                "Taking a PNG screenshot of url %s as user %s",
+                url,
+                user.username,
+            )
+            if current_app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
+                unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
+                if unexpected_errors:
+                    logger.warning(
+                        "%i errors found in the screenshot. URL: %s. Errors are: %s",
+                        len(unexpected_errors),
+                        url,
+                        unexpected_errors,
+                    )
+            img = element.screenshot()
+        except PlaywrightTimeout:
+            # raise again for the finally block, but handled above
+            pass
+        except PlaywrightError:
+            logger.exception(
+                "Encountered an unexpected error when requesting url %s", url
+            )
+        return img
 
 
 class WebDriverSelenium(WebDriverProxy):
@@ -348,8 +403,37 @@ class WebDriverSelenium(WebDriverProxy):
 
         return error_messages
 
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        # raises when the browser or its driver died
+        return driver.current_url is not None
+
     def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
+        tries = current_app.config["SCREENSHOT_SELENIUM_RETRIES"]
+        if pool := get_pool():
+            with pool.lease(
+                ("selenium", self._driver_type, user.username),
+                create=lambda: self.auth(user),
+                destroy=lambda driver: self.destroy(driver, tries),
+                is_healthy=self.is_healthy,
+            ) as pooled:
+                img = self._take_screenshot(pooled.driver, url, element_name, user)
+                if img is None:
+                    pooled.discard()
+                else:
+                    # leave the page, so that it stops running while idle
+                    pooled.driver.get("about:blank")
+                return img
+
         driver = self.auth(user)
+        try:
+            return self._take_screenshot(driver, url, element_name, user)
+        finally:
+            self.destroy(driver, tries)
+
+    def _take_screenshot(
+        self, driver: WebDriver, url: str, element_name: str, user: User
+    ) -> bytes | None:
         driver.set_window_size(*self._window)
         driver.get(url)
         img: bytes | None = None
@@ -433,6 +517,4 @@ class WebDriverSelenium(WebDriverProxy):
             logger.exception(
                 "Encountered an unexpected error when requesting url %s", url
             )
-        finally:
-            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
         return img
@@ -0,0 +1,291 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A pool of authenticated headless browsers.
+
+Starting a browser and logging it in takes longer than rendering most charts, so when
+`WEBDRIVER_POOL_CONFIG` is enabled the browsers used for thumbnails and reports are
+kept by each worker process, and reused by the screenshots taken as the same user.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, Callable
+
+from flask import current_app
+
+from superset.exceptions import WebDriverPoolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class PooledDriver:  # pylint: disable=too-few-public-methods
+    """A browser kept by a `WebDriverPool`, and how to check and destroy it"""
+
+    def __init__(
+        self,
+        key: Hashable,
+        driver: Any,
+        destroy: Callable[[Any], None],
+        is_healthy: Callable[[Any], bool],
+    ) -> None:
+        self.key = key
+        self.driver = driver
+        self.destroy = destroy
+        self.is_healthy = is_healthy
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.pages = 0
+        self.broken = False
+
+    def discard(self) -> None:
+        """Destroy the browser once released, rather than reusing it"""
+        self.broken = True
+
+
+class WebDriverPool:
+    """
+    A bounded pool of browsers, keyed by whatever makes two browsers
+    interchangeable, eg, the type of the driver and the user it's logged in as.
+
+    Browsers are recycled after rendering `max_pages` pages, after `max_age` seconds,
+    after being idle for `idle_timeout` seconds, when they fail their health check,
+    or when they're discarded because of an error. When the pool holds `max_size`
+    browsers, the least recently used idle browser is recycled to make room for a
+    browser of another key, and callers otherwise wait for a browser to be released
+    for up to `acquire_timeout` seconds.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_size: int = 4,
+        max_pages: int = 50,
+        max_age: int = 3600,
+        idle_timeout: int = 300,
+        acquire_timeout: float = 60,
+    ) -> None:
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.pid = os.getpid()
+        self._idle: list[PooledDriver] = []
+        self._size = 0
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @contextmanager
+    def lease(
+        self,
+        key: Hashable,
+        create: Callable[[], Any],
+        destroy: Callable[[Any], None],
+        is_healthy: Callable[[Any], bool] = lambda driver: True,
+    ) -> Iterator[PooledDriver]:
+        """
+        Lease a browser of a given key, created if none is idle.
+
+        The browser is discarded when the block raises, and released otherwise.
+
+        :param key: The key of the browser
+        :param create: Creates a browser of the key
+        :param destroy: Destroys a browser created by `create`
+        :param is_healthy: Checks whether an idle browser can be reused
+        :raises WebDriverPoolTimeoutError: If no browser is released in time
+        """
+        entry = self._acquire(key, create, destroy, is_healthy)
+        start = time.perf_counter()
+        try:
+            yield entry
+        except BaseException:
+            entry.discard()
+            raise
+        finally:
+            self._stats.timing(
+                "webdriver_pool.render_time",
+                (time.perf_counter() - start) * 1000,
+            )
+            self._release(entry)
+
+    def close(self) -> None:
+        """Destroy the idle browsers"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for entry in idle:
+            self._destroy(entry)
+
+    def _acquire(
+        self,
+        key: Hashable,
+        create: Callable[[], Any],
+        destroy: Callable[[Any], None],
+        is_healthy: Callable[[Any], bool],
+    ) -> PooledDriver:
+        start = time.perf_counter()
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            expired: list[PooledDriver] = []
+            entry = None
+            with self._condition:
+                while True:
+                    expired.extend(self._pop_expired())
+                    if entry := self._pop_idle(key):
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    if self._idle:
+                        # make room by recycling the least recently used browser
+                        expired.append(self._idle.pop(0))
+                        self._size -= 1
+                        continue
+                    if (remaining := deadline - time.monotonic()) <= 0:
+                        self._stats.incr("webdriver_pool.timeout")
+                        raise WebDriverPoolTimeoutError(
+                            f"No browser was released in {self.acquire_timeout}s"
+                        )
+                    self._condition.wait(remaining)
+
+            for expired_entry in expired:
+                self._destroy(expired_entry)
+
+            if entry is None:
+                try:
+                    entry = PooledDriver(key, create(), destroy, is_healthy)
+                except BaseException:
+                    with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+                self._stats.incr("webdriver_pool.created")
+            elif not self._is_healthy(entry):
+                self._stats.incr("webdriver_pool.unhealthy")
+                self._discard(entry)
+                continue
+            else:
+                self._stats.incr("webdriver_pool.reused")
+
+            self._stats.timing(
+                "webdriver_pool.acquire_wait",
+                (time.perf_counter() - start) * 1000,
+            )
+            self._stats.gauge("webdriver_pool.size", self._size)
+            return entry
+
+    def _release(self, entry: PooledDriver) -> None:
+        entry.pages += 1
+        entry.last_used = time.monotonic()
+        if (
+            entry.broken
+            or entry.pages >= self.max_pages
+            or entry.last_used - entry.created_at >= self.max_age
+        ):
+            self._discard(entry)
+            return
+
+        with self._condition:
+            self._idle.append(entry)
+            self._condition.notify()
+
+    def _discard(self, entry: PooledDriver) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+        self._destroy(entry)
+
+    def _pop_idle(self, key: Hashable) -> PooledDriver | None:
+        # reuse the most recently used browser, so that the others expire
+        for index in range(len(self._idle) - 1, -1, -1):
+            if self._idle[index].key == key:
+                return self._idle.pop(index)
+        return None
+
+    def _pop_expired(self) -> list[PooledDriver]:
+        now = time.monotonic()
+        expired = [
+            entry
+            for entry in self._idle
+            if now - entry.last_used >= self.idle_timeout
+            or now - entry.created_at >= self.max_age
+        ]
+        if expired:
+            self._idle = [entry for entry in self._idle if entry not in expired]
+            self._size -= len(expired)
+        return expired
+
+    @staticmethod
+    def _is_healthy(entry: PooledDriver) -> bool:
+        try:
+            return entry.is_healthy(entry.driver)
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    def _destroy(self, entry: PooledDriver) -> None:
+        self._stats.incr("webdriver_pool.recycled")
+        try:
+            entry.destroy(entry.driver)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Failed to destroy a pooled browser", exc_info=True)
+
+    @property
+    def _stats(self) -> Any:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import stats_logger_manager
+
+        return stats_logger_manager.instance
+
+
+_pool: WebDriverPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> WebDriverPool | None:
+    """
+    Return the pool of browsers of the worker process, if `WEBDRIVER_POOL_CONFIG` is
+    enabled.
+    """
+    global _pool  # pylint: disable=global-statement
+
+    config = current_app.config["WEBDRIVER_POOL_CONFIG"]
+    if not config["ENABLED"]:
+        return None
+
+    with _pool_lock:
+        # browsers of the parent of a forked worker can't be used by the worker
+        if _pool is None or _pool.pid != os.getpid():
+            _pool = WebDriverPool(
+                max_size=config["MAX_SIZE"],
+                max_pages=config["MAX_PAGES"],
+                max_age=config["MAX_AGE"],
+                idle_timeout=config["IDLE_TIMEOUT"],
+                acquire_timeout=config["ACQUIRE_TIMEOUT"],
+            )
+            atexit.register(_pool.close)
+        return _pool
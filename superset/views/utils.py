@@ -45,6 +45,7 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import read_ipc_batches
 from superset.superset_typing import FormData
 from superset.utils import json
 from superset.utils.core import DatasourceType
@@ -498,8 +499,38 @@ def check_datasource_perms(
     viz_obj.raise_for_access()
 
 
+def _read_results_table(
+    ds_payload: dict[str, Any],
+    offset: int,
+    limit: Optional[int],
+) -> pa.Table:
+    """
+    Read the requested rows of the Arrow table of a msgpack results payload.
+    """
+    if "batch_rows" in ds_payload:
+        # only read the batches of the requested rows
+        return read_ipc_batches(
+            ds_payload["query"]["resultsKey"],
+            ds_payload.pop("batch_rows"),
+            ds_payload.pop("batch_count"),
+            offset,
+            limit,
+        )
+
+    try:
+        reader = pa.BufferReader(ds_payload["data"])
+        pa_table = pa.ipc.open_stream(reader).read_all()
+    except pa.ArrowSerializationError as ex:
+        raise SerializationError("Unable to deserialize table") from ex
+    return pa_table.slice(offset, limit)
+
+
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> dict[str, Any]:
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
@@ -509,11 +540,7 @@ def _deserialize_results_payload(
             ds_payload = msgpack.loads(payload, raw=False)
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
-                raise SerializationError("Unable to deserialize table") from ex
+            pa_table = _read_results_table(ds_payload, offset, limit)
 
         df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
         ds_payload["data"] = dataframe.df_to_records(df) or []
@@ -533,7 +560,12 @@ def _deserialize_results_payload(
         return ds_payload
 
     with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+        ds_payload = json.loads(payload)
+
+    if offset or limit is not None:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:end]
+    return ds_payload
 
 
 def get_cta_schema_name(
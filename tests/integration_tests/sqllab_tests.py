@@ -681,6 +681,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     False,
+                    results_writer=None,
                 ),
                 mock.call(
                     "SELECT /*+ hint */ @value AS foo",
@@ -688,6 +689,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     False,
+                    results_writer=None,
                 ),
             ]
         )
@@ -789,6 +791,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     False,
+                    results_writer=None,
                 ),
                 mock.call(
                     "SELECT /*+ hint */ @value AS foo",
@@ -796,6 +799,7 @@ class TestSqlLab(SupersetTestCase):
                     mock_cursor,
                     None,
                     True,  # apply_ctas
+                    results_writer=None,
                 ),
             ]
         )
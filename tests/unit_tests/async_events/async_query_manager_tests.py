@@ -140,3 +140,81 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+def test_update_job(async_query_manager):
+    async_query_manager._redis = Mock()
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._stream_limit = 1000
+    async_query_manager._stream_limit_firehose = 100000
+    job_metadata = {
+        "channel_id": "test_channel_id",
+        "job_id": "test_job_id",
+        "user_id": None,
+        "status": "pending",
+        "errors": [],
+        "result_url": None,
+        "guest_token": {"user": {}},
+    }
+
+    async_query_manager.update_job(job_metadata, "done", result_url="/url")
+
+    pipeline = async_query_manager._redis.pipeline.return_value
+    assert pipeline.xadd.call_args_list == [
+        mock.call(
+            "async-events-test_channel_id",
+            {"data": '{"job_id":"test_job_id","status":"done","result_url":"/url"}'},
+            "*",
+            1000,
+        ),
+        mock.call(
+            "async-events-full",
+            {
+                "data": (
+                    '{"channel_id":"test_channel_id","job_id":"test_job_id",'
+                    '"status":"done","result_url":"/url"}'
+                )
+            },
+            "*",
+            100000,
+        ),
+    ]
+    pipeline.execute.assert_called_once()
+    async_query_manager._redis.xadd.assert_not_called()
+
+
+def test_read_events(async_query_manager):
+    async_query_manager._redis = Mock()
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._redis.xrange.return_value = [
+        ("1607477697866-0", {"data": '{"job_id":"test_job_id","status":"done"}'}),
+    ]
+
+    events = async_query_manager.read_events("test_channel_id", "1607477697865-0")
+
+    async_query_manager._redis.xrange.assert_called_once_with(
+        "async-events-test_channel_id", "1607477697865-1", "+", 100
+    )
+    assert events == [
+        {
+            "id": "1607477697866-0",
+            "channel_id": "test_channel_id",
+            "job_id": "test_job_id",
+            "user_id": None,
+            "status": "done",
+            "errors": [],
+            "result_url": None,
+        }
+    ]
+
+
+def test_read_events_long_polling(async_query_manager):
+    async_query_manager._redis = Mock()
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._redis.xread.return_value = []
+
+    assert async_query_manager.read_events("test_channel_id", None, block=5000) == []
+    async_query_manager._redis.xread.assert_called_once_with(
+        {"async-events-test_channel_id": "0-0"}, count=100, block=5000
+    )
+    async_query_manager._redis.xrange.assert_not_called()
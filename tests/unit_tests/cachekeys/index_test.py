@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+# pylint: disable=import-outside-toplevel
+
+from cachelib.redis import RedisCache
+from pytest_mock import MockerFixture
+
+
+def get_redis_cache(mocker: MockerFixture, ttl: int) -> RedisCache:
+    client = mocker.MagicMock()
+    client.pipeline.return_value.execute.return_value = [ttl, 1]
+    return RedisCache(host=client, key_prefix="superset_")
+
+
+def test_redis_index_add(mocker: MockerFixture) -> None:
+    """
+    Test that keys are added to a set per datasource which expires with its keys.
+    """
+    from superset.cachekeys.index import RedisCacheKeyIndex
+
+    index = RedisCacheKeyIndex(fallback=mocker.MagicMock())
+    cache = mocker.MagicMock()
+
+    # new index
+    cache.cache = get_redis_cache(mocker, -2)
+    index.add(cache, "key", "1__table", 60)
+    client = cache.cache._write_client
+    client.pipeline.return_value.sadd.assert_called_with(
+        "superset_cache_key_index:1__table", "superset_key"
+    )
+    client.expire.assert_called_with("superset_cache_key_index:1__table", 60)
+    index.fallback.add.assert_not_called()
+
+    # index expiring after the key
+    cache.cache = get_redis_cache(mocker, 120)
+    index.add(cache, "key", "1__table", 60)
+    cache.cache._write_client.expire.assert_not_called()
+
+    # key never expiring
+    cache.cache = get_redis_cache(mocker, 120)
+    index.add(cache, "key", "1__table", 0)
+    cache.cache._write_client.persist.assert_called_with(
+        "superset_cache_key_index:1__table"
+    )
+
+    # index never expiring
+    cache.cache = get_redis_cache(mocker, -1)
+    index.add(cache, "key", "1__table", 60)
+    cache.cache._write_client.expire.assert_not_called()
+
+
+def test_redis_index_add_fallback(mocker: MockerFixture) -> None:
+    """
+    Test that keys of caches not stored in Redis are added to the fallback index.
+    """
+    from cachelib.simple import SimpleCache
+
+    from superset.cachekeys.index import RedisCacheKeyIndex
+
+    index = RedisCacheKeyIndex(fallback=mocker.MagicMock())
+    cache = mocker.MagicMock()
+    cache.cache = SimpleCache()
+
+    index.add(cache, "key", "1__table", 60)
+    index.fallback.add.assert_called_with(cache, "key", "1__table", 60)
+
+
+def test_redis_index_invalidate(mocker: MockerFixture) -> None:
+    """
+    Test that the keys of a datasource are unlinked in batches, with the index.
+    """
+    from superset.cachekeys.index import RedisCacheKeyIndex
+
+    backend = get_redis_cache(mocker, -2)
+    client = backend._write_client
+    client.sscan_iter.return_value = iter([b"superset_a", b"superset_b", b"superset_c"])
+    cache_manager = mocker.patch("superset.extensions.cache_manager")
+    cache_manager.cache.cache = backend
+    cache_manager.data_cache.cache = backend
+
+    index = RedisCacheKeyIndex(fallback=mocker.MagicMock(), batch_size=2)
+    index.fallback.invalidate.return_value = 1
+
+    assert index.invalidate({"1__table"}) == 4
+    client.sscan_iter.assert_called_once_with("superset_cache_key_index:1__table")
+    assert client.unlink.call_args_list == [
+        mocker.call(b"superset_a", b"superset_b"),
+        mocker.call(b"superset_c"),
+        mocker.call("superset_cache_key_index:1__table"),
+    ]
+    index.fallback.invalidate.assert_called_with({"1__table"})
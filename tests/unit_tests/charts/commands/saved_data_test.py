@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+from io import BytesIO
+from unittest.mock import MagicMock
+from zipfile import ZipFile
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.utils import json
+
+
+def test_saved_chart_data_command(mocker: MockerFixture) -> None:
+    """
+    Test that the saved query context is run with the requested format, and that its
+    results are post-processed.
+    """
+    from superset.commands.chart.data import get_saved_data_command
+
+    load = mocker.patch.object(
+        get_saved_data_command.ChartDataQueryContextSchema, "load"
+    )
+    command = mocker.patch.object(get_saved_data_command, "ChartDataCommand")
+    command.return_value.run.return_value = {
+        "query_context": load.return_value,
+        "queries": [{"data": "a\n1\n"}],
+    }
+    apply_post_process = mocker.patch.object(
+        get_saved_data_command,
+        "apply_post_process",
+        side_effect=lambda result, form_data, datasource: result,
+    )
+    mocker.patch.object(
+        get_saved_data_command.security_manager, "can_access", return_value=True
+    )
+    chart = MagicMock(
+        query_context=json.dumps({"datasource": {"id": 1, "type": "table"}}),
+        params=json.dumps({"viz_type": "pivot_table_v2"}),
+    )
+
+    result = get_saved_data_command.GetSavedChartDataCommand(
+        chart, ChartDataResultFormat.CSV, force=True
+    ).run()
+
+    assert result["queries"] == [{"data": "a\n1\n"}]
+    assert load.call_args.args[0] == {
+        "datasource": {"id": 1, "type": "table"},
+        "result_format": ChartDataResultFormat.CSV,
+        "result_type": ChartDataResultType.POST_PROCESSED,
+        "force": True,
+    }
+    command.return_value.validate.assert_called_once()
+    assert apply_post_process.call_args.args[1] == {"viz_type": "pivot_table_v2"}
+
+
+def test_saved_chart_data_command_invalid(mocker: MockerFixture) -> None:
+    """
+    Test that charts without a query context, or whose data can't be exported by the
+    user, are rejected.
+    """
+    from superset.commands.chart.data import get_saved_data_command
+    from superset.commands.chart.exceptions import (
+        ChartAccessDeniedError,
+        ChartDataQueryFailedError,
+    )
+
+    command = get_saved_data_command.GetSavedChartDataCommand(
+        MagicMock(query_context=None), ChartDataResultFormat.CSV
+    )
+    with pytest.raises(ChartDataQueryFailedError):
+        command.run()
+
+    mocker.patch.object(get_saved_data_command.ChartDataQueryContextSchema, "load")
+    mocker.patch.object(get_saved_data_command, "ChartDataCommand")
+    mocker.patch.object(
+        get_saved_data_command.security_manager, "can_access", return_value=False
+    )
+    command = get_saved_data_command.GetSavedChartDataCommand(
+        MagicMock(query_context="{}"), ChartDataResultFormat.CSV
+    )
+    with pytest.raises(ChartAccessDeniedError):
+        command.run()
+
+
+def test_get_file_data() -> None:
+    """
+    Test that streamed results are joined, and that several queries are zipped.
+    """
+    from superset.commands.chart.data.get_saved_data_command import get_file_data
+
+    query_context = MagicMock(result_format=ChartDataResultFormat.CSV)
+
+    assert get_file_data({"query_context": query_context, "queries": []}) is None
+    assert (
+        get_file_data(
+            {
+                "query_context": query_context,
+                "queries": [{"data": iter(["a\n", "1\n"])}],
+            }
+        )
+        == b"a\n1\n"
+    )
+
+    data = get_file_data(
+        {
+            "query_context": query_context,
+            "queries": [{"data": "a\n1\n"}, {"data": "b\n2\n"}],
+        }
+    )
+    with ZipFile(BytesIO(data)) as bundle:
+        assert bundle.read("query_2.csv") == b"b\n2\n"
@@ -0,0 +1,106 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm.session import Session
+
+from superset import db
+
+
+def test_sync_datasets(mocker: MockerFixture, session: Session, tmp_path: Path) -> None:
+    """
+    Test syncing the columns of datasets with their tables.
+    """
+    from superset.commands.dataset.sync import SyncDatasetsMetadataCommand
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.core import Database
+
+    uri = f"sqlite:///{tmp_path / 'warehouse.db'}"
+    create_engine(uri).execute(
+        "CREATE TABLE events (ds TIMESTAMP, country TEXT, value INTEGER)"
+    )
+
+    SqlaTable.metadata.create_all(db.session.get_bind())
+    database = Database(database_name="warehouse", sqlalchemy_uri=uri)
+    events = SqlaTable(
+        table_name="events",
+        database=database,
+        columns=[
+            TableColumn(column_name="country", type="VARCHAR(255)"),
+            TableColumn(column_name="old", type="INTEGER"),
+            TableColumn(column_name="double", type="INTEGER", expression="value * 2"),
+        ],
+    )
+    missing = SqlaTable(table_name="missing", database=database)
+    virtual = SqlaTable(table_name="virtual", database=database, sql="SELECT 1")
+    db.session.add_all([database, events, missing, virtual])
+    db.session.commit()
+
+    results = SyncDatasetsMetadataCommand("warehouse").run()
+
+    assert [result.table_name for result in results] == ["events", "missing"]
+    assert results[0].error is None
+    assert results[0].metadata.added == ["ds", "value"]
+    assert results[0].metadata.removed == ["old", "double"]
+    assert results[0].metadata.modified == ["country"]
+    assert results[1].error
+
+    db.session.expire_all()
+    assert {
+        (column.column_name, column.type, column.is_dttm)
+        for column in db.session.query(TableColumn).filter_by(table_id=events.id)
+    } == {
+        ("ds", "TIMESTAMP", True),
+        ("country", "TEXT", False),
+        ("value", "INTEGER", False),
+        ("double", "INTEGER", False),
+    }
+    assert events.main_dttm_col == "ds"
+
+
+def test_sync_datasets_unchanged(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that datasets whose columns didn't change are not written.
+    """
+    from superset.commands.dataset.sync import sync_columns
+
+    database = mocker.MagicMock()
+    database.db_engine_spec.get_column_spec.return_value = None
+    dataset = mocker.MagicMock(id=1, main_dttm_col=None)
+    old_column = mocker.MagicMock(
+        column_name="country",
+        type="TEXT",
+        expression="",
+        is_dttm=False,
+        groupby=True,
+        filterable=True,
+    )
+    execute = mocker.patch.object(db.session, "execute")
+
+    result = sync_columns(
+        database,
+        dataset,
+        [{"column_name": "country", "type": "TEXT"}],
+        [old_column],
+    )
+
+    assert (result.added, result.removed, result.modified) == ([], [], [])
+    execute.assert_not_called()
@@ -15,15 +15,17 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import pytest
 from pytest_mock import MockerFixture
 
 from superset.commands.report.execute import BaseReportState
+from superset.common.chart_data import ChartDataResultFormat
 from superset.reports.models import (
     ReportRecipientType,
     ReportSchedule,
     ReportSourceFormat,
 )
-from superset.utils.core import HeaderDataType
+from superset.utils.core import GenericDataType, HeaderDataType
 
 
 def test_log_data_with_chart(mocker: MockerFixture) -> None:
@@ -220,3 +222,73 @@ def test_log_data_with_missing_values(mocker: MockerFixture) -> None:
     }
 
     assert result == expected_result
+
+
+@pytest.fixture
+def in_process_report(mocker: MockerFixture) -> BaseReportState:
+    """
+    A report of a chart getting its data in process, as the user `admin`.
+    """
+    from superset.commands.report import execute
+
+    mocker.patch.dict(execute.app.config, {"ALERT_REPORTS_IN_PROCESS_DATA": True})
+    mocker.patch.object(execute, "get_executor", return_value=(None, "admin"))
+    mocker.patch.object(
+        execute.security_manager,
+        "find_user",
+        return_value=mocker.MagicMock(username="admin"),
+    )
+    mocker.patch.object(execute.db.session, "refresh")
+    mocker.patch.object(execute, "get_chart_csv_data")
+    mocker.patch.object(execute, "get_chart_dataframe")
+
+    report_schedule = mocker.Mock(spec=ReportSchedule)
+    report_schedule.chart_id = 1
+    report_schedule.force_screenshot = False
+    return BaseReportState(report_schedule, "January 1, 2021", "execution_id_example")
+
+
+def test_get_csv_data_in_process(
+    mocker: MockerFixture, in_process_report: BaseReportState
+) -> None:
+    """
+    Test that the CSV of a report is built in process, without requesting the API.
+    """
+    from superset.commands.report import execute
+
+    command = mocker.patch.object(execute, "GetSavedChartDataCommand")
+    command.return_value.run.return_value = {
+        "query_context": mocker.MagicMock(result_format=ChartDataResultFormat.CSV),
+        "queries": [{"data": "a\n1\n"}],
+    }
+
+    assert in_process_report._get_csv_data() == b"a\n1\n"
+    assert command.call_args.args[1] == ChartDataResultFormat.CSV
+    execute.get_chart_csv_data.assert_not_called()
+
+
+def test_get_embedded_data_in_process(
+    mocker: MockerFixture, in_process_report: BaseReportState
+) -> None:
+    """
+    Test that the dataframe of a report is built from the results in process.
+    """
+    from superset.commands.report import execute
+
+    command = mocker.patch.object(execute, "GetSavedChartDataCommand")
+    command.return_value.run.return_value = {
+        "queries": [
+            {
+                "data": {"a": {"x": 1}, "b": {"x": 2}},
+                "colnames": [("a",), ("b",)],
+                "indexnames": [("x",)],
+                "coltypes": [GenericDataType.NUMERIC, GenericDataType.NUMERIC],
+            }
+        ]
+    }
+
+    df = in_process_report._get_embedded_data()
+
+    assert df.to_dict() == {("a",): {("x",): 1}, ("b",): {("x",): 2}}
+    assert command.call_args.args[1] == ChartDataResultFormat.JSON
+    execute.get_chart_dataframe.assert_not_called()
@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.utils.data_cache_codec import (
+    ArrowDataCacheCodec,
+    decode_value,
+    PickleDataCacheCodec,
+)
+from superset.constants import CacheRegion
+
+
+def get_value(df: pd.DataFrame) -> dict[str, Any]:
+    return {
+        "df": df,
+        "query": "SELECT 1",
+        "annotation_data": {},
+        "sql_rowcount": len(df),
+    }
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": ["a", None, "c"],
+            "count": pd.Series([1, None, 3], dtype=object),
+            "value": [1.5, float("nan"), 3.0],
+            "ts": [datetime(2024, 1, 1), datetime(2024, 1, 2), pd.NaT],
+            "flag": [True, False, True],
+        }
+    )
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd", None])
+def test_arrow_codec_roundtrip(df: pd.DataFrame, compression: str | None) -> None:
+    value = ArrowDataCacheCodec(compression=compression).encode(get_value(df))
+
+    assert value["codec"] == "arrow"
+    assert isinstance(value["df"], bytes)
+    assert value["query"] == "SELECT 1"
+
+    decoded = decode_value(value)
+    pd.testing.assert_frame_equal(decoded["df"], df)
+    assert decoded["sql_rowcount"] == 3
+
+
+def test_arrow_codec_does_not_mutate(df: pd.DataFrame) -> None:
+    value = get_value(df)
+    ArrowDataCacheCodec().encode(value)
+    assert value["df"] is df
+    assert "codec" not in value
+
+
+def test_arrow_codec_fallback() -> None:
+    """
+    Dataframes that can't be stored faithfully in Arrow are stored as-is.
+    """
+    codec = ArrowDataCacheCodec()
+    for df in (
+        pd.DataFrame({"nested": [[1, 2], [3]]}),
+        pd.DataFrame({"mixed": [1, "a"]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+    ):
+        value = codec.encode(get_value(df))
+        assert value["df"] is df
+        assert "codec" not in value
+        assert decode_value(value)["df"] is df
+
+
+def test_pickle_codec(df: pd.DataFrame) -> None:
+    value = get_value(df)
+    assert PickleDataCacheCodec().encode(value) is value
+    assert decode_value(value) is value
+
+
+def test_query_cache_manager_codec(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Test that cached values are encoded with the configured codec, and decoded
+    with the one that encoded them.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    stats_logger = mocker.patch(
+        "superset.common.utils.query_cache_manager.stats_logger"
+    )
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"DATA_CACHE_CODEC": ArrowDataCacheCodec()},
+    )
+    value = QueryCacheManager.encode(get_value(df))
+    assert value["codec"] == "arrow"
+    stats_logger.gauge.assert_called_once_with(
+        "data_cache.arrow.bytes", len(value["df"])
+    )
+
+    cache = MagicMock()
+    cache.get.return_value = {**value, "dttm": None}
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {"DATA_CACHE_CODEC": PickleDataCacheCodec()},
+    )
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+    assert query_cache.is_loaded
+    pd.testing.assert_frame_equal(query_cache.df, df)
+    stats_logger.incr.assert_any_call("data_cache.arrow.hit")
+
+    cache.get.return_value = None
+    QueryCacheManager.get("key", region=CacheRegion.DATA)
+    stats_logger.incr.assert_any_call("data_cache.pickle.miss")
@@ -0,0 +1,114 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.common.utils.local_cache import get_value_size, LocalQueryCache
+from superset.constants import CacheRegion
+
+
+def get_value(num_rows: int) -> dict[str, Any]:
+    return {"df": pd.DataFrame({"a": range(num_rows)}), "query": "SELECT 1"}
+
+
+def test_local_query_cache_lru() -> None:
+    size = get_value_size(get_value(10))
+    cache = LocalQueryCache(max_bytes=size * 2, default_timeout=60)
+
+    cache.set("a", get_value(10))
+    cache.set("b", get_value(10))
+    assert cache.get("a") is not None
+    cache.set("c", get_value(10))
+
+    # `b` is the least recently used entry
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.current_bytes == size * 2
+
+    # values larger than the cache are not stored
+    assert not cache.set("d", get_value(100))
+    assert cache.get("d") is None
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    assert cache.current_bytes == size
+
+
+def test_local_query_cache_timeout() -> None:
+    cache = LocalQueryCache(max_bytes=1024**2, default_timeout=60)
+    with freeze_time() as frozen_time:
+        cache.set("a", get_value(1))
+        cache.set("b", get_value(1), timeout=10)
+        cache.set("c", get_value(1), timeout=3600)
+        assert not cache.set("d", get_value(1), timeout=0)
+
+        frozen_time.tick(timedelta(seconds=30))
+        assert cache.get("a") is not None
+        # the timeout is capped by the remaining timeout in the cache backend
+        assert cache.get("b") is None
+
+        frozen_time.tick(timedelta(seconds=31))
+        assert cache.get("a") is None
+        # and by the local timeout
+        assert cache.get("c") is None
+        assert len(cache) == 0
+
+
+def test_query_cache_manager_local_cache(mocker: MockerFixture) -> None:
+    from superset.common.utils import query_cache_manager
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    stats_logger = mocker.patch.object(query_cache_manager, "stats_logger")
+    local_cache = LocalQueryCache(max_bytes=1024**2, default_timeout=60)
+    mocker.patch.dict(query_cache_manager._local_cache, {CacheRegion.DATA: local_cache})
+    backend = MagicMock()
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: backend})
+
+    backend.get.return_value = {
+        **get_value(3),
+        "dttm": datetime.utcnow().isoformat().split(".")[0],
+        "cache_timeout": 600,
+    }
+    first = QueryCacheManager.get("key", region=CacheRegion.DATA)
+    stats_logger.incr.assert_any_call("query_cache.data.backend_hit")
+    assert first.is_loaded
+
+    # the caller modifying the dataframe doesn't affect the cached one
+    first.df.columns = ["b"]
+    backend.get.reset_mock()
+    second = QueryCacheManager.get("key", region=CacheRegion.DATA)
+    backend.get.assert_not_called()
+    stats_logger.incr.assert_any_call("query_cache.data.local_hit")
+    assert list(second.df.columns) == ["a"]
+
+    # setting or deleting the key in the backend evicts the local copy
+    QueryCacheManager.set("key", get_value(1), region=CacheRegion.DATA)
+    assert local_cache.get("key") is None
+    QueryCacheManager.get("key", region=CacheRegion.DATA)
+    assert local_cache.get("key") is not None
+    QueryCacheManager.delete("key", region=CacheRegion.DATA)
+    assert local_cache.get("key") is None
+
+    backend.get.return_value = None
+    assert not QueryCacheManager.get("key", region=CacheRegion.DATA).is_loaded
+    stats_logger.incr.assert_any_call("query_cache.data.miss")
@@ -0,0 +1,91 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+
+
+@pytest.fixture
+def backend(mocker: MockerFixture) -> MagicMock:
+    """
+    A dict backed cache for the data region.
+    """
+    values: dict[str, Any] = {}
+    cache = MagicMock()
+    cache.get.side_effect = values.get
+    cache.set.side_effect = lambda key, value, timeout: values.update({key: value})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    )
+    return cache
+
+
+@pytest.mark.parametrize(
+    "enabled,timeout,hard_timeout",
+    [(False, 600, 600), (True, 600, 4200), (True, 0, 0)],
+)
+def test_stale_while_revalidate(
+    mocker: MockerFixture,
+    backend: MagicMock,
+    enabled: bool,
+    timeout: int,
+    hard_timeout: int,
+) -> None:
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager.config",
+        {
+            "STALE_WHILE_REVALIDATE_CONFIG": {
+                "ENABLED": enabled,
+                "GRACE_PERIOD": 3600,
+                "REFRESH_TIMEOUT": 300,
+            },
+        },
+    )
+    query_result = QueryResult(
+        df=pd.DataFrame({"a": [1]}),
+        query="SELECT 1",
+        duration=timedelta(0),
+        status=QueryStatus.SUCCESS,
+    )
+
+    with freeze_time("2024-01-01") as frozen_time:
+        QueryCacheManager().set_query_result(
+            key="key",
+            query_result=query_result,
+            timeout=timeout,
+            region=CacheRegion.DATA,
+        )
+        assert backend.set.call_args.kwargs["timeout"] == hard_timeout
+
+        cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+        assert cache.is_loaded
+        assert not cache.is_stale
+
+        frozen_time.tick(timedelta(seconds=601))
+        cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+        assert cache.is_stale is (enabled and timeout > 0)
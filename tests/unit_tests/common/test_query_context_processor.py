@@ -0,0 +1,381 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context_processor import QueryContextProcessor
+from superset.utils.core import GenericDataType
+
+
+def get_processor(
+    result_format: ChartDataResultFormat,
+    result_type: ChartDataResultType = ChartDataResultType.FULL,
+) -> QueryContextProcessor:
+    query_context = MagicMock()
+    query_context.result_format = result_format
+    query_context.result_type = result_type
+    query_context.datasource.data = {"verbose_map": {}}
+    return QueryContextProcessor(query_context)
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame({"name": ["=a", "b"], "value": [1, 2]})
+
+
+def test_get_data_csv(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Test that the CSV is built in full when streaming is disabled.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_STREAMING_EXPORT": False},
+    )
+    processor = get_processor(ChartDataResultFormat.CSV)
+
+    assert processor.get_data(df, []) == "name,value\n'=a,1\nb,2\n"
+
+
+def test_get_data_csv_streaming(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Test that the CSV is returned in chunks when streaming is enabled.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_STREAMING_EXPORT": True},
+    )
+    processor = get_processor(ChartDataResultFormat.CSV)
+
+    data = processor.get_data(df, [])
+    assert not isinstance(data, str)
+    assert "".join(data) == "name,value\n'=a,1\nb,2\n"  # type: ignore
+
+
+def test_get_data_csv_streaming_post_processed(
+    mocker: MockerFixture,
+    df: pd.DataFrame,
+) -> None:
+    """
+    Test that post-processed results are not streamed, since they're parsed again.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_STREAMING_EXPORT": True},
+    )
+    processor = get_processor(
+        ChartDataResultFormat.CSV,
+        ChartDataResultType.POST_PROCESSED,
+    )
+
+    assert processor.get_data(df, []) == "name,value\n'=a,1\nb,2\n"
+
+
+def test_get_data_xlsx_streaming(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Test that the Excel file is returned in chunks when streaming is enabled.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_STREAMING_EXPORT": True},
+    )
+    processor = get_processor(ChartDataResultFormat.XLSX)
+
+    data = processor.get_data(
+        df,
+        [GenericDataType.STRING, GenericDataType.NUMERIC],
+    )
+    assert not isinstance(data, bytes)
+    assert pd.read_excel(BytesIO(b"".join(data)), index_col=0).equals(df)  # type: ignore
+
+
+def test_get_df_payload_stale(mocker: MockerFixture, df: pd.DataFrame) -> None:
+    """
+    Test that stale results are served right away, and refreshed in the background.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    processor = get_processor(ChartDataResultFormat.JSON)
+    query_context = processor._query_context
+    query_context.force = False
+    query_context.get_cache_timeout.return_value = 600
+    query_context.form_data = {"slice_id": 1}
+    query_context.cache_values = {"datasource": {"id": 1, "type": "table"}}
+    query_context.custom_cache_timeout = None
+    mocker.patch.object(processor, "query_cache_key", return_value="key")
+    mocker.patch(
+        "superset.common.query_context_processor.get_user_id",
+        return_value=1,
+    )
+    security_manager = mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        new=MagicMock(),
+    )
+    security_manager.get_current_guest_user_if_guest.return_value = None
+    mocker.patch.object(
+        QueryCacheManager,
+        "get",
+        return_value=QueryCacheManager(
+            df=df,
+            is_loaded=True,
+            is_cached=True,
+            is_stale=True,
+        ),
+    )
+    mocker.patch.object(QueryCacheManager, "start_refresh", side_effect=[True, False])
+    load_chart_data_into_cache = mocker.patch(
+        "superset.tasks.async_queries.load_chart_data_into_cache"
+    )
+
+    payload = processor.get_df_payload(MagicMock())
+    assert payload["is_stale"]
+    assert payload["df"].equals(df)
+    load_chart_data_into_cache.delay.assert_called_once_with(
+        {"user_id": 1, "refresh": True},
+        {
+            "form_data": {"slice_id": 1},
+            "datasource": {"id": 1, "type": "table"},
+            "custom_cache_timeout": None,
+            "force": True,
+        },
+    )
+
+    # a refresh is already running
+    processor.get_df_payload(MagicMock())
+    load_chart_data_into_cache.delay.assert_called_once()
+
+
+def test_get_df_payload_stale_enqueue_error(
+    mocker: MockerFixture, df: pd.DataFrame
+) -> None:
+    """
+    Test that stale results are still served when their refresh can't be enqueued,
+    and that the refresh is retried by the next request.
+    """
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    processor = get_processor(ChartDataResultFormat.JSON)
+    query_context = processor._query_context
+    query_context.force = False
+    query_context.get_cache_timeout.return_value = 600
+    query_context.cache_values = {}
+    mocker.patch.object(processor, "query_cache_key", return_value="key")
+    mocker.patch("superset.common.query_context_processor.get_user_id")
+    mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        new=MagicMock(),
+    )
+    mocker.patch.object(
+        QueryCacheManager,
+        "get",
+        return_value=QueryCacheManager(
+            df=df,
+            is_loaded=True,
+            is_cached=True,
+            is_stale=True,
+        ),
+    )
+    start_refresh = mocker.patch.object(
+        QueryCacheManager, "start_refresh", return_value=True
+    )
+    cancel_refresh = mocker.patch.object(QueryCacheManager, "cancel_refresh")
+    load_chart_data_into_cache = mocker.patch(
+        "superset.tasks.async_queries.load_chart_data_into_cache"
+    )
+    load_chart_data_into_cache.delay.side_effect = ConnectionError()
+
+    payload = processor.get_df_payload(MagicMock())
+    assert payload["is_stale"]
+    assert payload["df"].equals(df)
+    cancel_refresh.assert_called_once_with(
+        "key", region=start_refresh.call_args[1]["region"]
+    )
+
+
+def test_get_max_concurrent_queries() -> None:
+    """
+    Test that the concurrency of the queries is set by the database.
+    """
+    processor = get_processor(ChartDataResultFormat.JSON)
+    datasource = processor._qc_datasource
+
+    datasource.database.max_concurrent_queries = 4
+    assert processor.get_max_concurrent_queries() == 4
+
+    datasource.database.max_concurrent_queries = 1
+    assert processor.get_max_concurrent_queries() == 1
+
+    datasource.database = None
+    assert processor.get_max_concurrent_queries() == 1
+
+
+def test_get_query_results_in_thread(mocker: MockerFixture) -> None:
+    """
+    Test that queries run in other threads use the datasource attached to the session
+    of the thread, without changing the shared query context.
+    """
+    from superset.common import query_context_processor
+
+    processor = get_processor(ChartDataResultFormat.JSON)
+    query_context = processor._query_context
+    datasource = processor._qc_datasource
+    query_obj = MagicMock(datasource=datasource)
+    get_query_results = mocker.patch.object(
+        query_context_processor, "get_query_results"
+    )
+    attach = mocker.patch.object(
+        query_context_processor,
+        "attach_to_thread_session",
+        side_effect=lambda instance: instance,
+    )
+
+    # the current thread
+    processor._get_query_results(ChartDataResultType.FULL, query_obj, False)
+    assert get_query_results.call_args.args[1:3] == (query_context, query_obj)
+
+    attach.side_effect = lambda instance: f"attached {instance}"
+    processor._get_query_results(ChartDataResultType.FULL, query_obj, False)
+    _, thread_query_context, thread_query_obj, _ = get_query_results.call_args.args
+    assert thread_query_context.datasource == f"attached {datasource}"
+    assert thread_query_context._processor._qc_datasource == f"attached {datasource}"
+    assert thread_query_obj.datasource == f"attached {datasource}"
+    assert query_context.datasource is datasource
+    assert query_obj.datasource is datasource
+
+
+def test_get_payload_concurrency(mocker: MockerFixture) -> None:
+    """
+    Test that queries and the queries of their time offsets, run concurrently, don't
+    exceed the concurrency of the database together.
+    """
+    import threading
+    import time
+
+    from superset.common import query_context_processor
+    from superset.utils.concurrency import run_concurrently
+
+    processor = get_processor(ChartDataResultFormat.JSON)
+    processor._qc_datasource.database.max_concurrent_queries = 2
+    processor._query_context.queries = [MagicMock() for _ in range(4)]
+    mocker.patch.object(
+        query_context_processor,
+        "attach_to_thread_session",
+        side_effect=lambda instance: instance,
+    )
+    lock = threading.Lock()
+    running = peak = 0
+
+    def get_df_payload() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    def get_query_results(*args: object) -> None:
+        # the query, then the queries of its time offsets
+        get_df_payload()
+        run_concurrently([get_df_payload] * 3, processor.get_max_concurrent_queries())
+
+    mocker.patch.object(
+        query_context_processor, "get_query_results", side_effect=get_query_results
+    )
+
+    processor.get_payload()
+    assert peak == 2
+
+
+def test_query_time_offsets_together(mocker: MockerFixture) -> None:
+    """
+    Test that time offsets are read by a single query when their ranges don't overlap.
+    """
+    from datetime import datetime
+
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.helpers import QueryResult
+    from superset.utils.core import TIME_OFFSET_ALIAS
+
+    processor = get_processor(ChartDataResultFormat.JSON)
+    datasource = mocker.MagicMock(spec=SqlaTable)
+    datasource.db_engine_spec.allows_combined_time_offsets = True
+    datasource.database.max_concurrent_queries = 1
+    datasource.query.return_value = QueryResult(
+        df=pd.DataFrame(
+            {
+                "ds": [datetime(2024, 1, 1), datetime(2024, 1, 8)],
+                "value": [1, 2],
+                TIME_OFFSET_ALIAS: ["1 week ago", "2 weeks ago"],
+            }
+        ),
+        query="SELECT 1",
+        duration=mocker.MagicMock(),
+    )
+    processor._qc_datasource = datasource
+    df = pd.DataFrame({"ds": [datetime(2024, 1, 15)], "value": [3]})
+    query_object = mocker.MagicMock(row_limit=10, row_offset=0, is_rowcount=False)
+    query_object.columns = [
+        {"label": "ds", "sqlExpression": "ds", "columnType": "BASE_AXIS"}
+    ]
+
+    def get_clone(from_dttm: datetime, to_dttm: datetime) -> MagicMock:
+        clone = mocker.MagicMock(from_dttm=from_dttm, to_dttm=to_dttm)
+        clone.to_dict.return_value = {"row_limit": 10}
+        return clone
+
+    results = processor._query_time_offsets(
+        df,
+        query_object,
+        {
+            "1 week ago": get_clone(datetime(2024, 1, 8), datetime(2024, 1, 15)),
+            "2 weeks ago": get_clone(datetime(2024, 1, 1), datetime(2024, 1, 8)),
+        },
+    )
+    datasource.query.assert_called_once()
+    assert datasource.query.call_args[0][0]["time_offset_ranges"] == {
+        "1 week ago": (datetime(2024, 1, 8), datetime(2024, 1, 15)),
+        "2 weeks ago": (datetime(2024, 1, 1), datetime(2024, 1, 8)),
+    }
+    assert results["1 week ago"][0].to_dict(orient="list") == {
+        "ds": [datetime(2024, 1, 1)],
+        "value": [1],
+    }
+    assert results["2 weeks ago"][0].to_dict(orient="list") == {
+        "ds": [datetime(2024, 1, 8)],
+        "value": [2],
+    }
+
+    # overlapping ranges are queried one by one
+    datasource.query.reset_mock()
+    processor._query_time_offsets(
+        df,
+        query_object,
+        {
+            "1 day ago": get_clone(datetime(2024, 1, 14), datetime(2024, 1, 21)),
+            "1 week ago": get_clone(datetime(2024, 1, 8), datetime(2024, 1, 15)),
+        },
+    )
+    assert datasource.query.call_count == 2
+    assert all(
+        "time_offset_ranges" not in call[0][0]
+        for call in datasource.query.call_args_list
+    )
@@ -0,0 +1,168 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.common.utils.single_flight import is_query_running, single_flight
+from superset.distributed_lock import KeyValueDistributedLock
+
+
+@pytest.fixture
+def single_flight_config(mocker: MockerFixture) -> dict[str, Any]:
+    config = {"ENABLED": True, "LOCK_TIMEOUT": 300, "POLL_INTERVAL": 0}
+    mocker.patch.dict(
+        "superset.common.utils.single_flight.config",
+        {"QUERY_SINGLE_FLIGHT_CONFIG": config},
+    )
+    mocker.patch(
+        "superset.common.utils.single_flight.QueryCacheManager.is_enabled",
+        return_value=True,
+    )
+    return config
+
+
+def test_single_flight_disabled(single_flight_config: dict[str, Any]) -> None:
+    single_flight_config["ENABLED"] = False
+    with single_flight("key") as cache:
+        assert cache is None
+        assert not is_query_running("key")
+
+
+def test_single_flight_leader(single_flight_config: dict[str, Any]) -> None:
+    """
+    Test that the first caller holds the lock while running the query.
+    """
+    with single_flight("key") as cache:
+        assert cache is None
+        assert is_query_running("key")
+        assert not is_query_running("other_key")
+
+    assert not is_query_running("key")
+
+
+def test_single_flight_coalesced(
+    mocker: MockerFixture,
+    single_flight_config: dict[str, Any],
+) -> None:
+    """
+    Test that concurrent callers get the result cached by the running query.
+    """
+    loaded_cache = MagicMock(is_loaded=True)
+    get = mocker.patch(
+        "superset.common.utils.single_flight.QueryCacheManager.get",
+        side_effect=[MagicMock(is_loaded=False), loaded_cache],
+    )
+
+    with KeyValueDistributedLock("query_single_flight", cache_key="key"):
+        with single_flight("key") as cache:
+            assert cache is loaded_cache
+
+    assert get.call_count == 2
+
+
+def test_single_flight_failed(
+    mocker: MockerFixture,
+    single_flight_config: dict[str, Any],
+) -> None:
+    """
+    Test that concurrent callers run the query when the running one didn't cache a
+    result.
+    """
+    mocker.patch(
+        "superset.common.utils.single_flight.QueryCacheManager.get",
+        return_value=MagicMock(is_loaded=False),
+    )
+    mocker.patch(
+        "superset.common.utils.single_flight.is_query_running",
+        side_effect=[True, False],
+    )
+    with KeyValueDistributedLock("query_single_flight", cache_key="key"):
+        with single_flight("key") as cache:
+            assert cache is None
+
+
+def test_single_flight_leader_failed(
+    mocker: MockerFixture,
+    single_flight_config: dict[str, Any],
+) -> None:
+    """
+    Test that concurrent callers stop waiting once the running query fails, and that
+    each poll reads the lock in a new transaction.
+    """
+    from superset import db
+
+    leader = ExitStack()
+    leader.enter_context(
+        KeyValueDistributedLock("query_single_flight", cache_key="key")
+    )
+
+    def get_cache(**kwargs: Any) -> MagicMock:
+        if get.call_count == 2:
+            # the query fails without caching a result, releasing the lock
+            leader.close()
+        return MagicMock(is_loaded=False)
+
+    get = mocker.patch(
+        "superset.common.utils.single_flight.QueryCacheManager.get",
+        side_effect=get_cache,
+    )
+    rollback = mocker.patch.object(db.session, "rollback")
+
+    with single_flight("key") as cache:
+        assert cache is None
+    assert get.call_count == 3
+    assert rollback.call_count == 2
+    assert not is_query_running("key")
+
+
+def test_single_flight_slow_leader(
+    mocker: MockerFixture,
+    single_flight_config: dict[str, Any],
+) -> None:
+    """
+    Test that concurrent callers keep waiting for a query running for longer than the
+    default expiration of locks, and that its lock doesn't expire meanwhile.
+    """
+    from superset.distributed_lock import LOCK_EXPIRATION
+
+    loaded_cache = MagicMock(is_loaded=True)
+    mocker.patch(
+        "superset.common.utils.single_flight.QueryCacheManager.get",
+        side_effect=[MagicMock(is_loaded=False)] * 100 + [loaded_cache],
+    )
+    is_query_running = mocker.patch(
+        "superset.common.utils.single_flight.is_query_running",
+        return_value=True,
+    )
+    with KeyValueDistributedLock("query_single_flight", cache_key="key"):
+        with single_flight("key") as cache:
+            assert cache is loaded_cache
+    assert is_query_running.call_count == 100
+
+    create_entry = mocker.patch("superset.daos.key_value.KeyValueDAO.create_entry")
+    with freeze_time("2024-01-01"):
+        with single_flight("other_key") as cache:
+            assert cache is None
+    expires_on = create_entry.call_args.kwargs["expires_on"]
+    assert expires_on == datetime(2024, 1, 1) + timedelta(seconds=300)
+    assert expires_on > datetime(2024, 1, 1) + LOCK_EXPIRATION
@@ -287,3 +287,66 @@ def test_normalize_prequery_result_type_custom_sql() -> None:
         sqla_table._normalize_prequery_result_type(row, dimension, columns_by_name)
         == "Car"
     )
+
+
+def test_query_time_offset_ranges(tmp_path) -> None:
+    """
+    Test that the rows of several time ranges are read by a single query.
+    """
+    from datetime import datetime
+
+    from superset.utils.core import TIME_OFFSET_ALIAS
+
+    uri = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(uri)
+    with engine.begin() as connection:
+        connection.execute("CREATE TABLE t (ds DATETIME, name TEXT, value INTEGER)")
+        connection.execute(
+            "INSERT INTO t VALUES "
+            "('2024-01-01 00:00:00', 'a', 1), "
+            "('2024-01-02 00:00:00', 'a', 2), "
+            "('2024-01-08 00:00:00', 'a', 4), "
+            "('2024-01-15 00:00:00', 'b', 8), "
+            "('2024-02-01 00:00:00', 'b', 16)"
+        )
+
+    database = Database(database_name="my_db", sqlalchemy_uri=uri)
+    sqla_table = SqlaTable(
+        table_name="t",
+        columns=[
+            TableColumn(column_name="ds", type="DATETIME", is_dttm=True),
+            TableColumn(column_name="name", type="TEXT"),
+            TableColumn(column_name="value", type="INTEGER"),
+        ],
+        metrics=[],
+        database=database,
+    )
+    query_obj: QueryObjectDict = {
+        "granularity": "ds",
+        "from_dttm": None,
+        "to_dttm": None,
+        "groupby": ["name"],
+        "metrics": [
+            {
+                "expressionType": "SQL",
+                "sqlExpression": "SUM(value)",
+                "label": "sum",
+            }
+        ],
+        "is_timeseries": False,
+        "filter": [],
+        "time_offset_ranges": {
+            "1 week ago": (datetime(2024, 1, 1), datetime(2024, 1, 8)),
+            "2 weeks ago": (datetime(2024, 1, 8), datetime(2024, 1, 15)),
+        },
+    }
+
+    result = sqla_table.query(query_obj)
+
+    assert result.status == "success"
+    assert "CASE WHEN" in result.query
+    df = result.df.sort_values(TIME_OFFSET_ALIAS).reset_index(drop=True)
+    assert df.to_dict(orient="records") == [
+        {"name": "a", "sum": 3, TIME_OFFSET_ALIAS: "1 week ago"},
+        {"name": "a", "sum": 4, TIME_OFFSET_ALIAS: "2 weeks ago"},
+    ]
@@ -0,0 +1,236 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+import gzip
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from cachelib import SimpleCache
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.utils import json
+
+VERSION = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def bootstrap(mocker: MockerFixture) -> Any:
+    """
+    Mock the dependencies of the bootstrap bundles, and enable their cache.
+    """
+    from superset.dashboards import bootstrap
+
+    cache_manager = mocker.patch("superset.dashboards.bootstrap.cache_manager")
+    cache_manager.cache = SimpleCache()
+    mocker.patch.object(bootstrap, "get_version", return_value=VERSION)
+    mocker.patch.object(bootstrap, "get_permission_fingerprint", return_value="abc")
+    mocker.patch.object(
+        bootstrap,
+        "build",
+        side_effect=lambda dashboard: {"dashboard": {"id": dashboard.id}},
+    )
+    mocker.patch.object(bootstrap, "_add_user")
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "DASHBOARD_BOOTSTRAP_CONFIG": {
+                "ENABLED": True,
+                "CACHE_TIMEOUT": 60,
+                "REBUILD_ON_CHANGE": True,
+            }
+        },
+    )
+    return bootstrap
+
+
+def test_get_bootstrap(bootstrap: Any) -> None:
+    """
+    Test that bundles are built once, and stored gzipped.
+    """
+    dashboard = MagicMock(id=1)
+
+    first = bootstrap.get_bootstrap(dashboard)
+    second = bootstrap.get_bootstrap(dashboard)
+
+    assert bootstrap.build.call_count == 1
+    assert json.loads(gzip.decompress(first.payload)) == {
+        "result": {"dashboard": {"id": 1}}
+    }
+    assert second.payload == first.payload
+    assert second.etag == first.etag
+    assert first.last_modified == VERSION
+    bootstrap._add_user.assert_called_once_with(1, "abc")
+
+
+def test_get_bootstrap_versions(bootstrap: Any) -> None:
+    """
+    Test that bundles are rebuilt when the dashboard or the user's roles change.
+    """
+    dashboard = MagicMock(id=1)
+    etag = bootstrap.get_bootstrap(dashboard).etag
+
+    bootstrap.get_permission_fingerprint.return_value = "def"
+    assert bootstrap.get_bootstrap(dashboard).etag != etag
+    assert bootstrap.build.call_count == 2
+
+    bootstrap.get_version.return_value = datetime(2024, 1, 2)
+    assert bootstrap.get_bootstrap(dashboard).etag != etag
+    assert bootstrap.build.call_count == 3
+
+
+def test_get_bootstrap_disabled(bootstrap: Any) -> None:
+    """
+    Test that bundles are built on each request when their cache is disabled.
+    """
+    current_app.config["DASHBOARD_BOOTSTRAP_CONFIG"]["ENABLED"] = False
+    dashboard = MagicMock(id=1)
+
+    bootstrap.get_bootstrap(dashboard)
+    bootstrap.get_bootstrap(dashboard)
+
+    assert bootstrap.build.call_count == 2
+    bootstrap._add_user.assert_not_called()
+
+
+def test_rebuild(mocker: MockerFixture, bootstrap: Any) -> None:
+    """
+    Test that bundles are rebuilt as the users who requested them.
+    """
+    mocker.patch(
+        "superset.models.dashboard.Dashboard.get", return_value=MagicMock(id=1)
+    )
+    find_user = mocker.patch.object(
+        bootstrap.security_manager,
+        "find_user",
+        side_effect=lambda username: None if username == "deleted" else MagicMock(),
+    )
+    bootstrap.cache_manager.cache.set(
+        bootstrap.get_users_cache_key(1),
+        {"abc": "admin", "def": "gamma", "ghi": "deleted"},
+    )
+
+    # the fingerprint of gamma changed since it requested the dashboard
+    assert bootstrap.rebuild(1) == 1
+    assert find_user.call_count == 3
+    assert bootstrap.cache_manager.cache.has(bootstrap.get_cache_key(1, VERSION, "abc"))
+    assert not bootstrap.cache_manager.cache.has(
+        bootstrap.get_cache_key(1, VERSION, "def")
+    )
+
+
+def test_rebuild_on_commit(mocker: MockerFixture) -> None:
+    """
+    Test that the dashboards changed by a session are rebuilt once it's committed.
+    """
+    from superset.dashboards import bootstrap
+
+    delay = mocker.patch(
+        "superset.tasks.dashboard_bootstrap.rebuild_dashboard_bootstrap.delay"
+    )
+    session = MagicMock(info={bootstrap.SESSION_INFO_KEY: {1, 2}})
+
+    bootstrap.on_commit(session)
+    assert sorted(call.kwargs["dashboard_id"] for call in delay.call_args_list) == [
+        1,
+        2,
+    ]
+    assert bootstrap.SESSION_INFO_KEY not in session.info
+
+    session.info[bootstrap.SESSION_INFO_KEY] = {3}
+    bootstrap.on_rollback(session)
+    bootstrap.on_commit(session)
+    assert delay.call_count == 2
+
+
+def test_rebuild_on_commit_broker_error(mocker: MockerFixture) -> None:
+    """
+    Test that failing to schedule a rebuild doesn't prevent the others, nor raise.
+    """
+    from superset.dashboards import bootstrap
+
+    delay = mocker.patch(
+        "superset.tasks.dashboard_bootstrap.rebuild_dashboard_bootstrap.delay",
+        side_effect=[ConnectionError(), None],
+    )
+    logger = mocker.patch.object(bootstrap, "logger")
+    session = MagicMock(info={bootstrap.SESSION_INFO_KEY: {1, 2}})
+
+    bootstrap.on_commit(session)
+    assert delay.call_count == 2
+    logger.exception.assert_called_once()
+
+
+def test_get_permission_fingerprint(mocker: MockerFixture) -> None:
+    """
+    Test that the fingerprint depends on the roles of the user, not their order.
+    """
+    from superset.dashboards import bootstrap
+
+    admin, gamma = MagicMock(), MagicMock()
+    admin.name, gamma.name = "Admin", "Gamma"
+    get_user_roles = mocker.patch.object(
+        bootstrap.security_manager, "get_user_roles", return_value=[admin, gamma]
+    )
+    mocker.patch.object(bootstrap.security_manager, "is_guest_user", return_value=False)
+
+    fingerprint = bootstrap.get_permission_fingerprint()
+    get_user_roles.return_value = [gamma, admin]
+    assert bootstrap.get_permission_fingerprint() == fingerprint
+    get_user_roles.return_value = [gamma]
+    assert bootstrap.get_permission_fingerprint() != fingerprint
+
+
+def test_get_bootstrap_api(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test that the bundle is served gzipped, and supports conditional requests.
+    """
+    from superset.dashboards.bootstrap import DashboardBootstrap
+
+    mocker.patch("superset.dashboards.api.DashboardDAO.get_by_id_or_slug")
+    payload = json.dumps({"result": {"dashboard": {"id": 1}}}).encode()
+    mocker.patch(
+        "superset.dashboards.api.get_bootstrap",
+        return_value=DashboardBootstrap(
+            payload=gzip.compress(payload),
+            etag="abc",
+            last_modified=VERSION,
+        ),
+    )
+
+    response = client.get("/api/v1/dashboard/1/bootstrap")
+    assert response.status_code == 200
+    assert response.json == {"result": {"dashboard": {"id": 1}}}
+    assert response.headers["ETag"] == '"abc"'
+
+    response = client.get(
+        "/api/v1/dashboard/1/bootstrap", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.data) == payload
+
+    response = client.get(
+        "/api/v1/dashboard/1/bootstrap", headers={"If-None-Match": '"abc"'}
+    )
+    assert response.status_code == 304
@@ -380,3 +380,66 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+def test_fetch_data_columnar_mutators(mocker: MockerFixture) -> None:
+    """
+    Test that columns are mutated as a whole when the results are fetched in a
+    columnar format, falling back to the value by value mutators.
+    """
+    import pyarrow.compute as pc
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class MutatingEngineSpec(BaseEngineSpec):
+        column_type_mutators = {
+            types.String: str.upper,
+            types.Integer: lambda val: val * 10,
+        }
+        column_type_vectorized_mutators = {
+            types.Integer: lambda values: pc.multiply(values, 2),
+        }
+
+    cursor = mocker.MagicMock()
+    cursor.description = [
+        ("id", "INTEGER"),
+        ("name", "VARCHAR"),
+        ("value", "FLOAT"),
+    ]
+    cursor.fetchall.return_value = [(1, "a", 1.5), (2, "b", None)]
+
+    table = MutatingEngineSpec.fetch_data_columnar(cursor)
+
+    assert table.to_pylist() == [
+        {"id": 2, "name": "A", "value": 1.5},
+        {"id": 4, "name": "B", "value": None},
+    ]
+    assert BaseEngineSpec.fetch_data_columnar(cursor) is None
+
+
+def test_fetch_data_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that the results are fetched in chunks, up to the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = [(i,) for i in range(10)]
+
+    def fetchmany(size: int) -> list[tuple[int]]:
+        chunk = rows[: min(size, 3)]  # the driver can return fewer rows
+        del rows[: len(chunk)]
+        return chunk
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER")]
+    cursor.fetchmany.side_effect = fetchmany
+
+    chunks = list(BaseEngineSpec.fetch_data_chunks(cursor, 4, limit=8))
+    assert chunks == [
+        [(0,), (1,), (2,)],
+        [(3,), (4,), (5,)],
+        [(6,), (7,)],
+    ]
+    cursor.fetchall.assert_not_called()
+
+    assert list(BaseEngineSpec.fetch_data_chunks(cursor, 4)) == [[(8,), (9,)]]
@@ -127,3 +127,16 @@ def test_get_parameters_from_uri() -> None:
 
     assert parameters["database"] == "md:my_db"
     assert parameters["access_token"] == "token"
+
+
+def test_fetch_data_columnar(mocker: MockerFixture) -> None:
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    table = pa.Table.from_pydict({"a": [1, 2]})
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_table.return_value = table
+
+    assert DuckDBEngineSpec.fetch_data_columnar(cursor) is table
+    assert DuckDBEngineSpec.fetch_data_columnar(object()) is None
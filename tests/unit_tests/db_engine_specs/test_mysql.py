@@ -262,3 +262,79 @@ def test_column_type_mutator(
     mock_cursor.description = description
 
     assert spec.fetch_data(mock_cursor) == expected_result
+
+
+@pytest.mark.parametrize(
+    "data,expected_result",
+    [
+        (
+            [("1.23456", "abc"), (None, "def"), ("-10.5", "ghi")],
+            [
+                {"dec": Decimal("1.23456"), "str": "abc"},
+                {"dec": None, "str": "def"},
+                {"dec": Decimal("-10.50000"), "str": "ghi"},
+            ],
+        ),
+        (
+            [(Decimal("1.23456"), "abc")],
+            [{"dec": Decimal("1.23456"), "str": "abc"}],
+        ),
+        (
+            [("1" * 40 + ".5", "abc")],
+            [{"dec": Decimal("1" * 40 + ".5"), "str": "abc"}],
+        ),
+    ],
+)
+def test_column_type_vectorized_mutator(
+    data: list[tuple[Any, ...]],
+    expected_result: list[dict[str, Any]],
+):
+    from superset.db_engine_specs.mysql import MySQLEngineSpec as spec
+
+    mock_cursor = Mock()
+    mock_cursor.fetchall.return_value = data
+    mock_cursor.description = [("dec", "decimal(12,6)"), ("str", "varchar(3)")]
+
+    assert spec.fetch_data_columnar(mock_cursor).to_pylist() == expected_result
+
+
+def test_column_type_vectorized_mutator_not_mutated() -> None:
+    from superset.db_engine_specs.mysql import MySQLEngineSpec as spec
+
+    mock_cursor = Mock()
+    mock_cursor.description = [("str", "varchar(3)")]
+
+    assert spec.fetch_data_columnar(mock_cursor) is None
+    mock_cursor.fetchall.assert_not_called()
+
+
+def test_get_schema_columns() -> None:
+    from sqlalchemy.dialects.mysql import dialect
+
+    from superset.db_engine_specs.mysql import MySQLEngineSpec as spec
+
+    inspector = Mock()
+    inspector.dialect = dialect()
+    inspector.bind.execute.return_value = [
+        ("events", "id", "bigint(20) unsigned", "NO", ""),
+        ("events", "name", "varchar(255)", "YES", "The name"),
+        ("users", "created", "datetime", "YES", ""),
+    ]
+
+    columns = spec.get_schema_columns(inspector, "analytics")
+
+    assert inspector.bind.execute.call_args[1] == {"schema": "analytics"}
+    assert list(columns) == ["events", "users"]
+    assert [
+        (
+            col["column_name"],
+            col["type"].compile(dialect=inspector.dialect),
+            col["nullable"],
+            col["comment"],
+        )
+        for col in columns["events"]
+    ] == [
+        ("id", "BIGINT(20) UNSIGNED", False, None),
+        ("name", "VARCHAR(255)", True, "The name"),
+    ]
+    assert columns["users"][0]["type"].compile(dialect=inspector.dialect) == "DATETIME"
@@ -99,3 +99,18 @@ def test_key_value_distributed_lock_expired() -> None:
                 assert _get_lock(MAIN_KEY, session) is None
 
         assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_key_value_distributed_lock_released_on_error() -> None:
+    """
+    Test that the distributed lock is released when the block raises.
+    """
+    session = _get_other_session()
+
+    with freeze_time("2021-01-01"):
+        with pytest.raises(ValueError):
+            with KeyValueDistributedLock("ns", a=1, b=2):
+                assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+                raise ValueError("Query failed")
+
+        assert _get_lock(MAIN_KEY, session) is None
@@ -18,6 +18,7 @@
 # pylint: disable=import-outside-toplevel
 
 from datetime import datetime
+from typing import Any
 
 import pytest
 from pytest_mock import MockerFixture
@@ -393,6 +394,134 @@ def test_get_sqla_engine_user_impersonation_email(mocker: MockerFixture) -> None
     )
 
 
+@pytest.fixture
+def engine_pool_config(mocker: MockerFixture) -> dict[str, Any]:
+    from superset.databases.engine_cache import engine_cache
+
+    pool_config = {
+        "ENABLED": True,
+        "POOL_SIZE": 1,
+        "MAX_OVERFLOW": 0,
+        "POOL_TIMEOUT": 1,
+        "POOL_RECYCLE": 3600,
+        "POOL_PRE_PING": True,
+        "MAX_ENGINES": 2,
+    }
+    for module in ("models.core", "databases.engine_cache"):
+        mocker.patch.dict(
+            f"superset.{module}.config",
+            {"DATABASE_ENGINE_POOL_CONFIG": pool_config},
+        )
+    mocker.patch("superset.daos.database.DatabaseDAO.get_ssh_tunnel", return_value=None)
+    yield pool_config
+    engine_cache.clear()
+
+
+def test_get_sqla_engine_pooled(
+    mocker: MockerFixture,
+    engine_pool_config: dict[str, Any],
+) -> None:
+    """
+    Test that engines are cached and pooled when engine pooling is enabled.
+    """
+    from superset.databases.engine_cache import InstrumentedQueuePool
+
+    stats_logger = mocker.patch("superset.databases.engine_cache.stats_logger")
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+
+    with database.get_sqla_engine() as engine:
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        assert engine.pool.size() == 1
+        with engine.connect() as connection:
+            assert connection.execute("SELECT 1").scalar() == 1
+
+    stats_logger.timing.assert_called_with(
+        "engine_pool.database_1.checkout", mocker.ANY
+    )
+    stats_logger.gauge.assert_any_call("engine_pool.database_1.saturation", 1.0)
+
+    with database.get_sqla_engine() as other_engine:
+        assert other_engine is engine
+
+    # different users use different engines
+    mocker.patch.object(database, "get_effective_user", return_value="alice")
+    with database.get_sqla_engine() as other_engine:
+        assert other_engine is not engine
+
+    # explicitly requesting a null pool bypasses the cache
+    with database.get_sqla_engine(nullpool=True) as other_engine:
+        assert other_engine is not engine
+        assert not isinstance(other_engine.pool, InstrumentedQueuePool)
+
+    engine_pool_config["ENABLED"] = False
+    with database.get_sqla_engine() as other_engine:
+        assert other_engine is not engine
+
+
+def test_get_sqla_engine_pooled_invalidation(
+    mocker: MockerFixture,
+    engine_pool_config: dict[str, Any],
+) -> None:
+    """
+    Test that pooled engines are disposed of when the database changes.
+    """
+    from superset.databases.engine_cache import dispose_database_engines, engine_cache
+
+    database = Database(
+        id=1,
+        database_name="my_db",
+        sqlalchemy_uri="sqlite://",
+        changed_on=datetime(2024, 1, 1),
+    )
+    with database.get_sqla_engine() as engine:
+        pass
+    dispose = mocker.spy(engine, "dispose")
+
+    # edited through another worker
+    database.changed_on = datetime(2024, 1, 2)
+    with database.get_sqla_engine() as other_engine:
+        assert other_engine is not engine
+    dispose.assert_called_once()
+    assert len(engine_cache) == 1
+
+    dispose_database_engines(None, None, database)
+    assert len(engine_cache) == 0
+
+    # engines are evicted in LRU order
+    for username in ("alice", "bob", "charlie"):
+        mocker.patch.object(database, "get_effective_user", return_value=username)
+        with database.get_sqla_engine():
+            pass
+    assert len(engine_cache) == 2
+
+
+def test_get_raw_connection_pooled_schemas(
+    mocker: MockerFixture,
+    engine_pool_config: dict[str, Any],
+) -> None:
+    """
+    Test that pooled connections whose session was set to a schema by pre-session
+    queries are not reused for another schema, or for no schema.
+    """
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    mocker.patch.object(
+        database.db_engine_spec,
+        "get_prequeries",
+        side_effect=lambda catalog=None, schema=None: (
+            [f"SELECT '{schema}'"] if schema else []
+        ),
+    )
+
+    def get_dbapi_connection(schema: str | None) -> Any:
+        with database.get_raw_connection(schema=schema) as conn:
+            return conn.dbapi_connection
+
+    connection = get_dbapi_connection("a")
+    assert get_dbapi_connection("a") is connection
+    assert get_dbapi_connection("b") is not connection
+    assert get_dbapi_connection(None) is not connection
+
+
 def test_is_oauth2_enabled() -> None:
     """
     Test the `is_oauth2_enabled` method.
@@ -21,6 +21,7 @@ from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
@@ -164,3 +165,87 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_columnar_ingestion() -> None:
+    """
+    Test that the columnar ingestion path produces the same table as the row one.
+    """
+    data = [
+        (1, 1.5, "a", datetime(2023, 1, 1, tzinfo=timezone.utc), [1, 2], {"a": 1}),
+        (2, None, None, datetime(2023, 1, 2, tzinfo=timezone.utc), [3, 4], None),
+        (3, 3.5, "c", None, None, {"b": [1]}),
+    ]
+    description = [
+        ("id", "int", None, None, None, None, False),
+        ("value", "float", None, None, None, None, True),
+        ("name", "varchar", None, None, None, None, True),
+        ("ts", "timestamp", None, None, None, None, True),
+        ("list", "array", None, None, None, None, True),
+        ("obj", "json", None, None, None, None, True),
+    ]
+
+    rows = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+    columnar = SupersetResultSet(
+        data,
+        description,  # type: ignore
+        BaseEngineSpec,
+        columnar=True,
+    )
+
+    assert columnar.pa_table.equals(rows.pa_table)
+    assert columnar.columns == rows.columns
+    assert columnar.to_pandas_df().equals(rows.to_pandas_df())
+
+
+def test_columnar_ingestion_empty() -> None:
+    """
+    Test that an empty result has no columns in the columnar ingestion path.
+    """
+    description = [("id", "int", None, None, None, None, False)]
+    result_set = SupersetResultSet(
+        [],
+        description,  # type: ignore
+        BaseEngineSpec,
+        columnar=True,
+    )
+    assert result_set.size == 0
+    assert result_set.columns == []
+
+
+def test_arrow_table_ingestion() -> None:
+    """
+    Test that results fetched natively as an Arrow table are used as-is.
+    """
+    table = pa.Table.from_pydict(
+        {
+            "id": [1, 2],
+            "id_": [3, 4],
+            "tags": [["a"], ["b", "c"]],
+        }
+    )
+    description = [
+        ("id", "int", None, None, None, None, False),
+        ("ID", "int", None, None, None, None, False),
+        ("tags", "array", None, None, None, None, True),
+    ]
+    result_set = SupersetResultSet(table, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.column_names == ["id", "ID", "tags"]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2],
+        "ID": [3, 4],
+        "tags": ['["a"]', '["b", "c"]'],
+    }
+    assert [column["type"] for column in result_set.columns] == ["INT", "INT", "ARRAY"]
+
+
+def test_arrow_table_ingestion_without_description() -> None:
+    """
+    Test that the column names are taken from the Arrow table without a description.
+    """
+    table = pa.Table.from_pydict({"a": [1], "b": ["x"]})
+    result_set = SupersetResultSet(table, None, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.column_names == ["a", "b"]
+    assert [column["type"] for column in result_set.columns] == ["INT", "STRING"]
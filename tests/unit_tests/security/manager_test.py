@@ -22,6 +22,7 @@ import json
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
 
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import Database, SqlaTable
@@ -979,3 +980,53 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_doris_connection_pool(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that connections to the Doris store are pooled and pinged before reuse.
+    """
+    mocker.patch.dict(
+        appbuilder.app.config,
+        {
+            "DORIS_HOST": "doris",
+            "DORIS_USER": "user",
+            "DORIS_PASSWORD": "password",
+            "DORIS_POOL_CONFIG": {
+                "POOL_SIZE": 1,
+                "MAX_OVERFLOW": 0,
+                "TIMEOUT": 0.1,
+                "RECYCLE": 3600,
+                "CONNECT_TIMEOUT": 1,
+            },
+        },
+    )
+    connect = mocker.patch("mysql.connector.connect")
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(appbuilder.app.config, {"STATS_LOGGER": stats_logger})
+    sm = SupersetSecurityManager(appbuilder)
+
+    with sm.doris_connection() as connection:
+        connection.cursor().execute("SELECT 1")
+        # the pool is exhausted
+        with pytest.raises(SQLAlchemyTimeoutError):
+            sm.get_doris_connection()
+
+    with sm.doris_connection():
+        pass
+
+    connect.assert_called_once_with(
+        host="doris",
+        port=9030,
+        user="user",
+        password="password",
+        database="studio",
+        connection_timeout=1,
+    )
+    connect.return_value.ping.assert_called_once_with(False)
+    stats_logger.timing.assert_any_call("doris_pool.wait", mocker.ANY)
+
+    with pytest.raises(ValueError):
+        with sm.doris_connection():
+            raise ValueError()
+    connect.return_value.rollback.assert_called()
@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=protected-access
+
+import sqlglot
+from pytest_mock import MockerFixture
+
+from superset.sql.parse import SQLScript, SQLStatement, Table
+from superset.sql.parse_cache import SQLParseCache
+
+SCRIPT = "INSERT INTO foo SELECT * FROM bar; SELECT * FROM baz.qux"
+
+
+def test_parse_cache(mocker: MockerFixture) -> None:
+    """
+    Test that scripts are only parsed once, and that their ASTs are not shared.
+    """
+    mocker.patch("superset.sql.parse_cache._local_cache", SQLParseCache(10))
+    parse = mocker.patch("superset.sql.parse.sqlglot.parse", wraps=sqlglot.parse)
+
+    first = SQLScript(SCRIPT, "postgresql")
+    second = SQLScript(SCRIPT, "postgresql")
+
+    assert parse.call_count == 1
+    assert [statement.tables for statement in second.statements] == [
+        {Table("bar")},
+        {Table("qux", "baz")},
+    ]
+    assert [statement.is_mutating() for statement in second.statements] == [
+        True,
+        False,
+    ]
+    assert second.format() == first.format()
+    assert second.statements[0]._parsed is not first.statements[0]._parsed
+
+    # different engine
+    SQLScript(SCRIPT, "mysql")
+    assert parse.call_count == 2
+
+
+def test_parse_cache_statement(mocker: MockerFixture) -> None:
+    """
+    Test that the tables of a cached statement are not extracted again.
+    """
+    mocker.patch("superset.sql.parse_cache._local_cache", SQLParseCache(10))
+    extract_tables = mocker.patch.object(
+        SQLStatement,
+        "_extract_tables_from_statement",
+        wraps=SQLStatement._extract_tables_from_statement,
+    )
+
+    SQLStatement("SELECT * FROM baz.qux", "postgresql")
+    assert extract_tables.call_count == 1
+
+    statement = SQLStatement("SELECT * FROM baz.qux", "postgresql")
+    assert extract_tables.call_count == 1
+    assert statement.tables == {Table("qux", "baz")}
+    assert not statement.is_mutating()
+
+
+def test_parse_cache_lru() -> None:
+    """
+    Test that the least recently used scripts are evicted.
+    """
+    cache = SQLParseCache(2)
+    cache.set("a", [])
+    cache.set("b", [])
+    cache.get("a")
+    cache.set("c", [])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == []
+    assert len(cache) == 2
+
+
+def test_parse_cache_shared(mocker: MockerFixture) -> None:
+    """
+    Test that parsed scripts are shared through the shared cache.
+    """
+    local_cache = SQLParseCache(10)
+    mocker.patch("superset.sql.parse_cache._local_cache", local_cache)
+    parse = mocker.patch("superset.sql.parse.sqlglot.parse", wraps=sqlglot.parse)
+    values: dict[str, object] = {}
+    shared_cache = mocker.patch("superset.extensions.cache_manager").sql_parse_cache
+    shared_cache.get.side_effect = values.get
+    shared_cache.set.side_effect = values.__setitem__
+
+    first = SQLScript(SCRIPT, "postgresql")
+    local_cache.clear()
+    second = SQLScript(SCRIPT, "postgresql")
+
+    assert parse.call_count == 1
+    assert len(values) == 1
+    assert [statement.tables for statement in second.statements] == [
+        statement.tables for statement in first.statements
+    ]
+    assert second.statements[0].is_mutating()
+    assert second.format() == first.format()
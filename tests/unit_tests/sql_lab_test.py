@@ -70,7 +70,12 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
         "SELECT 42 AS answer LIMIT 2",
         query,
     )
-    SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
+    SupersetResultSet.assert_called_with(
+        [(42,)],
+        cursor.description,
+        db_engine_spec,
+        columnar=False,
+    )
 
 
 def test_execute_sql_statement_with_rls(
@@ -122,7 +127,12 @@ def test_execute_sql_statement_with_rls(
         "SELECT * FROM sales WHERE organization_id=42 LIMIT 101",
         query,
     )
-    SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
+    SupersetResultSet.assert_called_with(
+        [(42,)],
+        cursor.description,
+        db_engine_spec,
+        columnar=False,
+    )
 
 
 def test_sql_lab_insert_rls_as_subquery(
@@ -280,3 +290,234 @@ def test_get_sql_results_oauth2(mocker: MockerFixture, app) -> None:
             }
         ],
     }
+
+
+def test_read_ipc_batches(mocker: MockerFixture) -> None:
+    """
+    Test that only the batches of the requested rows are read.
+    """
+    import pyarrow as pa
+    import pytest
+    from cachelib import SimpleCache
+
+    from superset.exceptions import SerializationError
+    from superset.sqllab.utils import (
+        read_ipc_batches,
+        store_ipc_batches,
+        write_ipc_batches,
+    )
+
+    results_backend = SimpleCache()
+    mocker.patch("superset.sqllab.utils.results_backend", results_backend)
+    get_many = mocker.spy(results_backend, "get_many")
+
+    table = pa.table({"a": list(range(10))})
+    batches = write_ipc_batches(table, 4)
+    assert len(batches) == 3
+    store_ipc_batches("key", batches, 60)
+
+    assert read_ipc_batches("key", 4, 3).column("a").to_pylist() == list(range(10))
+    assert read_ipc_batches("key", 4, 3, 0, 3).column("a").to_pylist() == [0, 1, 2]
+    get_many.assert_called_with("key-0")
+    assert read_ipc_batches("key", 4, 3, 3, 3).column("a").to_pylist() == [3, 4, 5]
+    get_many.assert_called_with("key-0", "key-1")
+    assert read_ipc_batches("key", 4, 3, 8).column("a").to_pylist() == [8, 9]
+    get_many.assert_called_with("key-2")
+
+    # past the end of the results
+    empty = read_ipc_batches("key", 4, 3, 20, 5)
+    assert empty.num_rows == 0
+    assert empty.schema == table.schema
+
+    results_backend.delete("key-1")
+    with pytest.raises(SerializationError):
+        read_ipc_batches("key", 4, 3, 3, 3)
+
+
+def test_write_ipc_batches_empty() -> None:
+    """
+    Test that the schema of empty results is kept in a batch.
+    """
+    import pyarrow as pa
+
+    from superset.sqllab.utils import write_ipc_batches
+
+    table = pa.table({"a": pa.array([], pa.int64())})
+    batches = write_ipc_batches(table, 4)
+    assert len(batches) == 1
+    assert pa.ipc.open_stream(batches[0]).read_all().schema == table.schema
+
+
+def test_deserialize_results_payload_page(mocker: MockerFixture) -> None:
+    """
+    Test that a page of batched results is deserialized.
+    """
+    import msgpack
+    import pyarrow as pa
+    from cachelib import SimpleCache
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sqllab.utils import store_ipc_batches, write_ipc_batches
+    from superset.views.utils import _deserialize_results_payload
+
+    mocker.patch("superset.sqllab.utils.results_backend", SimpleCache())
+    store_ipc_batches("key", write_ipc_batches(pa.table({"a": range(10)}), 4), 60)
+    payload = msgpack.dumps(
+        {
+            "data": None,
+            "batch_rows": 4,
+            "batch_count": 3,
+            "selected_columns": [{"name": "a", "type": "INT", "is_dttm": False}],
+            "query": {"resultsKey": "key"},
+        }
+    )
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = BaseEngineSpec
+
+    obj = _deserialize_results_payload(payload, query, True, offset=5, limit=2)
+    assert obj["data"] == [{"a": 5}, {"a": 6}]
+    assert "batch_rows" not in obj
+
+
+def test_ipc_batch_writer(mocker: MockerFixture) -> None:
+    """
+    Test that chunks of results are stored in batches as they're written.
+    """
+    from cachelib import SimpleCache
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sqllab.utils import IPCBatchWriter, read_ipc_batches
+
+    results_backend = SimpleCache()
+    mocker.patch("superset.sqllab.utils.results_backend", results_backend)
+    description = [
+        ("a", "INT", None, None, None, None, None),
+        ("b", None, None, None, None, None, None),
+    ]
+
+    writer = IPCBatchWriter("key", 4, 60)
+    writer.write(
+        SupersetResultSet(
+            [(0, None), (1, None), (2, None)],
+            description,  # type: ignore
+            BaseEngineSpec,
+        )
+    )
+    assert writer.batch_count == 0
+    writer.write(
+        SupersetResultSet(
+            [(3, None), (4, "x"), (5, "y")],
+            description,  # type: ignore
+            BaseEngineSpec,
+        )
+    )
+    assert writer.batch_count == 1
+    assert results_backend.has("key-0")
+    writer.write(
+        SupersetResultSet(
+            [(6, "z"), (7, None), (8, None)],
+            description,  # type: ignore
+            BaseEngineSpec,
+        )
+    )
+    writer.close()
+
+    assert writer.rows == 9
+    assert writer.batch_count == 3
+    assert [(column["column_name"], column["type"]) for column in writer.columns] == [
+        ("a", "INT"),
+        ("b", "STRING"),
+    ]
+    table = read_ipc_batches("key", 4, 3)
+    assert table.column("a").to_pylist() == list(range(9))
+    assert table.column("b").to_pylist() == [None] * 4 + ["x", "y", "z", None, None]
+
+
+def test_ipc_batch_writer_empty(mocker: MockerFixture) -> None:
+    """
+    Test that empty results are stored in a single batch.
+    """
+    from cachelib import SimpleCache
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sqllab.utils import IPCBatchWriter, read_ipc_batches
+
+    mocker.patch("superset.sqllab.utils.results_backend", SimpleCache())
+
+    writer = IPCBatchWriter("key", 4, 60)
+    writer.write(SupersetResultSet([], [("a", "INT")], BaseEngineSpec))  # type: ignore
+    writer.close()
+
+    assert writer.rows == 0
+    assert writer.batch_count == 1
+    assert read_ipc_batches("key", 4, 1).num_rows == 0
+
+
+def test_concat_batches() -> None:
+    """
+    Test that batches with different column types are concatenated.
+    """
+    import pyarrow as pa
+
+    from superset.sqllab.utils import concat_batches
+
+    table = concat_batches(
+        [
+            pa.table({"a": pa.array([None], pa.null()), "b": [1]}),
+            pa.table({"a": [1], "b": [2]}),
+            pa.table({"a": [2.5], "b": ["c"]}),
+        ]
+    )
+    assert table.column("a").to_pylist() == [None, 1.0, 2.5]
+    assert table.column("b").to_pylist() == ["1", "2", "c"]
+
+
+def test_execute_sql_statement_stream_results(
+    mocker: MockerFixture,
+    app: None,
+) -> None:
+    """
+    Test that the results are written in chunks when streaming them.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_lab import execute_sql_statement
+    from superset.sqllab.limiting_factor import LimitingFactor
+
+    query = mocker.MagicMock()
+    query.limit = 5
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.mutate_sql_based_on_config.side_effect = lambda sql: sql
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_data_chunks.return_value = iter(
+        [[(0,), (1,), (2,), (3,)], [(4,), (5,)]]
+    )
+    db_engine_spec.get_datatype = BaseEngineSpec.get_datatype
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INT", None, None, None, None, None)]
+    results_writer = mocker.MagicMock()
+    results_writer.batch_rows = 4
+
+    result_set = execute_sql_statement(
+        "SELECT a FROM t",
+        query,
+        cursor=cursor,
+        log_params={},
+        apply_ctas=False,
+        results_writer=results_writer,
+    )
+
+    assert result_set is None
+    db_engine_spec.fetch_data.assert_not_called()
+    db_engine_spec.fetch_data_chunks.assert_called_with(cursor, 4, 6)
+    assert [
+        call.args[0].pa_table.column("a").to_pylist()
+        for call in results_writer.write.call_args_list
+    ] == [[0, 1, 2, 3], [4]]
+    results_writer.close.assert_called_once()
+    assert query.limiting_factor != LimitingFactor.NOT_LIMITED
@@ -0,0 +1,98 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import zlib
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.sqllab.results_codec import (
+    ArrowResultsCodec,
+    compress,
+    decompress,
+    MAGIC,
+    ZlibResultsCodec,
+)
+
+PAYLOAD = '{"data": [' + ", ".join(f'{{"a": {i}}}' for i in range(1000)) + "]}"
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        ZlibResultsCodec(),
+        ArrowResultsCodec("zstd", level=1),
+        ArrowResultsCodec("lz4"),
+    ],
+)
+def test_roundtrip(codec) -> None:
+    """
+    Test that blobs are decompressed whatever the configured codec.
+    """
+    blob = compress(PAYLOAD, codec)
+    assert len(blob) < len(PAYLOAD)
+    assert decompress(blob, codec=codec) == PAYLOAD
+    assert decompress(blob, codec=ArrowResultsCodec("zstd")) == PAYLOAD
+    assert decompress(blob, decode=False, codec=ZlibResultsCodec()) == (
+        PAYLOAD.encode()
+    )
+
+
+def test_header() -> None:
+    """
+    Test that zlib blobs have no header, so that they're compatible with older
+    versions, and that other codecs are named in the header.
+    """
+    assert compress(PAYLOAD, ZlibResultsCodec()) == zlib.compress(PAYLOAD.encode())
+    assert decompress(zlib.compress(b"legacy"), codec=ArrowResultsCodec()) == "legacy"
+
+    blob = compress(PAYLOAD, ArrowResultsCodec("lz4"))
+    assert blob.startswith(MAGIC + b"\x03lz4")
+
+
+def test_unknown_codec() -> None:
+    """
+    Test that blobs of unknown codecs can't be decompressed.
+    """
+    blob = compress(PAYLOAD, ArrowResultsCodec("zstd")).replace(b"zstd", b"nope")
+    with pytest.raises(ValueError, match="Unknown results codec: nope"):
+        decompress(blob, codec=ZlibResultsCodec())
+
+
+def test_config(mocker: MockerFixture) -> None:
+    """
+    Test that blobs are compressed with the configured codec, and that stats are
+    published.
+    """
+    from superset.extensions import stats_logger_manager
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"RESULTS_BACKEND_CODEC": ArrowResultsCodec("zstd")},
+    )
+    stats_logger = mocker.patch.object(stats_logger_manager, "_stats_logger")
+
+    blob = compress(PAYLOAD)
+    assert blob.startswith(MAGIC + b"\x04zstd")
+    assert decompress(blob) == PAYLOAD
+
+    assert [call.args[0] for call in stats_logger.timing.call_args_list] == [
+        "results_backend.zstd.compress_time",
+        "results_backend.zstd.decompress_time",
+    ]
+    key, ratio = stats_logger.gauge.call_args.args
+    assert key == "results_backend.zstd.compression_ratio"
+    assert ratio == len(PAYLOAD) / (len(blob) - len(MAGIC) - 1 - 4 - 8)
@@ -53,3 +53,31 @@ def test_load_chart_data_into_cache_with_error(
     mock_async_query_manager.update_job.assert_called_once_with(
         job_metadata, "error", errors=expected_errors
     )
+
+
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+def test_load_chart_data_into_cache_refresh(
+    mock_query_context_schema_cls, mock_async_query_manager, mock_security_manager
+):
+    """Test that background refreshes of stale results don't update a job"""
+    from superset.tasks.async_queries import load_chart_data_into_cache
+
+    job_metadata = {"user_id": 1, "refresh": True}
+    form_data = {"force": True}
+
+    mock_security_manager.get_user_by_id.return_value = mock.MagicMock()
+    with mock.patch(
+        "superset.commands.chart.data.get_data_command.ChartDataCommand"
+    ) as mock_command_cls:
+        load_chart_data_into_cache(job_metadata, form_data)
+        mock_command_cls.return_value.run.assert_called_once_with(cache=True)
+
+    mock_async_query_manager.update_job.assert_not_called()
+
+    mock_query_context_schema_cls.return_value.load.side_effect = ValueError()
+    with pytest.raises(ValueError):
+        load_chart_data_into_cache(job_metadata, form_data)
+
+    mock_async_query_manager.update_job.assert_not_called()
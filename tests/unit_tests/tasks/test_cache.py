@@ -0,0 +1,335 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+
+@pytest.fixture
+def executor(mocker: MockerFixture) -> Any:
+    """
+    An executor warming up mocked charts, with the cache keys of `CACHE_KEYS`.
+    """
+    from superset.tasks import cache
+
+    mocker.patch.object(cache.security_manager, "find_user")
+    mocker.patch.object(
+        cache.Slice, "get", side_effect=lambda chart_id: MagicMock(id=chart_id)
+    )
+    mocker.patch.object(
+        cache.InProcessWarmUpExecutor,
+        "get_cache_keys",
+        side_effect=lambda chart: CACHE_KEYS[chart.id],
+    )
+    command = mocker.patch.object(cache, "ChartWarmUpCacheCommand")
+    command.return_value.run.side_effect = [
+        {"chart_id": 1, "viz_error": None, "viz_status": "success"},
+        {"chart_id": 3, "viz_error": "Boom", "viz_status": None},
+        {"chart_id": 4, "viz_error": None, "viz_status": "success"},
+    ]
+    cache_manager = mocker.patch.object(cache, "cache_manager")
+    cache_manager.data_cache.has.side_effect = lambda key: key in {"a", "c"}
+
+    return cache.InProcessWarmUpExecutor(max_workers=1)
+
+
+CACHE_KEYS = {1: ["a", "b"], 2: ["a"], 3: ["c"], 4: [], 5: ["d"]}
+
+
+def test_get_charts(session: Session) -> None:
+    """
+    Test that charts are returned with their database and datasource.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+    from superset.models.slice import Slice
+    from superset.tasks.cache import InProcessWarmUpExecutor
+
+    Slice.metadata.create_all(session.get_bind())
+    table = SqlaTable(
+        table_name="my_table",
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    session.add(table)
+    session.flush()
+    session.add(
+        Slice(
+            id=1,
+            slice_name="my_chart",
+            datasource_type="table",
+            datasource_id=table.id,
+        )
+    )
+    session.flush()
+
+    assert InProcessWarmUpExecutor.get_charts(
+        [
+            {"chart_id": 1},
+            {"chart_id": 1},
+            {"chart_id": 1, "dashboard_id": 2},
+            {"chart_id": 3},
+        ]
+    ) == [
+        ({"chart_id": 1}, "my_db", f"{table.id}__table"),
+        ({"chart_id": 1, "dashboard_id": 2}, "my_db", f"{table.id}__table"),
+    ]
+
+
+def test_get_lanes() -> None:
+    """
+    Test that datasources are spread over the lanes of their database.
+    """
+    from superset.tasks.cache import InProcessWarmUpExecutor
+
+    executor = InProcessWarmUpExecutor(
+        database_concurrency=2,
+        database_concurrency_by_name={"db_b": 1},
+    )
+    charts = [
+        ({"chart_id": 1}, "db_a", "1__table"),
+        ({"chart_id": 2}, "db_a", "2__table"),
+        ({"chart_id": 3}, "db_a", "1__table"),
+        ({"chart_id": 4}, "db_a", "3__table"),
+        ({"chart_id": 5}, "db_b", "4__table"),
+        ({"chart_id": 6}, "db_b", "5__table"),
+    ]
+
+    assert executor.get_lanes(charts) == [
+        ("db_a", [{"chart_id": 1}, {"chart_id": 3}]),
+        ("db_a", [{"chart_id": 2}, {"chart_id": 4}]),
+        ("db_b", [{"chart_id": 5}, {"chart_id": 6}]),
+    ]
+
+
+def test_run(mocker: MockerFixture, executor: Any) -> None:
+    """
+    Test that queries sharing a cache key are warmed up once.
+    """
+    mocker.patch.object(
+        executor,
+        "get_charts",
+        return_value=[
+            ({"chart_id": chart_id}, "my_db", "1__table") for chart_id in (1, 2, 3, 4)
+        ],
+    )
+
+    report = executor.run(
+        [{"chart_id": chart_id} for chart_id in (1, 2, 3, 4, 6)],
+        MagicMock(username="admin"),
+    )
+
+    assert report.charts == 4
+    assert report.warmed == 2
+    assert report.skipped == 1
+    assert report.failed == 2
+    assert report.errors == [{"chart_id": 3, "error": "Boom"}]
+    assert (report.hits, report.misses, report.duplicates) == (2, 1, 1)
+    assert list(report.database_durations) == ["my_db"]
+    assert {timing["chart_id"] for timing in report.slowest} == {1, 3, 4}
+
+
+def test_run_not_forced(mocker: MockerFixture, executor: Any) -> None:
+    """
+    Test that charts whose queries are all cached are skipped, unless forced.
+    """
+    mocker.patch.object(
+        executor,
+        "get_charts",
+        return_value=[
+            ({"chart_id": chart_id}, "my_db", "1__table") for chart_id in (3, 5)
+        ],
+    )
+    executor.force = False
+
+    report = executor.run(
+        [{"chart_id": 3}, {"chart_id": 5}],
+        MagicMock(username="admin"),
+    )
+
+    assert (report.warmed, report.skipped, report.failed) == (1, 1, 0)
+    assert (report.hits, report.misses) == (1, 1)
+
+
+def test_cache_warmup_in_process(mocker: MockerFixture) -> None:
+    """
+    Test that the warm up runs in process when configured.
+    """
+    from superset.tasks import cache
+
+    mocker.patch.dict(
+        cache.app.config,
+        {
+            "CACHE_WARMUP_EXECUTOR_CONFIG": {
+                **cache.app.config["CACHE_WARMUP_EXECUTOR_CONFIG"],
+                "IN_PROCESS": True,
+            }
+        },
+    )
+    mocker.patch.object(cache.security_manager, "get_user_by_username")
+    mocker.patch.object(
+        cache.DummyStrategy, "get_payloads", return_value=[{"chart_id": 1}]
+    )
+    run = mocker.patch.object(
+        cache.InProcessWarmUpExecutor,
+        "run",
+        return_value=cache.WarmUpReport(charts=1, warmed=1),
+    )
+    fetch_url = mocker.patch.object(cache, "fetch_url")
+
+    result = cache.cache_warmup.run("dummy")
+
+    assert result["warmed"] == 1
+    run.assert_called_once()
+    fetch_url.delay.assert_not_called()
+
+
+@pytest.fixture
+def priority_strategy(mocker: MockerFixture, session: Session) -> Any:
+    """
+    Charts requested in the logs, with the cache keys of `REMAINING_TIMEOUTS`.
+    """
+    from cachelib import SimpleCache
+
+    from superset.models.core import Log
+    from superset.models.slice import Slice
+    from superset.tasks import cache
+
+    Slice.metadata.create_all(session.get_bind())
+    dttm = datetime.utcnow() - timedelta(days=1)
+    for chart_id, requests, duration_ms in [(1, 6, 10_000), (2, 60, 2000)]:
+        session.add(Slice(id=chart_id, slice_name=f"chart_{chart_id}", **DATASOURCE))
+        session.add_all(
+            Log(
+                action="ChartDataRestApi.data",
+                slice_id=chart_id,
+                dttm=dttm,
+                duration_ms=duration_ms,
+            )
+            for _ in range(requests)
+        )
+    for chart_id in (3, 4):
+        session.add(Slice(id=chart_id, slice_name=f"chart_{chart_id}", **DATASOURCE))
+        session.add(Log(action="ChartDataRestApi.data", slice_id=chart_id, dttm=dttm))
+    session.flush()
+
+    cache_manager = mocker.patch.object(cache, "cache_manager")
+    cache_manager.cache = SimpleCache()
+    mocker.patch.object(
+        cache.InProcessWarmUpExecutor,
+        "get_cache_keys",
+        side_effect=lambda chart: [f"key_{chart.id}"],
+    )
+    mocker.patch.object(
+        cache.PriorityStrategy,
+        "get_remaining_timeout",
+        side_effect=lambda cache_key: REMAINING_TIMEOUTS[cache_key],
+    )
+    return cache.PriorityStrategy
+
+
+DATASOURCE = {"datasource_type": "table", "datasource_id": 1}
+
+# the results of chart 3 are cached past the next run, and the ones of chart 4 never
+# expire
+REMAINING_TIMEOUTS = {"key_1": 0, "key_2": 600, "key_3": 7200, "key_4": None}
+
+
+def test_priority_strategy(priority_strategy: Any) -> None:
+    """
+    Test that charts are warmed up by decreasing score, within the budget.
+    """
+    strategy = priority_strategy(budget=11, interval=3600)
+
+    scores = strategy.get_scores()
+    assert [score["chart_id"] for score in scores] == [2, 1, 3]
+    # chart 3 has no duration in the logs
+    assert [score["duration"] for score in scores] == [2, 10, 1]
+    assert scores[0]["score"] > scores[1]["score"] > scores[2]["score"] == 0
+
+    # chart 1 doesn't fit in the budget left by chart 2
+    assert strategy.get_payloads() == [{"chart_id": 2}]
+    assert strategy.get_report() is None
+
+
+def test_priority_strategy_duration(priority_strategy: Any) -> None:
+    """
+    Test that the duration of the last warm up of a chart is used when known.
+    """
+    from superset.tasks.cache import cache_manager, get_duration_cache_key
+
+    cache_manager.cache.set(get_duration_cache_key(1), 5.0)
+    strategy = priority_strategy(budget=11, interval=3600)
+
+    assert strategy.get_payloads() == [{"chart_id": 2}, {"chart_id": 1}]
+
+
+def test_priority_strategy_report(priority_strategy: Any, session: Session) -> None:
+    """
+    Test that the requests expected by the last run are compared with the logs.
+    """
+    from superset.models.core import Log
+
+    priority_strategy(budget=11, interval=3600).get_payloads()
+    session.add_all(
+        Log(action="ChartDataRestApi.data", slice_id=2, dttm=datetime.utcnow())
+        for _ in range(3)
+    )
+    session.flush()
+
+    strategy = priority_strategy(budget=11, interval=3600)
+    strategy.get_payloads()
+    report = strategy.get_report()
+
+    assert report["actual_requests"] == 3
+    window = (datetime.now() - strategy.since).total_seconds()
+    assert report["expected_requests"] == pytest.approx(60 * 3600 / window, rel=0.01)
+    assert [chart["chart_id"] for chart in report["charts"]] == [2]
+
+
+def test_get_remaining_timeout(mocker: MockerFixture) -> None:
+    """
+    Test the remaining timeout of query results, with and without Redis.
+    """
+    from cachelib import SimpleCache
+    from cachelib.redis import RedisCache
+
+    from superset.tasks import cache
+
+    cache_manager = mocker.patch.object(cache, "cache_manager")
+    cache_manager.data_cache = SimpleCache()
+    cache_manager.data_cache.cache = cache_manager.data_cache
+    dttm = (datetime.utcnow() - timedelta(seconds=100)).isoformat()
+    cache_manager.data_cache.set("key", {"cache_timeout": 600, "dttm": dttm})
+
+    get_remaining_timeout = cache.PriorityStrategy.get_remaining_timeout
+    assert 490 < get_remaining_timeout("key") <= 500
+    assert get_remaining_timeout("missing") == 0
+
+    redis = RedisCache.__new__(RedisCache)
+    redis.key_prefix = "superset_"
+    redis._read_client = MagicMock()
+    redis._read_client.ttl.side_effect = lambda key: {"superset_key": 42}.get(key, -1)
+    cache_manager.data_cache = MagicMock(cache=redis)
+
+    assert get_remaining_timeout("key") == 42
+    assert get_remaining_timeout("other") is None
@@ -0,0 +1,45 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+from importlib import import_module
+
+from pytest_mock import MockerFixture
+
+
+def test_rebuild_dashboard_bootstrap_registered() -> None:
+    """
+    Test that the task is registered by the modules imported by Celery workers.
+    """
+    from superset.extensions import celery_app
+
+    assert "superset.tasks.dashboard_bootstrap" in celery_app.conf.imports
+    for module in celery_app.conf.imports:
+        import_module(module)
+    assert "rebuild_dashboard_bootstrap" in celery_app.tasks
+
+
+def test_rebuild_dashboard_bootstrap(mocker: MockerFixture) -> None:
+    """
+    Test that the task rebuilds the bundles of the dashboard.
+    """
+    from superset.tasks.dashboard_bootstrap import rebuild_dashboard_bootstrap
+
+    rebuild = mocker.patch("superset.dashboards.bootstrap.rebuild", return_value=2)
+
+    rebuild_dashboard_bootstrap(dashboard_id=1)
+    rebuild.assert_called_once_with(1)
@@ -15,9 +15,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import codecs
+import random
+import sys
+from typing import Any
+
+import numpy as np
 import pandas as pd
 import pyarrow as pa
-import pytest  # noqa: F401
+import pytest
 
 from superset.utils import csv
 
@@ -96,3 +102,107 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def legacy_df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    """
+    Reference implementation, escaping the dataframe cell by cell.
+    """
+    df = df.rename(
+        columns=lambda v: csv.escape_value(v) if isinstance(v, str) else v,
+    )
+    for name, column in df.items():
+        if column.dtype == np.dtype(object):
+            for idx, value in enumerate(column.values):
+                if isinstance(value, str):
+                    df.at[idx, name] = csv.escape_value(value)
+
+    return df.to_csv(escapechar="\\", **kwargs)
+
+
+def random_string(rng: random.Random) -> str:
+    prefix = rng.choice(
+        ["", "", "-", "@", "+", "|", "=", "%", '""', '"""', " ", "\t", "\xa0", "\u3000"]
+    )
+    body = "".join(
+        rng.choice('ab1.|=,-"\n \x1c\u2003') for _ in range(rng.randint(0, 6))
+    )
+    return rng.choice(
+        [
+            prefix + body,
+            prefix + body,
+            f"-{rng.randint(0, 100)}.{rng.randint(0, 9)}",
+            f"-{rng.randint(0, 100)}\n",
+        ]
+    )
+
+
+def random_value(rng: random.Random) -> Any:
+    return rng.choice([random_string(rng), None, rng.randint(-10, 10), rng.random()])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_df_to_escaped_csv_matches_cell_by_cell_escaping(seed: int) -> None:
+    """
+    Test that the vectorized escaping is identical to escaping each cell.
+    """
+    rng = random.Random(seed)
+    num_rows = rng.randint(0, 200)
+    df = pd.DataFrame(
+        {
+            "=header": [random_value(rng) for _ in range(num_rows)],
+            "strings": [random_string(rng) for _ in range(num_rows)],
+            "ints": list(range(num_rows)),
+            "none": [None] * num_rows,
+        }
+    )
+
+    for kwargs in ({"index": False}, {"index": True}, {"header": False}):
+        assert csv.df_to_escaped_csv(df, **kwargs) == legacy_df_to_escaped_csv(
+            df,
+            **kwargs,
+        )
+
+
+def test_df_to_escaped_csv_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that writing the CSV in chunks produces the same output.
+    """
+    monkeypatch.setattr(csv, "CSV_EXPORT_CHUNK_SIZE", 5)
+    df = pd.DataFrame(
+        {
+            "value": ["=a", "b", "-1", "|c"] * 3,
+            "dttm": pd.to_datetime(["2024-01-01 00:00"] * 6 + ["2024-01-01 12:00"] * 6),
+        }
+    )
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, index=False, chunksize=2))
+    assert len(chunks) == 3
+    assert "".join(chunks) == legacy_df_to_escaped_csv(df, index=False, chunksize=2)
+    assert csv.df_to_escaped_csv(df, index=False) == legacy_df_to_escaped_csv(
+        df, index=False
+    )
+
+
+def test_encode_csv_chunks() -> None:
+    """
+    Test that a BOM is only written at the start of a streamed CSV.
+    """
+    from superset.views.base import CsvResponse
+
+    chunks = ["a,b\n", "1,é\n", "2,ü\n"]
+
+    encoded = list(csv.encode_csv_chunks(iter(chunks), "utf-8-sig"))
+    assert b"".join(encoded) == "".join(chunks).encode("utf-8-sig")
+    assert b"".join(encoded).count(codecs.BOM_UTF8) == 1
+    assert len(encoded) == 3
+
+    response = CsvResponse(csv.encode_csv_chunks(iter(chunks), "utf-8-sig"))
+    assert response.get_data() == "".join(chunks).encode("utf-8-sig")
+    assert list(csv.encode_csv_chunks(iter(chunks), "latin-1"))[1] == b"1,\xe9\n"
+
+
+def test_df_to_escaped_csv_does_not_mutate_input() -> None:
+    df = pd.DataFrame({"=a": ["=b", "c"]})
+    csv.df_to_escaped_csv(df, index=False)
+    assert df.to_dict(orient="list") == {"=a": ["=b", "c"]}
@@ -21,7 +21,7 @@ import pandas as pd
 from pandas.api.types import is_numeric_dtype
 
 from superset.utils.core import GenericDataType
-from superset.utils.excel import apply_column_types, df_to_excel
+from superset.utils.excel import apply_column_types, df_to_excel, df_to_excel_chunks
 
 
 def test_timezone_conversion() -> None:
@@ -92,3 +92,27 @@ def test_column_data_types_with_failing_conversion():
     assert not is_numeric_dtype(df["col1"])
     assert not is_numeric_dtype(df["col2"])
     assert not is_numeric_dtype(df["col3"])
+
+
+def test_df_to_excel_chunks() -> None:
+    """
+    Test that the streamed Excel file has the same contents as the pandas one.
+    """
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, None, float("inf")],
+            "str": ["a", None, "c"],
+            "dttm": [datetime(2023, 1, 1), None, datetime(2023, 1, 2, 12)],
+            "bool": [True, False, True],
+        }
+    )
+
+    contents = b"".join(df_to_excel_chunks(df))
+    expected = df_to_excel(df)
+    assert pd.read_excel(contents).equals(pd.read_excel(expected))
+
+    contents = b"".join(df_to_excel_chunks(df, index=False, sheet_name="data"))
+    assert pd.read_excel(contents, sheet_name="data").equals(
+        pd.read_excel(df_to_excel(df, index=False))
+    )
@@ -15,8 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from pytest_mock import MockerFixture
 
-from superset.utils.log import get_logger_from_status
+from superset.utils.log import BufferedDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +36,56 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_buffered_db_event_logger(mocker: MockerFixture) -> None:
+    """
+    Test that events are written in batches from a background thread.
+    """
+    write = mocker.patch.object(BufferedDBEventLogger, "_write")
+    event_logger = BufferedDBEventLogger(batch_size=2, flush_interval=60)
+
+    event_logger.log(
+        1, "action", None, 10, None, None, records=[{"a": 1}, {"a": 2}, {"a": 3}]
+    )
+    event_logger.shutdown()
+
+    batches = [call.args[0] for call in write.call_args_list]
+    assert [[row["json"] for row in batch] for batch in batches] == [
+        ['{"a": 1}', '{"a": 2}'],
+        ['{"a": 3}'],
+    ]
+    assert batches[0][0]["action"] == "action"
+    assert batches[0][0]["user_id"] == 1
+    assert batches[0][0]["duration_ms"] == 10
+
+
+def test_buffered_db_event_logger_full(mocker: MockerFixture) -> None:
+    """
+    Test that events are dropped when the queue is full.
+    """
+    mocker.patch.object(BufferedDBEventLogger, "_ensure_thread")
+    stats_logger = mocker.patch("superset.utils.log.stats_logger_manager").instance
+    event_logger = BufferedDBEventLogger(max_queue_size=2)
+
+    event_logger.log(
+        1, "action", None, 10, None, None, records=[{"a": 1}, {"a": 2}, {"a": 3}]
+    )
+
+    stats_logger.incr.assert_called_once_with("event_logger.dropped")
+    stats_logger.gauge.assert_called_once_with("event_logger.queue_depth", 2)
+
+
+def test_buffered_db_event_logger_context(mocker: MockerFixture) -> None:
+    """
+    Test that events are still logged after the logger is used as a context manager.
+    """
+    write = mocker.patch.object(BufferedDBEventLogger, "_write")
+    event_logger = BufferedDBEventLogger(flush_interval=60)
+
+    with event_logger(action="action"):
+        pass
+    event_logger.log(1, "action", None, 10, None, None, records=[{"a": 1}])
+    event_logger.shutdown()
+
+    assert [row["json"] for row in write.call_args.args[0]][-1] == '{"a": 1}'
@@ -0,0 +1,136 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+from functools import partial
+
+import pytest
+from flask import g, request
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from superset.utils.concurrency import attach_to_thread_session, run_concurrently
+
+
+def test_run_concurrently_preserves_order() -> None:
+    """
+    Test that results are returned in the order of the functions.
+    """
+
+    def func(i: int) -> int:
+        time.sleep(0.01 * (5 - i))
+        return i
+
+    assert run_concurrently([partial(func, i) for i in range(5)], 5) == list(range(5))
+
+
+def test_run_concurrently_serial() -> None:
+    """
+    Test that functions run in the current thread without concurrency.
+    """
+    thread = threading.current_thread()
+
+    assert run_concurrently(
+        [lambda: threading.current_thread() is thread] * 3,
+        1,
+    ) == [True, True, True]
+
+
+def test_run_concurrently_nested() -> None:
+    """
+    Test that nested calls run serially in the threads of the outer call.
+    """
+
+    def inner() -> threading.Thread:
+        return threading.current_thread()
+
+    def outer() -> bool:
+        thread = threading.current_thread()
+        return all(
+            inner_thread is thread for inner_thread in run_concurrently([inner] * 3, 3)
+        )
+
+    assert run_concurrently([outer, outer], 2) == [True, True]
+    # threads are reused by the pools of later calls
+    assert run_concurrently([outer, outer], 2) == [True, True]
+
+
+def test_run_concurrently_contexts() -> None:
+    """
+    Test that functions see the current user and request in other threads.
+    """
+    from superset import app
+
+    thread = threading.current_thread()
+
+    def func() -> tuple[bool, str, str]:
+        return threading.current_thread() is thread, g.user, request.path
+
+    with app.test_request_context("/api/v1/chart/data"):
+        g.user = "admin"
+        results = run_concurrently([func, func], 2)
+
+    assert results == [
+        (False, "admin", "/api/v1/chart/data"),
+        (False, "admin", "/api/v1/chart/data"),
+    ]
+
+
+def test_run_concurrently_exception() -> None:
+    """
+    Test that exceptions raised in other threads are propagated.
+    """
+
+    def func() -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        run_concurrently([func, lambda: None], 2)
+
+
+def test_attach_to_thread_session(mocker: MockerFixture) -> None:
+    """
+    Test that instances are copied to the session of other threads, without being
+    reloaded.
+    """
+    from superset.models.core import Database
+    from superset.utils import concurrency
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Database.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine))
+    mocker.patch.object(concurrency.db, "session", session)
+
+    database = Database(database_name="examples", sqlalchemy_uri="sqlite://")
+    session.add(database)
+    session.commit()
+    assert database.database_name == "examples"
+
+    def func() -> tuple[bool, bool, str]:
+        attached = attach_to_thread_session(database)
+        return attached is database, attached in session(), attached.database_name
+
+    assert run_concurrently([func, func], 2) == [(False, True, "examples")] * 2
+    assert attach_to_thread_session(database) is database
+    assert attach_to_thread_session(None) is None
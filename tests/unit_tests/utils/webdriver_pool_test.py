@@ -0,0 +1,189 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+import itertools
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.exceptions import WebDriverPoolTimeoutError
+from superset.utils.webdriver_pool import WebDriverPool
+
+
+class Browsers:
+    """Create numbered browsers, and record the ones destroyed"""
+
+    def __init__(self) -> None:
+        self.counter = itertools.count(1)
+        self.destroyed: list[int] = []
+        self.unhealthy: set[int] = set()
+
+    def create(self) -> int:
+        return next(self.counter)
+
+    def destroy(self, driver: int) -> None:
+        self.destroyed.append(driver)
+
+    def is_healthy(self, driver: int) -> bool:
+        return driver not in self.unhealthy
+
+    def lease(self, pool: WebDriverPool, key: str) -> Any:
+        return pool.lease(key, self.create, self.destroy, self.is_healthy)
+
+
+def test_lease_reuses_browsers() -> None:
+    """
+    Test that browsers are reused by key, and recycled after `max_pages` pages.
+    """
+    pool = WebDriverPool(max_size=2, max_pages=2)
+    browsers = Browsers()
+
+    with browsers.lease(pool, "admin") as pooled:
+        assert pooled.driver == 1
+    with browsers.lease(pool, "admin") as pooled:
+        assert pooled.driver == 1
+    assert browsers.destroyed == [1]
+
+    with browsers.lease(pool, "admin") as pooled:
+        assert pooled.driver == 2
+    with browsers.lease(pool, "gamma") as pooled:
+        assert pooled.driver == 3
+    assert pool.size == 2
+
+
+def test_lease_recycles_broken_browsers() -> None:
+    """
+    Test that browsers are recycled on errors, or when unhealthy.
+    """
+    pool = WebDriverPool()
+    browsers = Browsers()
+
+    with pytest.raises(ValueError):
+        with browsers.lease(pool, "admin"):
+            raise ValueError()
+    with browsers.lease(pool, "admin") as pooled:
+        pooled.discard()
+    assert browsers.destroyed == [1, 2]
+
+    with browsers.lease(pool, "admin"):
+        pass
+    browsers.unhealthy.add(3)
+    with browsers.lease(pool, "admin") as pooled:
+        assert pooled.driver == 4
+    assert browsers.destroyed == [1, 2, 3]
+    assert pool.size == 1
+
+
+def test_lease_evicts_idle_browsers() -> None:
+    """
+    Test that idle browsers of other keys make room when the pool is full, and that
+    leasing times out when all the browsers are in use.
+    """
+    pool = WebDriverPool(max_size=1, acquire_timeout=0)
+    browsers = Browsers()
+
+    with browsers.lease(pool, "admin"):
+        with pytest.raises(WebDriverPoolTimeoutError):
+            with browsers.lease(pool, "gamma"):
+                pass
+
+    with browsers.lease(pool, "gamma") as pooled:
+        assert pooled.driver == 2
+    assert browsers.destroyed == [1]
+
+    pool.close()
+    assert browsers.destroyed == [1, 2]
+    assert pool.size == 0
+
+
+def test_lease_stats(mocker: MockerFixture) -> None:
+    """
+    Test that the acquisition wait and the render time are logged.
+    """
+    from superset.extensions import stats_logger_manager
+
+    stats_logger = mocker.patch.object(stats_logger_manager, "_stats_logger")
+    pool = WebDriverPool()
+
+    with Browsers().lease(pool, "admin"):
+        pass
+
+    timings = [call.args[0] for call in stats_logger.timing.call_args_list]
+    assert timings == ["webdriver_pool.acquire_wait", "webdriver_pool.render_time"]
+    stats_logger.incr.assert_called_once_with("webdriver_pool.created")
+
+
+def test_get_pool(mocker: MockerFixture) -> None:
+    """
+    Test that the pool is shared by a process, and only when enabled.
+    """
+    from superset.utils import webdriver_pool
+
+    mocker.patch.object(webdriver_pool, "_pool", None)
+    mocker.patch.dict(
+        current_app.config,
+        {
+            "WEBDRIVER_POOL_CONFIG": {
+                **current_app.config["WEBDRIVER_POOL_CONFIG"],
+                "ENABLED": True,
+                "MAX_SIZE": 2,
+            }
+        },
+    )
+
+    pool = webdriver_pool.get_pool()
+    assert pool is not None
+    assert pool.max_size == 2
+    assert webdriver_pool.get_pool() is pool
+
+    # a forked process doesn't reuse the browsers of its parent
+    pool.pid = -1
+    assert webdriver_pool.get_pool() is not pool
+
+    current_app.config["WEBDRIVER_POOL_CONFIG"]["ENABLED"] = False
+    assert webdriver_pool.get_pool() is None
+
+
+def test_selenium_get_screenshot_pooled(mocker: MockerFixture) -> None:
+    """
+    Test that Selenium screenshots reuse the pooled browser of the user, and recycle
+    it when the screenshot fails.
+    """
+    from superset.utils import webdriver
+
+    mocker.patch.object(webdriver, "get_pool", return_value=WebDriverPool())
+    auth = mocker.patch.object(webdriver.WebDriverSelenium, "auth")
+    destroy = mocker.patch.object(webdriver.WebDriverSelenium, "destroy")
+    take_screenshot = mocker.patch.object(
+        webdriver.WebDriverSelenium,
+        "_take_screenshot",
+        side_effect=[b"one", b"two", None],
+    )
+    proxy = webdriver.WebDriverSelenium("firefox")
+    user = MagicMock(username="admin")
+
+    assert proxy.get_screenshot("http://example.com", "chart", user) == b"one"
+    assert proxy.get_screenshot("http://example.com", "chart", user) == b"two"
+    assert proxy.get_screenshot("http://example.com", "chart", user) is None
+
+    auth.assert_called_once_with(user)
+    assert take_screenshot.call_count == 3
+    destroy.assert_called_once()